@@ -1,4 +1,5 @@
 from django.core.checks import Tags, Warning, register
+from django.urls import URLResolver, get_resolver
 
 
 @register(Tags.compatibility)
@@ -19,3 +20,50 @@ def pagination_system_check(app_configs, **kwargs):
             )
         )
     return errors
+
+
+def _get_view_classes(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _get_view_classes(pattern.url_patterns)
+        else:
+            view_class = getattr(pattern.callback, 'cls', None)
+            if view_class is not None:
+                yield view_class
+
+
+@register(Tags.urls, deploy=True)
+def search_fields_index_system_check(app_configs, **kwargs):
+    errors = []
+    # Search fields that no database index can serve require a full table scan
+    seen = set()
+    for view_class in _get_view_classes(get_resolver().url_patterns):
+        if view_class in seen:
+            continue
+        seen.add(view_class)
+
+        search_fields = getattr(view_class, 'search_fields', None)
+        queryset = getattr(view_class, 'queryset', None)
+        if not search_fields or queryset is None:
+            continue
+
+        for backend in getattr(view_class, 'filter_backends', ()):
+            # Any `SearchFilter` subclass
+            if not hasattr(backend, 'get_unindexed_search_fields'):
+                continue
+            for search_field in backend().get_unindexed_search_fields(queryset.all(), search_fields):
+                errors.append(
+                    Warning(
+                        "The search field '%s' on %s.%s has no database index that "
+                        "can serve its lookup." % (
+                            search_field, view_class.__module__, view_class.__qualname__
+                        ),
+                        hint="Add a database index for the field. Contains, regex, trigram "
+                             "and full-text lookups require a GIN or GiST index, such as a "
+                             "trigram index. If the field is not expected to be indexed you "
+                             "may silence this check.",
+                        obj=view_class,
+                        id="rest_framework.W002"
+                    )
+                )
+    return errors
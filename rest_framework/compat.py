@@ -33,6 +33,27 @@ try:
 except ImportError:
     yaml = None
 
+# msgpack is optional
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# cbor2 is optional
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+# pyarrow is optional
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
 # inflection is optional
 try:
     import inflection
@@ -157,6 +157,36 @@ def flatten_choices_dict(choices):
     return ret
 
 
+class ChoiceTable:
+    """
+    The lookup tables for a set of choices.
+
+    A `ChoiceField` builds its table once, when it is declared, and shares it
+    with the copies of the field that are made for each serializer instance,
+    so the tables should be treated as read-only.
+    """
+    def __init__(self, choices):
+        self.source = choices
+        self.grouped_choices = to_choices_dict(choices)
+        self.choices = flatten_choices_dict(self.grouped_choices)
+
+        # Map the string representation of choices to the underlying value.
+        # Allows us to deal with eg. integer choices while supporting either
+        # integer or string input, but still get the correct datatype out.
+        self.choice_strings_to_values = {
+            str(key.value) if isinstance(key, Enum) and str(key) != str(key.value) else str(key): key for key in self.choices
+        }
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return repr(self.source)
+
+
 def iter_options(grouped_choices, cutoff=None, cutoff_text=None):
     """
     Helper function for options and option groups in templates.
@@ -581,6 +611,16 @@ class Field:
             )
         )
 
+    def to_representation_column(self, values):
+        """
+        Transform a list of *outgoing* native values into a list of primitive
+        data, as `to_representation()` would for each value.
+
+        Fields may override this to do work that is the same for every value,
+        such as resolving settings, once for the whole list.
+        """
+        return [self.to_representation(value) for value in values]
+
     def fail(self, key, **kwargs):
         """
         A helper method that simply raises a validation error.
@@ -915,6 +955,11 @@ class IntegerField(Field):
     def to_representation(self, value):
         return int(value)
 
+    def to_representation_column(self, values):
+        if type(self).to_representation is not IntegerField.to_representation:
+            return super().to_representation_column(values)
+        return list(map(int, values))
+
 
 class BigIntegerField(IntegerField):
 
@@ -976,6 +1021,11 @@ class FloatField(Field):
     def to_representation(self, value):
         return float(value)
 
+    def to_representation_column(self, values):
+        if type(self).to_representation is not FloatField.to_representation:
+            return super().to_representation_column(values)
+        return list(map(float, values))
+
 
 class DecimalField(Field):
     default_error_messages = {
@@ -1122,6 +1172,38 @@ class DecimalField(Field):
 
         return f'{quantized:f}'
 
+    def to_representation_column(self, values):
+        coerce_to_string = getattr(self, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+
+        if (
+            self.localize or
+            type(self).to_representation is not DecimalField.to_representation or
+            type(self).quantize is not DecimalField.quantize
+        ):
+            return super().to_representation_column(values)
+
+        # Build the quantization context and exponent once for the whole
+        # column, rather than once for each value.
+        if self.decimal_places is not None:
+            context = decimal.getcontext().copy()
+            if self.max_digits is not None:
+                context.prec = self.max_digits
+            exponent = decimal.Decimal('.1') ** self.decimal_places
+
+        ret = []
+        for value in values:
+            if value is None:
+                ret.append('' if coerce_to_string else None)
+                continue
+            if not isinstance(value, decimal.Decimal):
+                value = decimal.Decimal(str(value).strip())
+            if self.decimal_places is not None:
+                value = value.quantize(exponent, rounding=self.rounding, context=context)
+            if self.normalize_output:
+                value = value.normalize()
+            ret.append(f'{value:f}' if coerce_to_string else value)
+        return ret
+
     def quantize(self, value):
         """
         Quantize the decimal value to the configured precision.
@@ -1165,7 +1247,9 @@ class DateTimeField(Field):
         When `self.default_timezone` is not `None`, always return aware datetimes.
         """
         field_timezone = self.timezone if hasattr(self, 'timezone') else self.default_timezone()
+        return self._enforce_timezone(value, field_timezone)
 
+    def _enforce_timezone(self, value, field_timezone):
         if field_timezone is not None:
             if timezone.is_aware(value):
                 try:
@@ -1225,6 +1309,33 @@ class DateTimeField(Field):
             return value
         return value.strftime(output_format)
 
+    def to_representation_column(self, values):
+        output_format = getattr(self, 'format', api_settings.DATETIME_FORMAT)
+
+        if (
+            output_format is None or output_format.lower() != ISO_8601 or
+            type(self).to_representation is not DateTimeField.to_representation or
+            type(self).enforce_timezone is not DateTimeField.enforce_timezone
+        ):
+            return super().to_representation_column(values)
+
+        # Looking up the current timezone is the most expensive part of
+        # rendering a datetime, so only do it once for the whole column.
+        field_timezone = self.timezone if hasattr(self, 'timezone') else self.default_timezone()
+
+        ret = []
+        for value in values:
+            if not value:
+                ret.append(None)
+            elif isinstance(value, str):
+                ret.append(value)
+            else:
+                value = self._enforce_timezone(value, field_timezone).isoformat()
+                if value.endswith('+00:00'):
+                    value = value[:-6] + 'Z'
+                ret.append(value)
+        return ret
+
 
 class DateField(Field):
     default_error_messages = {
@@ -1292,6 +1403,22 @@ class DateField(Field):
 
         return value.strftime(output_format)
 
+    def to_representation_column(self, values):
+        output_format = getattr(self, 'format', api_settings.DATE_FORMAT)
+
+        if (
+            output_format is None or output_format.lower() != ISO_8601 or
+            type(self).to_representation is not DateField.to_representation
+        ):
+            return super().to_representation_column(values)
+
+        return [
+            value.isoformat()
+            if value and not isinstance(value, (str, datetime.datetime))
+            else self.to_representation(value)
+            for value in values
+        ]
+
 
 class TimeField(Field):
     default_error_messages = {
@@ -1354,6 +1481,22 @@ class TimeField(Field):
             return value.isoformat()
         return value.strftime(output_format)
 
+    def to_representation_column(self, values):
+        output_format = getattr(self, 'format', api_settings.TIME_FORMAT)
+
+        if (
+            output_format is None or output_format.lower() != ISO_8601 or
+            type(self).to_representation is not TimeField.to_representation
+        ):
+            return super().to_representation_column(values)
+
+        return [
+            value.isoformat()
+            if isinstance(value, datetime.time)
+            else self.to_representation(value)
+            for value in values
+        ]
+
 
 class DurationField(Field):
     default_error_messages = {
@@ -1434,6 +1577,12 @@ class ChoiceField(Field):
 
     def __init__(self, choices, **kwargs):
         self.choices = choices
+        # Copies of the field are made from its arguments, so pass them the
+        # choice table instead of the choices for it to be built again.
+        if self._kwargs.get('choices') is choices:
+            self._kwargs = {**self._kwargs, 'choices': self.choice_table}
+        elif self._args and self._args[0] is choices:
+            self._args = (self.choice_table, *self._args[1:])
         self.html_cutoff = kwargs.pop('html_cutoff', self.html_cutoff)
         self.html_cutoff_text = kwargs.pop('html_cutoff_text', self.html_cutoff_text)
 
@@ -1472,15 +1621,12 @@ class ChoiceField(Field):
         return self._choices
 
     def _set_choices(self, choices):
-        self.grouped_choices = to_choices_dict(choices)
-        self._choices = flatten_choices_dict(self.grouped_choices)
-
-        # Map the string representation of choices to the underlying value.
-        # Allows us to deal with eg. integer choices while supporting either
-        # integer or string input, but still get the correct datatype out.
-        self.choice_strings_to_values = {
-            str(key.value) if isinstance(key, Enum) and str(key) != str(key.value) else str(key): key for key in self.choices
-        }
+        if not isinstance(choices, ChoiceTable):
+            choices = ChoiceTable(choices)
+        self.choice_table = choices
+        self.grouped_choices = choices.grouped_choices
+        self._choices = choices.choices
+        self.choice_strings_to_values = choices.choice_strings_to_values
 
     choices = property(_get_choices, _set_choices)
 
@@ -6,8 +6,9 @@ import operator
 from functools import reduce
 
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
-from django.db import models
+from django.db import connections, models
 from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Lower, Upper
 from django.template import loader
 from django.utils.encoding import force_str
 from django.utils.text import smart_split, unescape_string_literal
@@ -34,6 +35,73 @@ def search_smart_split(search_terms):
     return split_terms
 
 
+def _get_referenced_field_names(expression):
+    """Returns the names of the fields referenced by an index expression."""
+    if isinstance(expression, models.F):
+        return {expression.name}
+    names = set()
+    for source in getattr(expression, 'get_source_expressions', list)():
+        names |= _get_referenced_field_names(source)
+    return names
+
+
+def _is_expression_of(expression, function, field_name):
+    """
+    Returns True if an index expression is `function` applied directly to
+    the named field, eg. `Upper('title')`, ignoring any ordering or operator
+    class.
+    """
+    from django.contrib.postgres.indexes import OpClass
+
+    while isinstance(expression, (models.OrderBy, OpClass)):
+        expression = expression.get_source_expressions()[0]
+    if type(expression) is not function:
+        return False
+    sources = expression.get_source_expressions()
+    return (
+        len(sources) == 1 and isinstance(sources[0], models.F) and
+        sources[0].name == field_name
+    )
+
+
+def _is_indexed(field, inverted=False, function=None):
+    """
+    Returns True if the model field is covered by a database index. When
+    `inverted` is set only GIN and GiST indexes, which can serve containment,
+    pattern and full-text lookups, are considered. When `function` is set,
+    eg. `Upper`, only an expression index over that function of the field is
+    considered.
+    """
+    opts = field.model._meta
+    if not inverted and function is None:
+        if field.primary_key or field.unique or field.db_index:
+            return True
+        leading_fields = [fields[0] for fields in opts.unique_together]
+        leading_fields += [
+            constraint.fields[0] for constraint in opts.constraints
+            if isinstance(constraint, models.UniqueConstraint) and constraint.fields
+        ]
+        if field.name in leading_fields:
+            return True
+
+    for index in opts.indexes:
+        if inverted and index.suffix not in ('gin', 'gist'):
+            continue
+        if index.fields and function is None:
+            # Only the leading column of a B-tree index is usable on its own.
+            index_fields = index.fields if inverted else index.fields[:1]
+            if field.name in [name.lstrip('-') for name in index_fields]:
+                return True
+        for expression in index.expressions:
+            if function is not None:
+                if _is_expression_of(expression, function, field.name):
+                    return True
+            elif inverted and field.name in _get_referenced_field_names(expression):
+                # eg. a GIN index over a `SearchVector` of the field.
+                return True
+    return False
+
+
 class BaseFilterBackend:
     """
     A base class from which all filter backend classes should inherit.
@@ -58,10 +126,27 @@ class SearchFilter(BaseFilterBackend):
         '=': 'iexact',
         '@': 'search',
         '$': 'iregex',
+        '%': 'trigram_similar',
+        '~': 'lower__startswith',
     }
     default_lookup = 'icontains'
+    # Lookups that a B-tree index cannot serve, and that instead require an
+    # inverted (GIN or GiST) index, such as a trigram or full-text index.
+    inverted_index_lookups = (
+        'contains', 'icontains', 'endswith', 'iendswith', 'regex', 'iregex',
+        'search', 'trigram_similar',
+    )
+    # Lookups that are compiled to a comparison against `UPPER(column)`, and
+    # so can only be served by an index over that expression.
+    upper_index_lookups = ('iexact', 'istartswith')
     search_title = _('Search')
     search_description = _('A search term.')
+    # Search plans depend only on the filter class, the view class, the search
+    # fields and the model, so are shared between requests. At most
+    # `search_plan_cache_size` plans are kept, since the search fields may be
+    # derived from the request.
+    search_plan_cache_size = 1000
+    _search_plans = {}
 
     def get_search_fields(self, view, request):
         """
@@ -109,6 +194,22 @@ class SearchFilter(BaseFilterBackend):
             lookup = self.default_lookup
         return LOOKUP_SEP.join([field_name, lookup])
 
+    def construct_condition(self, orm_lookup, term):
+        """
+        Return the condition matching a search term against an ORM lookup.
+
+        A `lower` transform, as used by the `~` prefix, is applied as a
+        `Lower()` expression, since it is not registered as a transform by
+        default, and the term is lower-cased in the same way. The resulting
+        `LOWER(column)` prefix match can be served by an expression index.
+        """
+        field_name, _, lookup = orm_lookup.rpartition(LOOKUP_SEP)
+        field_name, _, transform = field_name.rpartition(LOOKUP_SEP)
+        if transform != 'lower':
+            return models.Q(**{orm_lookup: term})
+        lhs = Lower(field_name, output_field=models.CharField())
+        return models.Q(lhs.get_lookup(lookup)(lhs, term.lower()))
+
     def must_call_distinct(self, queryset, search_fields):
         """
         Return True if 'distinct()' should be used to query the given lookups.
@@ -135,6 +236,87 @@ class SearchFilter(BaseFilterBackend):
                     break
         return False
 
+    def get_unindexed_search_fields(self, queryset, search_fields):
+        """
+        Return the search fields whose lookups cannot be served by any of the
+        database indexes declared on the searched model fields.
+
+        This is a heuristic based on the model declarations, and does not
+        inspect the database itself.
+        """
+        unindexed = []
+        for search_field in search_fields:
+            search_field = str(search_field)
+            field_name = search_field
+            if field_name[0] in self.lookup_prefixes:
+                field_name = field_name[1:]
+            # Annotated fields cannot be indexed
+            if field_name in queryset.query.annotations:
+                continue
+
+            # Follow relations down to the searched model field. The remaining
+            # parts of the lookup are transforms, followed by the lookup itself.
+            parts = self.construct_search(search_field, queryset).split(LOOKUP_SEP)
+            opts = queryset.model._meta
+            field = None
+            while parts:
+                part = opts.pk.name if parts[0] == 'pk' else parts[0]
+                try:
+                    field = opts.get_field(part)
+                except FieldDoesNotExist:
+                    break
+                parts.pop(0)
+                if not hasattr(field, 'path_infos'):
+                    break
+                opts = field.path_infos[-1].to_opts
+
+            if field is None or field.is_relation or not parts:
+                continue
+            *transforms, lookup = parts
+
+            if lookup in self.inverted_index_lookups:
+                indexed = not transforms and _is_indexed(field, inverted=True)
+            elif lookup in self.upper_index_lookups:
+                indexed = not transforms and _is_indexed(field, function=Upper)
+            elif transforms == ['lower']:
+                indexed = _is_indexed(field, function=Lower)
+            else:
+                # Any other transform, such as `unaccent`, is applied to the
+                # column, so an index over the plain column cannot be used.
+                indexed = not transforms and _is_indexed(field)
+            if not indexed:
+                unindexed.append(search_field)
+        return unindexed
+
+    def get_search_plan(self, queryset, view, search_fields):
+        """
+        Return a tuple of the ORM lookups for the given search fields, and
+        whether the search results must be deduplicated.
+
+        Walking the model fields is comparatively expensive, so the result is
+        cached for each view class, set of search fields and model.
+        """
+        search_fields = tuple(str(search_field) for search_field in search_fields)
+        key = (
+            type(self), type(view), search_fields,
+            queryset.model, tuple(queryset.query.annotations)
+        )
+        try:
+            return self._search_plans[key]
+        except KeyError:
+            pass
+
+        orm_lookups = [
+            self.construct_search(search_field, queryset)
+            for search_field in search_fields
+        ]
+        plan = (orm_lookups, self.must_call_distinct(queryset, search_fields))
+        while len(self._search_plans) >= self.search_plan_cache_size:
+            # Evict the oldest entry.
+            self._search_plans.pop(next(iter(self._search_plans)), None)
+        self._search_plans[key] = plan
+        return plan
+
     def filter_queryset(self, request, queryset, view):
         search_fields = self.get_search_fields(view, request)
         search_terms = self.get_search_terms(request)
@@ -142,23 +324,20 @@ class SearchFilter(BaseFilterBackend):
         if not search_fields or not search_terms:
             return queryset
 
-        orm_lookups = [
-            self.construct_search(str(search_field), queryset)
-            for search_field in search_fields
-        ]
+        orm_lookups, distinct = self.get_search_plan(queryset, view, search_fields)
 
         base = queryset
         # generator which for each term builds the corresponding search
         conditions = (
             reduce(
                 operator.or_,
-                (models.Q(**{orm_lookup: term}) for orm_lookup in orm_lookups)
+                (self.construct_condition(orm_lookup, term) for orm_lookup in orm_lookups)
             ) for term in search_terms
         )
         queryset = queryset.filter(reduce(operator.and_, conditions))
 
         # Remove duplicates from results, if necessary
-        if self.must_call_distinct(queryset, search_fields):
+        if distinct:
             # inspired by django.contrib.admin
             # this is more accurate than .distinct form M2M relationship
             # also is cross-database
@@ -206,10 +385,100 @@ class UnaccentedSearchFilter(SearchFilter):
         # search.
         '@': 'search',
         '$': 'unaccent__iregex',
+        '%': 'unaccent__trigram_similar',
+        '~': 'unaccent__lower__startswith',
     }
     default_lookup = 'unaccent__icontains'
 
 
+class FullTextSearchFilter(SearchFilter):
+    """
+    A SearchFilter that matches the search terms against a single full-text
+    search vector built from all of the ``search_fields``, rather than
+    OR-ing an ``icontains`` lookup per field.
+
+    On PostgreSQL the query can be served by a GIN index over the same
+    ``SearchVector`` expression, and each result is annotated with its
+    ``SearchRank`` so that it may be ordered by ``OrderingFilter``. Requires
+    ``django.contrib.postgres`` in ``INSTALLED_APPS``. On other database
+    backends the filter falls back to the regular ``SearchFilter`` lookups.
+    """
+    # The text search configuration, eg. 'english'. `None` uses the
+    # database default.
+    search_config = None
+    # One of 'plain', 'phrase', 'raw' or 'websearch'.
+    search_type = 'plain'
+    # The name of the annotation holding each result's rank, or `None` to
+    # disable ranking.
+    rank_annotation = 'search_rank'
+
+    def supports_full_text_search(self, queryset):
+        return connections[queryset.db].vendor == 'postgresql'
+
+    def get_search_vector(self, search_fields):
+        from django.contrib.postgres.search import SearchVector
+
+        field_names = [
+            field_name[1:] if field_name[0] in self.lookup_prefixes else field_name
+            for field_name in search_fields
+        ]
+        return SearchVector(*field_names, config=self.search_config)
+
+    def get_search_query(self, search_terms):
+        from django.contrib.postgres.search import SearchQuery
+
+        # Each term must match, in keeping with `SearchFilter`.
+        return reduce(operator.and_, (
+            SearchQuery(term, config=self.search_config, search_type=self.search_type)
+            for term in search_terms
+        ))
+
+    def annotate_rank(self, queryset, rank=None):
+        """
+        Annotate the queryset with each result's rank. The annotation is
+        always present, so that ordering by it never fails, and is null when
+        the results are not ranked.
+        """
+        if not self.rank_annotation:
+            return queryset
+        if rank is None:
+            rank = models.Value(None, output_field=models.FloatField())
+        return queryset.annotate(**{self.rank_annotation: rank})
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+
+        if not search_fields or not search_terms:
+            return self.annotate_rank(queryset)
+
+        if not self.supports_full_text_search(queryset):
+            return self.annotate_rank(super().filter_queryset(request, queryset, view))
+
+        from django.contrib.postgres.search import SearchRank
+
+        search_fields = [str(search_field) for search_field in search_fields]
+        vector = self.get_search_vector(search_fields)
+        query = self.get_search_query(search_terms)
+
+        base = queryset
+        queryset = queryset.annotate(_search_vector=vector).filter(_search_vector=query)
+        rank = SearchRank(vector, query)
+
+        # Remove duplicates from results, if necessary
+        if self.get_search_plan(base, view, search_fields)[1]:
+            matches = queryset.filter(pk=models.OuterRef('pk'))
+            queryset = base.filter(models.Exists(matches))
+            # Resolving the vector on the outer query would join the related
+            # rows back in, so rank each result by its best matching row.
+            matches = matches.annotate(
+                _search_rank=SearchRank(models.F('_search_vector'), query)
+            ).order_by('-_search_rank').values('_search_rank')[:1]
+            rank = models.Subquery(matches, output_field=models.FloatField())
+
+        return self.annotate_rank(queryset, rank)
+
+
 class OrderingFilter(BaseFilterBackend):
     # The URL query parameter used for the ordering.
     ordering_param = api_settings.ORDERING_PARAM
@@ -17,6 +17,7 @@ class Command(BaseCommand):
         parser.add_argument('--generator_class', dest="generator_class", default=None, type=str)
         parser.add_argument('--file', dest="file", default=None, type=str)
         parser.add_argument('--api_version', dest="api_version", default='', type=str)
+        parser.add_argument('--workers', dest="workers", default=None, type=int)
 
     def handle(self, *args, **options):
         if options['generator_class']:
@@ -30,6 +31,8 @@ class Command(BaseCommand):
             urlconf=options['urlconf'],
             version=options['api_version'],
         )
+        if options['workers']:
+            generator.workers = options['workers']
         schema = generator.get_schema(request=None, public=True)
         renderer = self.get_renderer(options['format'])
         output = renderer.render(schema, renderer_context={})
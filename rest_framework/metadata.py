@@ -6,12 +6,15 @@ some fairly ad-hoc information about the view.
 Future implementations might use JSON schema or other definitions in order
 to return this information in a more standardized way.
 """
+import copy
+
 from django.core.exceptions import PermissionDenied
-from django.http import Http404
+from django.http import Http404, HttpRequest
+from django.utils import translation
 from django.utils.encoding import force_str
 
 from rest_framework import exceptions, serializers
-from rest_framework.request import clone_request
+from rest_framework.request import Request, clone_request
 from rest_framework.utils.field_mapping import ClassLookupDict
 
 
@@ -89,13 +92,20 @@ class SimpleMetadata(BaseMetadata):
             else:
                 # If user has appropriate permissions for the view, include
                 # appropriate metadata about the fields that should be supplied.
-                serializer = view.get_serializer()
-                actions[method] = self.get_serializer_info(serializer)
+                actions[method] = self.get_action_info(view, method)
             finally:
                 view.request = request
 
         return actions
 
+    def get_action_info(self, view, method):
+        """
+        Return metadata about the fields that should be supplied for the
+        given method, once the user is known to have permission to use it.
+        """
+        serializer = view.get_serializer()
+        return self.get_serializer_info(serializer)
+
     def get_serializer_info(self, serializer):
         """
         Given an instance of a serializer, return a dictionary of metadata
@@ -150,3 +160,76 @@ class SimpleMetadata(BaseMetadata):
             ]
 
         return field_info
+
+
+class CachedMetadata(SimpleMetadata):
+    """
+    A `SimpleMetadata` implementation that caches the field information
+    for each action, rather than rebuilding it on every `OPTIONS` request.
+
+    Only views that set `cache_metadata = True` are cached, since the cache
+    key cannot account for serializers whose fields depend on the request,
+    such as on `request.user`. Permission checks still run on every request,
+    so that each user only sees the actions they may perform. The cache is
+    held in memory for the life of the process, and holds at most
+    `cache_size` entries.
+    """
+    cache_size = 1000
+    _cache = {}
+
+    def get_cache_key(self, view, method):
+        """
+        Return the key that the field information for the given method is
+        cached under, or `None` if it should not be cached. The serializer
+        class is included, so that views which pick a serializer class per
+        user are cached separately for each.
+
+        Views whose serializer fields depend on the request in any other way
+        must not opt in to caching, unless this method is extended to include
+        whatever distinguishes them.
+        """
+        if not getattr(view, 'cache_metadata', False):
+            return None
+        serializer_class = None
+        if hasattr(view, 'get_serializer_class'):
+            serializer_class = view.get_serializer_class()
+        return (type(view), method, translation.get_language(), serializer_class)
+
+    def get_action_info(self, view, method):
+        key = self.get_cache_key(view, method)
+        if key is None:
+            return super().get_action_info(view, method)
+        try:
+            info = self._cache[key]
+        except KeyError:
+            info = super().get_action_info(view, method)
+            while len(self._cache) >= self.cache_size:
+                # Evict the oldest entry.
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[key] = info
+        return copy.deepcopy(info)
+
+    def precompute(self, view_func):
+        """
+        Populate the cache for a view, as returned by `.as_view()`, before
+        any `OPTIONS` requests are made. The view must opt in to caching.
+        This may be called from an app's `AppConfig.ready()` method to avoid
+        the cost on the first requests.
+        """
+        view = view_func.cls(**view_func.initkwargs)
+        actions = getattr(view_func, 'actions', None)
+        if actions is not None:
+            # Bind the viewset actions, as `ViewSetMixin.as_view()` does.
+            view.action_map = actions
+            for method, action in actions.items():
+                setattr(view, method, getattr(view, action))
+        view.args = ()
+        view.kwargs = {}
+        view.format_kwarg = None
+
+        request = Request(HttpRequest())
+        for method in {'PUT', 'POST'} & set(view.allowed_methods):
+            view.request = clone_request(request, method)
+            if actions is not None:
+                view.action = actions.get(method.lower())
+            self.get_action_info(view, method)
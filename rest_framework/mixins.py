@@ -14,7 +14,10 @@ class CreateModelMixin:
     Create a model instance.
     """
     def create(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
+        if isinstance(request.data, list) and self.allow_bulk_create():
+            serializer = self.get_serializer(data=request.data, many=True)
+        else:
+            serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
         headers = self.get_success_headers(serializer.data)
@@ -23,6 +26,15 @@ class CreateModelMixin:
     def perform_create(self, serializer):
         serializer.save()
 
+    def allow_bulk_create(self):
+        """
+        Return `True` if a list of items may be created in a single request,
+        which is enabled by setting `bulk_create = True` on the serializer's
+        `Meta` class.
+        """
+        meta = getattr(self.get_serializer_class(), 'Meta', None)
+        return getattr(meta, 'bulk_create', False)
+
     def get_success_headers(self, data):
         try:
             return {'Location': str(data[api_settings.URL_FIELD_NAME])}
@@ -7,6 +7,12 @@ on the request, such as form content or json encoded data.
 
 import codecs
 import contextlib
+import datetime
+import decimal
+import hashlib
+import io
+import re
+import uuid
 
 from django.conf import settings
 from django.core.files.uploadhandler import StopFutureHandlers
@@ -18,6 +24,7 @@ from django.http.multipartparser import MultiPartParserError
 from django.utils.http import parse_header_parameters
 
 from rest_framework import renderers
+from rest_framework.compat import cbor2, msgpack
 from rest_framework.exceptions import ParseError
 from rest_framework.settings import api_settings
 from rest_framework.utils import json
@@ -44,6 +51,17 @@ class BaseParser:
         """
         raise NotImplementedError(".parse() must be overridden.")
 
+    def parse_bytes(self, data, media_type=None, parser_context=None):
+        """
+        Given the complete request body, as a bytes-like object, return the
+        parsed representation.
+
+        Parsers that can parse a buffer directly may override this, to avoid
+        reading the body through a stream. By default the body is wrapped in
+        a stream and passed to `.parse()`.
+        """
+        return self.parse(io.BytesIO(data), media_type, parser_context)
+
 
 class JSONParser(BaseParser):
     """
@@ -67,6 +85,263 @@ class JSONParser(BaseParser):
         except ValueError as exc:
             raise ParseError('JSON parse error - %s' % str(exc))
 
+    def parse_bytes(self, data, media_type=None, parser_context=None):
+        """
+        Parses the request body as JSON, decoding it in a single step rather
+        than through a stream reader.
+        """
+        if type(self).parse is not JSONParser.parse:
+            # Respect subclasses that customize stream parsing.
+            return super().parse_bytes(data, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            text = str(data, encoding)
+            parse_constant = json.strict_constant if self.strict else None
+            return json.loads(text, parse_constant=parse_constant)
+        except ValueError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
+
+
+class JSONArrayStream:
+    """
+    An iterator over the items of a JSON array, which decodes each item from
+    the stream as it is consumed, rather than parsing the whole array.
+
+    Raises a `ParseError` during iteration if the stream is not valid JSON.
+    """
+    whitespace = re.compile(r'[ \t\n\r]*')
+    delimiters = (' ', '\t', '\n', '\r', ',', ']')
+
+    def __init__(self, stream, encoding, strict=True, chunk_size=64 * 1024):
+        self.stream = stream
+        self.text_decoder = codecs.getincrementaldecoder(encoding)()
+        self.json_decoder = json.JSONDecoder(parse_constant=json.strict_constant if strict else None)
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.index = 0
+        self.eof = False
+        self.finished = False
+
+        if self.skip_whitespace() != '[':
+            self.error('Expected a JSON array')
+        self.pos += 1
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.finished:
+            raise StopIteration
+
+        char = self.skip_whitespace()
+        if char == ']':
+            self.finish()
+            raise StopIteration
+        if self.index:
+            if char != ',':
+                self.error("Expecting ',' delimiter")
+            self.pos += 1
+            self.skip_whitespace()
+
+        while True:
+            try:
+                item, end = self.json_decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as exc:
+                # The item may continue past the end of the buffer, but an
+                # error before then is reported without reading any further.
+                if not self.is_incomplete(exc) or not self.read():
+                    self.error(str(exc))
+                continue
+            except ValueError as exc:
+                self.error(str(exc))
+            # A number, such as "1.5e3", may also continue past the end of
+            # the buffer, so is only complete once followed by a delimiter.
+            if self.buffer[end:end + 1] in self.delimiters or not self.read():
+                break
+
+        self.pos = end
+        self.index += 1
+        return item
+
+    def is_incomplete(self, exc):
+        """
+        Return True if a decoding error may be due to the item continuing
+        past the end of the buffer, such as an unterminated string or a
+        truncated literal, rather than the item being invalid.
+        """
+        if exc.msg.startswith('Unterminated string'):
+            return True
+        # The longest token that may be cut short is "-Infinity".
+        return exc.pos >= len(self.buffer) - len('-Infinity')
+
+    def read(self):
+        """
+        Read more of the stream into the buffer, discarding the part that has
+        already been decoded. Returns `False` once the stream is exhausted.
+        """
+        if self.eof:
+            return False
+
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        # Read at least as much as is buffered, so that decoding large items
+        # takes a linear rather than quadratic number of attempts.
+        chunk = self.stream.read(max(self.chunk_size, len(self.buffer)))
+        try:
+            self.buffer += self.text_decoder.decode(chunk, final=not chunk)
+        except ValueError as exc:
+            self.error(str(exc))
+        self.eof = not chunk
+        return True
+
+    def skip_whitespace(self):
+        """
+        Move past any whitespace, and return the next character, or an empty
+        string at the end of the stream.
+        """
+        while True:
+            self.pos = self.whitespace.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self.read():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def finish(self):
+        self.pos += 1
+        self.finished = True
+        if self.skip_whitespace():
+            self.error('Extra data')
+
+    def error(self, message):
+        self.finished = True
+        raise ParseError('JSON parse error - %s' % message)
+
+
+class JSONStreamParser(BaseParser):
+    """
+    Parses a JSON array incrementally, returning an iterator over its items,
+    so that large payloads can be processed without loading them at once.
+    """
+    media_type = 'application/json'
+    renderer_class = renderers.JSONRenderer
+    strict = api_settings.STRICT_JSON
+    chunk_size = 64 * 1024
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Returns a `JSONArrayStream` that decodes the array items from the
+        incoming bytestream as they are iterated over.
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        return JSONArrayStream(stream, encoding, self.strict, self.chunk_size)
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses newline delimited JSON, returning an iterator over the items,
+    which reads each line from the stream as it is consumed.
+    """
+    media_type = 'application/x-ndjson'
+    renderer_class = renderers.NDJSONRenderer
+    strict = api_settings.STRICT_JSON
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Returns a generator of the items decoded from each line of the
+        incoming bytestream. Blank lines are ignored.
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        return self.parse_lines(stream, encoding)
+
+    def parse_lines(self, stream, encoding):
+        parse_constant = json.strict_constant if self.strict else None
+        for number, line in enumerate(stream, 1):
+            try:
+                line = line.decode(encoding).strip()
+                if line:
+                    yield json.loads(line, parse_constant=parse_constant)
+            except ValueError as exc:
+                raise ParseError('JSON parse error on line %d - %s' % (number, str(exc)))
+
+
+class MessagePackParser(BaseParser):
+    """
+    Parses MessagePack-serialized data.
+    """
+    media_type = 'application/msgpack'
+
+    def __init__(self):
+        assert msgpack, 'Using MessagePackParser, but `msgpack` is not installed.'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses the incoming bytestream as MessagePack and returns the resulting data.
+        """
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, TypeError, msgpack.UnpackException) as exc:
+            raise ParseError('MessagePack parse error - %s' % str(exc))
+
+
+class CBORParser(BaseParser):
+    """
+    Parses CBOR-serialized data.
+    """
+    media_type = 'application/cbor'
+    # The semantic tags that `cbor2` decodes, but which are rejected since
+    # they do not decode to JSON compatible values. These include the shared
+    # reference tags, which can build cyclic data.
+    rejected_tags = (5, 25, 28, 29, 30, 35, 36, 52, 54, 256, 258, 260, 261, 43000)
+    # The types of the values that may be decoded, including those of the
+    # datetime, decimal, bignum and UUID tags.
+    allowed_types = (
+        str, bytes, int, float, bool, type(None), list, dict,
+        datetime.datetime, datetime.date, decimal.Decimal, uuid.UUID
+    )
+
+    def __init__(self):
+        assert cbor2, 'Using CBORParser, but `cbor2` is not installed.'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses the incoming bytestream as CBOR and returns the resulting data.
+        """
+        try:
+            data = cbor2.loads(
+                stream.read(),
+                tag_hook=self.reject_tag,
+                semantic_decoders={tag: self.reject_tag for tag in self.rejected_tags}
+            )
+            self.check_types(data)
+        except (ValueError, TypeError, cbor2.CBORDecodeError) as exc:
+            raise ParseError('CBOR parse error - %s' % str(exc))
+        return data
+
+    def reject_tag(self, decoder, tag=None):
+        raise cbor2.CBORDecodeError('unsupported tag')
+
+    def check_types(self, data):
+        """
+        Raise a `TypeError` if the data includes a value that is not JSON
+        compatible, such as the `undefined` or other simple values.
+        """
+        stack = [data]
+        while stack:
+            value = stack.pop()
+            if not isinstance(value, self.allowed_types):
+                raise TypeError('unsupported value %r' % value)
+            if isinstance(value, dict):
+                for key in value:
+                    if not isinstance(key, (str, int)):
+                        raise TypeError('unsupported map key %r' % (key,))
+                stack.extend(value.values())
+            elif isinstance(value, list):
+                stack.extend(value)
+
 
 class FormParser(BaseParser):
     """
@@ -83,6 +358,18 @@ class FormParser(BaseParser):
         encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
         return QueryDict(stream.read(), encoding=encoding)
 
+    def parse_bytes(self, data, media_type=None, parser_context=None):
+        """
+        Parses the request body as a URL encoded form, without first wrapping
+        it in a stream.
+        """
+        if type(self).parse is not FormParser.parse:
+            return super().parse_bytes(data, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        return QueryDict(bytes(data), encoding=encoding)
+
 
 class MultiPartParser(BaseParser):
     """
@@ -113,14 +400,53 @@ class MultiPartParser(BaseParser):
             raise ParseError('Multipart form parse error - %s' % str(exc))
 
 
+class MeteredStream:
+    """
+    Wraps a stream, counting the bytes that are read from it, and updating
+    a `hashlib` checksum with them. Reading more than `max_size` bytes
+    raises `MeteredStream.SizeExceeded`.
+    """
+    class SizeExceeded(Exception):
+        pass
+
+    def __init__(self, stream, max_size=None, checksum=None):
+        self.stream = stream
+        self.max_size = max_size
+        self.checksum = checksum
+        self.received = 0
+
+    def read(self, *args, **kwargs):
+        return self.meter(self.stream.read(*args, **kwargs))
+
+    def readline(self, *args, **kwargs):
+        return self.meter(self.stream.readline(*args, **kwargs))
+
+    def meter(self, data):
+        self.received += len(data)
+        if self.max_size is not None and self.received > self.max_size:
+            raise self.SizeExceeded()
+        if self.checksum is not None:
+            self.checksum.update(data)
+        return data
+
+
 class FileUploadParser(BaseParser):
     """
     Parser for file upload data.
+
+    The body is read a chunk at a time and passed straight on to the upload
+    handlers, so a handler that writes each chunk to its destination never
+    holds the whole file in memory. Set `max_upload_size` to reject uploads
+    over that many bytes, and `checksum_algorithm` to a `hashlib` algorithm
+    name to set the digest of the body on the uploaded file's `.checksum`.
     """
     media_type = '*/*'
+    max_upload_size = None
+    checksum_algorithm = None
     errors = {
         'unhandled': 'FileUpload parse error - none of upload handlers can handle the stream',
         'no_filename': 'Missing filename. Request should include a Content-Disposition header with a filename parameter.',
+        'too_large': 'Upload exceeds the maximum size of {max_size} bytes.',
     }
 
     def parse(self, stream, media_type=None, parser_context=None):
@@ -151,6 +477,36 @@ class FileUploadParser(BaseParser):
         except (ValueError, TypeError):
             content_length = None
 
+        # Reject an upload that is declared to be too large before reading it.
+        max_size = self.max_upload_size
+        if max_size is not None and content_length is not None and content_length > max_size:
+            raise ParseError(self.errors['too_large'].format(max_size=max_size))
+
+        # The declared length may be missing or wrong, so the size limit and
+        # checksum are applied to the bytes as they are read, by either path.
+        checksum = hashlib.new(self.checksum_algorithm) if self.checksum_algorithm else None
+        stream = MeteredStream(stream, max_size, checksum)
+        try:
+            file_obj = self.receive_file(
+                stream, upload_handlers, meta, filename, content_type, content_length, encoding
+            )
+        except MeteredStream.SizeExceeded:
+            # Stop reading, and let the handlers discard what they have written.
+            for handler in upload_handlers:
+                handler.upload_interrupted()
+            raise ParseError(self.errors['too_large'].format(max_size=max_size))
+
+        if file_obj is None:
+            raise ParseError(self.errors['unhandled'])
+        if checksum is not None:
+            file_obj.checksum = checksum.hexdigest()
+        return DataAndFiles({}, {'file': file_obj})
+
+    def receive_file(self, stream, upload_handlers, meta, filename, content_type, content_length, encoding):
+        """
+        Pass the upload to the upload handlers, returning the uploaded file,
+        or `None` if none of the handlers can handle the stream.
+        """
         # See if the handler will want to take care of the parsing.
         for handler in upload_handlers:
             result = handler.handle_raw_input(stream,
@@ -159,7 +515,7 @@ class FileUploadParser(BaseParser):
                                               None,
                                               encoding)
             if result is not None:
-                return DataAndFiles({}, {'file': result[1]})
+                return result[1]
 
         # This is the standard case.
         possible_sizes = [x.chunk_size for x in upload_handlers if x.chunk_size]
@@ -186,9 +542,8 @@ class FileUploadParser(BaseParser):
         for index, handler in enumerate(upload_handlers):
             file_obj = handler.file_complete(counters[index])
             if file_obj is not None:
-                return DataAndFiles({}, {'file': file_obj})
-
-        raise ParseError(self.errors['unhandled'])
+                return file_obj
+        return None
 
     def get_filename(self, stream, media_type, parser_context):
         """
@@ -3,19 +3,26 @@ import sys
 from operator import attrgetter
 from urllib import parse
 
-from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
+from django.core.exceptions import (
+    FieldDoesNotExist, ImproperlyConfigured, ObjectDoesNotExist
+)
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db.models import Manager
 from django.db.models.query import QuerySet
 from django.urls import NoReverseMatch, Resolver404, get_script_prefix, resolve
 from django.utils.encoding import smart_str, uri_to_iri
 from django.utils.translation import gettext_lazy as _
 
+from rest_framework.exceptions import ValidationError
 from rest_framework.fields import (
     Field, SkipField, empty, get_attribute, is_simple_callable, iter_options
 )
 from rest_framework.reverse import reverse
 from rest_framework.settings import api_settings
 from rest_framework.utils import html
+from rest_framework.utils.urls import (
+    compile_url_template, get_url_template_shape
+)
 
 
 def method_overridden(method_name, klass, instance):
@@ -92,6 +99,7 @@ class RelatedField(Field):
     queryset = None
     html_cutoff = None
     html_cutoff_text = None
+    _prefetched_objects = None
 
     def __init__(self, **kwargs):
         self.queryset = kwargs.pop('queryset', self.queryset)
@@ -169,6 +177,99 @@ class RelatedField(Field):
     def use_pk_only_optimization(self):
         return False
 
+    def get_lookup_field(self):
+        """
+        Return the name of the model field that submitted values are looked
+        up by, or `None` if the objects for several submitted values cannot
+        be fetched together with a single query.
+        """
+        return None
+
+    def get_lookup_value(self, data):
+        """
+        Return the value of the lookup field for a submitted value.
+        """
+        raise NotImplementedError('`get_lookup_value()` must be implemented.')
+
+    def get_lookup_model_field(self, queryset):
+        lookup_field = self.get_lookup_field()
+        if lookup_field is None or not isinstance(queryset, QuerySet):
+            return None
+        if queryset.query.is_sliced:
+            return None
+
+        opts = queryset.model._meta
+        try:
+            model_field = opts.pk if lookup_field == 'pk' else opts.get_field(lookup_field)
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+        return model_field
+
+    def get_lookup_key(self, model_field, lookup_value):
+        if isinstance(lookup_value, bool):
+            raise TypeError
+        key = model_field.to_python(lookup_value)
+        hash(key)
+        return key
+
+    @contextlib.contextmanager
+    def prefetch_objects(self, data):
+        """
+        Fetch the objects for a list of submitted values with a single query,
+        so that `to_internal_value()` does not need to query the database for
+        each of those values within the block.
+
+        Values that can't be matched to a fetched object are left for
+        `to_internal_value()` to look up, and report errors for, as usual.
+        """
+        if self._prefetched_objects is not None:
+            yield
+            return
+
+        queryset = self.get_queryset()
+        model_field = self.get_lookup_model_field(queryset)
+        if model_field is None:
+            yield
+            return
+
+        keys = set()
+        for item in data:
+            try:
+                key = self.get_lookup_key(model_field, self.get_lookup_value(item))
+            except (ValidationError, DjangoValidationError, KeyError, TypeError, ValueError):
+                continue
+            if key is not None:
+                keys.add(key)
+
+        objects = {}
+        if keys:
+            lookup = '%s__in' % model_field.name
+            for obj in queryset.filter(**{lookup: keys}):
+                key = getattr(obj, model_field.attname)
+                # Ambiguous matches are left for `to_internal_value()`.
+                objects[key] = None if key in objects else obj
+
+        self._prefetched_objects = (model_field, objects)
+        try:
+            yield
+        finally:
+            self._prefetched_objects = None
+
+    def get_prefetched_object(self, lookup_value):
+        """
+        Return the object fetched by `prefetch_objects()` for the given lookup
+        value, or `None` if it must be looked up individually.
+        """
+        if self._prefetched_objects is None:
+            return None
+        model_field, objects = self._prefetched_objects
+        try:
+            return objects.get(self.get_lookup_key(model_field, lookup_value))
+        except (DjangoValidationError, TypeError, ValueError):
+            return None
+
     def get_attribute(self, instance):
         if self.use_pk_only_optimization() and self.source_attrs:
             # Optimized case, return a mock object only containing the pk attribute.
@@ -249,9 +350,21 @@ class PrimaryKeyRelatedField(RelatedField):
     def use_pk_only_optimization(self):
         return True
 
-    def to_internal_value(self, data):
+    def get_lookup_field(self):
+        if method_overridden('to_internal_value', PrimaryKeyRelatedField, self):
+            return None
+        return 'pk'
+
+    def get_lookup_value(self, data):
         if self.pk_field is not None:
             data = self.pk_field.to_internal_value(data)
+        return data
+
+    def to_internal_value(self, data):
+        data = self.get_lookup_value(data)
+        obj = self.get_prefetched_object(data)
+        if obj is not None:
+            return obj
         queryset = self.get_queryset()
         try:
             if isinstance(data, bool):
@@ -298,6 +411,16 @@ class HyperlinkedRelatedField(RelatedField):
     def use_pk_only_optimization(self):
         return self.lookup_field == 'pk'
 
+    def get_lookup_field(self):
+        if (method_overridden('to_internal_value', HyperlinkedRelatedField, self) or
+                method_overridden('get_object', HyperlinkedRelatedField, self)):
+            return None
+        return self.lookup_field
+
+    def get_lookup_value(self, data):
+        match = self.get_url_match(data)
+        return match.kwargs[self.lookup_url_kwarg]
+
     def get_object(self, view_name, view_args, view_kwargs):
         """
         Return the object corresponding to a matched URL.
@@ -306,6 +429,9 @@ class HyperlinkedRelatedField(RelatedField):
         object instance, or raise an `ObjectDoesNotExist` exception.
         """
         lookup_value = view_kwargs[self.lookup_url_kwarg]
+        obj = self.get_prefetched_object(lookup_value)
+        if obj is not None:
+            return obj
         lookup_kwargs = {self.lookup_field: lookup_value}
         queryset = self.get_queryset()
 
@@ -330,10 +456,51 @@ class HyperlinkedRelatedField(RelatedField):
             return None
 
         lookup_value = getattr(obj, self.lookup_field)
+        return self.reverse_lookup_value(view_name, lookup_value, request, format)
+
+    def reverse_lookup_value(self, view_name, lookup_value, request, format):
+        """
+        Return the URL for the given lookup value.
+
+        The first URL reversed for a view during a request is compiled into a
+        template, so that URLs for similar lookup values only need the value
+        substituting in, rather than a full URL reversal.
+        """
         kwargs = {self.lookup_url_kwarg: lookup_value}
-        return self.reverse(view_name, kwargs=kwargs, request=request, format=format)
+        shape = get_url_template_shape(lookup_value)
+        if shape is None or not hasattr(request, '__dict__'):
+            return self.reverse(view_name, kwargs=kwargs, request=request, format=format)
+
+        templates = getattr(request, '_hyperlink_url_templates', None)
+        if templates is None:
+            templates = request._hyperlink_url_templates = {}
+        key = (self.reverse, view_name, self.lookup_url_kwarg, format, shape)
+        template = templates.get(key)
+        if template:
+            prefix, suffix = template
+            return prefix + str(lookup_value) + suffix
+
+        url = self.reverse(view_name, kwargs=kwargs, request=request, format=format)
+        if template is None:
+            templates[key] = self.compile_url_template(url, view_name, lookup_value, request, format)
+        return url
+
+    def compile_url_template(self, url, view_name, lookup_value, request, format):
+        """
+        Return a `(prefix, suffix)` tuple for the URL that surrounds the
+        lookup value, or `False` if no template could be determined.
+        """
+        def reverse_alternate(value):
+            kwargs = {self.lookup_url_kwarg: value}
+            return self.reverse(view_name, kwargs=kwargs, request=request, format=format)
 
-    def to_internal_value(self, data):
+        return compile_url_template(url, lookup_value, reverse_alternate)
+
+    def get_url_match(self, data):
+        """
+        Return the resolved URL match for a submitted hyperlink, failing if
+        it does not match the view for this field.
+        """
         request = self.context.get('request')
         try:
             http_prefix = data.startswith(('http:', 'https:'))
@@ -364,6 +531,10 @@ class HyperlinkedRelatedField(RelatedField):
         if match.view_name != expected_viewname:
             self.fail('incorrect_match')
 
+        return match
+
+    def to_internal_value(self, data):
+        match = self.get_url_match(data)
         try:
             return self.get_object(match.view_name, match.args, match.kwargs)
         except (ObjectDoesNotExist, ObjectValueError, ObjectTypeError):
@@ -451,7 +622,20 @@ class SlugRelatedField(RelatedField):
         self.slug_field = slug_field
         super().__init__(**kwargs)
 
+    def get_lookup_field(self):
+        if method_overridden('to_internal_value', SlugRelatedField, self):
+            return None
+        if '__' in self.slug_field:
+            return None
+        return self.slug_field
+
+    def get_lookup_value(self, data):
+        return data
+
     def to_internal_value(self, data):
+        obj = self.get_prefetched_object(data)
+        if obj is not None:
+            return obj
         queryset = self.get_queryset()
         try:
             return queryset.get(**{self.slug_field: data})
@@ -524,10 +708,11 @@ class ManyRelatedField(Field):
         if not self.allow_empty and len(data) == 0:
             self.fail('empty')
 
-        return [
-            self.child_relation.to_internal_value(item)
-            for item in data
-        ]
+        with self.child_relation.prefetch_objects(data):
+            return [
+                self.child_relation.to_internal_value(item)
+                for item in data
+            ]
 
     def get_attribute(self, instance):
         # Can't have any relationships if not created
@@ -8,21 +8,34 @@ REST framework also provides an HTML renderer that renders the browsable API.
 """
 
 import contextlib
+import csv
 import datetime
+import decimal
+import io
+import itertools
+import re
 import sys
+from collections.abc import Mapping
 
 from django import forms
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.core.paginator import Page
+from django.core.signals import setting_changed
 from django.template import engines, loader
 from django.urls import NoReverseMatch
+from django.utils import timezone
+from django.utils.autoreload import file_changed
+from django.utils.cache import patch_vary_headers
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.html import format_html
 from django.utils.http import parse_header_parameters
 from django.utils.safestring import SafeString
 
 from rest_framework import ISO_8601, VERSION, exceptions, serializers, status
 from rest_framework.compat import (
-    INDENT_SEPARATORS, LONG_SEPARATORS, SHORT_SEPARATORS, pygments_css, yaml
+    INDENT_SEPARATORS, LONG_SEPARATORS, SHORT_SEPARATORS, cbor2, msgpack,
+    pyarrow, pygments_css, yaml
 )
 from rest_framework.exceptions import ParseError
 from rest_framework.request import is_form_media_type, override_method
@@ -31,6 +44,13 @@ from rest_framework.utils import encoders, json
 from rest_framework.utils.breadcrumbs import get_breadcrumbs
 from rest_framework.utils.field_mapping import ClassLookupDict
 
+# Characters that make spreadsheet applications treat a CSV cell as a formula.
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+NUMBER_RE = re.compile(r'[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\Z')
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
 
 def zero_as_none(value):
     return None if value == 0 else value
@@ -107,6 +127,362 @@ class JSONRenderer(BaseRenderer):
         return ret.encode()
 
 
+class PaginatedResultsMixin:
+    """
+    Used by renderers which write one record for each item of a list, to
+    render the results of a paginated response in the same way.
+    """
+    # The key holding the list of items in a paginated response.
+    results_field = 'results'
+
+    def is_paginated(self, data, renderer_context):
+        """
+        Return True if `data` is the envelope of a paginated response from
+        the view, rather than a single item.
+        """
+        view = renderer_context.get('view')
+        return (
+            getattr(view, 'paginator', None) is not None and
+            isinstance(data, Mapping) and
+            isinstance(data.get(self.results_field), (list, tuple))
+        )
+
+
+class NDJSONRenderer(PaginatedResultsMixin, BaseRenderer):
+    """
+    Renderer which serializes to newline delimited JSON, with one line for
+    each item of a list.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    encoder_class = encoders.JSONEncoder
+    ensure_ascii = not api_settings.UNICODE_JSON
+    strict = api_settings.STRICT_JSON
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into newline delimited JSON, returning a bytestring.
+
+        Lists are rendered as one line per item, as are the results of a
+        paginated response, and any other data as a single line.
+        """
+        if data is None:
+            return b''
+        if self.is_paginated(data, renderer_context or {}):
+            data = data[self.results_field]
+        if not isinstance(data, (list, tuple)):
+            data = [data]
+        return b''.join(self.render_lines(data))
+
+    def render_lines(self, items):
+        """
+        Return an iterator that renders each of the items as a line of JSON,
+        as a bytestring, which may be used as the content of a
+        `StreamingHttpResponse`.
+        """
+        for item in items:
+            line = json.dumps(
+                item, cls=self.encoder_class, ensure_ascii=self.ensure_ascii,
+                allow_nan=not self.strict, separators=SHORT_SEPARATORS
+            )
+            yield line.encode() + b'\n'
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renderer which serializes to MessagePack.
+
+    Types that MessagePack does not support are represented in the same way
+    as by the `JSONRenderer`.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    encoder_class = encoders.JSONEncoder
+    charset = None
+    render_style = 'binary'
+
+    def __init__(self):
+        assert msgpack, 'Using MessagePackRenderer, but `msgpack` is not installed.'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into MessagePack, returning a bytestring.
+        """
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=self.encoder_class().default, use_bin_type=True)
+
+
+class CBORRenderer(BaseRenderer):
+    """
+    Renderer which serializes to CBOR.
+
+    Types that CBOR supports with a standard tag, such as datetimes, decimals
+    and UUIDs, are encoded natively. Other types are represented in the same
+    way as by the `JSONRenderer`.
+    """
+    media_type = 'application/cbor'
+    format = 'cbor'
+    encoder_class = encoders.JSONEncoder
+    charset = None
+    render_style = 'binary'
+
+    def __init__(self):
+        assert cbor2, 'Using CBORRenderer, but `cbor2` is not installed.'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into CBOR, returning a bytestring.
+        """
+        if data is None:
+            return b''
+
+        default = self.encoder_class().default
+
+        def encode_default(encoder, value):
+            encoder.encode(default(value))
+
+        # Naive datetimes are in the current time zone, as elsewhere in Django.
+        return cbor2.dumps(data, default=encode_default, timezone=timezone.get_current_timezone())
+
+
+class ColumnarRenderer(PaginatedResultsMixin, BaseRenderer):
+    """
+    Base class for renderers which serialize a list of items as a table, with
+    a column for each field, written a batch of rows at a time.
+
+    The columns are the readable fields of the serializer that produced the
+    data, or the keys of the first item if the data did not come from a
+    serializer.
+    """
+    batch_size = 10000
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into a table, returning a bytestring.
+
+        Lists are rendered as one row per item, as are the results of a
+        paginated response, and any other data as a single row.
+        """
+        if data is None:
+            return b''
+        if self.is_paginated(data, renderer_context or {}):
+            data = data[self.results_field]
+        serializer = getattr(data, 'serializer', None)
+        if not isinstance(data, (list, tuple)):
+            data = [data]
+        return b''.join(self.render_batches(data, serializer))
+
+    def render_batches(self, rows, serializer=None):
+        """
+        Return an iterator that renders the rows a batch at a time, as
+        bytestrings, which may be used as the content of a
+        `StreamingHttpResponse`.
+        """
+        raise NotImplementedError('Renderer class requires .render_batches() to be implemented')
+
+    def get_columns(self, serializer, first_row):
+        """
+        Return a list of `(name, field)` tuples, one for each column. The
+        field is `None` for columns that do not come from a serializer.
+        """
+        if isinstance(serializer, serializers.ListSerializer):
+            serializer = serializer.child
+        if isinstance(serializer, serializers.Serializer):
+            return [(field.field_name, field) for field in serializer._readable_fields]
+        if isinstance(first_row, Mapping):
+            return [(name, None) for name in first_row]
+        return []
+
+    def get_table(self, rows, serializer=None):
+        """
+        Return a `(columns, batches)` tuple for the rows, where `batches` is
+        an iterator over lists of at most `batch_size` rows.
+        """
+        rows = iter(rows)
+        first_row = next(rows, None)
+        columns = self.get_columns(serializer, first_row)
+        if first_row is None:
+            return columns, iter(())
+        return columns, self.iter_batches(itertools.chain([first_row], rows))
+
+    def iter_batches(self, rows):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def get_value(self, row, name):
+        if isinstance(row, Mapping):
+            return row.get(name)
+        return None
+
+
+class CSVRenderer(ColumnarRenderer):
+    """
+    Renderer which serializes to CSV, with a header row of column names.
+
+    Empty values are written as blank cells, and nested values as JSON. Text
+    that a spreadsheet would interpret as a formula is prefixed with `'`.
+    """
+    media_type = 'text/csv'
+    format = 'csv'
+    encoder_class = encoders.JSONEncoder
+    charset = 'utf-8'
+    dialect = 'excel'
+    escape_formulas = True
+
+    def render_batches(self, rows, serializer=None):
+        columns, batches = self.get_table(rows, serializer)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, dialect=self.dialect)
+        writer.writerow([name for name, field in columns])
+        for batch in batches:
+            writer.writerows(
+                [self.format_value(self.get_value(row, name)) for name, field in columns]
+                for row in batch
+            )
+            yield buffer.getvalue().encode(self.charset)
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue().encode(self.charset)
+
+    def format_value(self, value):
+        if value is None:
+            return ''
+        if isinstance(value, (dict, list, tuple)):
+            value = json.dumps(value, cls=self.encoder_class, separators=SHORT_SEPARATORS)
+        if self.escape_formulas and isinstance(value, str):
+            return self.escape_formula(value)
+        return value
+
+    def escape_formula(self, value):
+        """
+        Prefix text that starts with a formula character with `'`, so that it
+        is not evaluated when opened in a spreadsheet. Numbers, such as
+        serialized negative decimals, are left unchanged.
+        """
+        if value[:1] in FORMULA_PREFIXES and not NUMBER_RE.match(value):
+            return "'" + value
+        return value
+
+
+class ArrowRenderer(ColumnarRenderer):
+    """
+    Renderer which serializes to the Apache Arrow IPC streaming format, with
+    one record batch for each batch of rows.
+
+    Column types are chosen from the serializer fields, so that integers,
+    floats, decimals, booleans, dates and ISO 8601 datetimes are stored
+    natively. Other columns are stored as strings, with nested values
+    encoded as JSON.
+    """
+    media_type = 'application/vnd.apache.arrow.stream'
+    format = 'arrow'
+    encoder_class = encoders.JSONEncoder
+    charset = None
+    render_style = 'binary'
+
+    def __init__(self):
+        assert pyarrow, 'Using ArrowRenderer, but `pyarrow` is not installed.'
+
+    def render_batches(self, rows, serializer=None):
+        columns, batches = self.get_table(rows, serializer)
+        # The schema is written first, so columns whose type depends on their
+        # values are typed from the first batch.
+        first_batch = next(batches, [])
+        schema = pyarrow.schema([
+            pyarrow.field(name, self.get_column_type(
+                field, [self.get_value(row, name) for row in first_batch]
+            ))
+            for name, field in columns
+        ])
+        sink = io.BytesIO()
+        with pyarrow.ipc.new_stream(sink, schema) as writer:
+            for batch in itertools.chain([first_batch] if first_batch else [], batches):
+                arrays = [
+                    pyarrow.array(self.get_arrow_values(
+                        arrow_type, [self.get_value(row, name) for row in batch]
+                    ), type=arrow_type)
+                    for name, arrow_type in zip(schema.names, schema.types)
+                ]
+                writer.write_batch(pyarrow.record_batch(arrays, schema=schema))
+                yield sink.getvalue()
+                sink.seek(0)
+                sink.truncate()
+        yield sink.getvalue()
+
+    def get_column_type(self, field, values=()):
+        """
+        Return the Arrow type of the column for `field`, given the values of
+        the column in the first batch.
+        """
+        if isinstance(field, serializers.BooleanField):
+            return pyarrow.bool_()
+        if isinstance(field, serializers.IntegerField):
+            return self.get_integer_type(field, values)
+        if isinstance(field, serializers.FloatField):
+            return pyarrow.float64()
+        if isinstance(field, serializers.DecimalField):
+            if field.max_digits is not None and field.decimal_places is not None:
+                if field.max_digits <= 38:
+                    return pyarrow.decimal128(field.max_digits, field.decimal_places)
+                return pyarrow.decimal256(field.max_digits, field.decimal_places)
+        if isinstance(field, serializers.DateTimeField):
+            if self.get_output_format(field, api_settings.DATETIME_FORMAT) in (None, ISO_8601):
+                return pyarrow.timestamp('us', tz='UTC' if settings.USE_TZ else None)
+        if isinstance(field, serializers.DateField):
+            if self.get_output_format(field, api_settings.DATE_FORMAT) in (None, ISO_8601):
+                return pyarrow.date32()
+        return pyarrow.string()
+
+    def get_integer_type(self, field, values):
+        """
+        Return `int64` if the field's bounds, or else the given values, fit in
+        64 bits. Larger integers are stored as decimals, or as strings if they
+        have more than 38 digits.
+        """
+        if field.min_value is not None and field.max_value is not None:
+            values = [field.min_value, field.max_value]
+        values = [value for value in values if isinstance(value, int)]
+        if all(INT64_MIN <= value <= INT64_MAX for value in values):
+            return pyarrow.int64()
+        if all(abs(value) < 10 ** 38 for value in values):
+            return pyarrow.decimal128(38, 0)
+        return pyarrow.string()
+
+    def get_output_format(self, field, default):
+        output_format = getattr(field, 'format', serializers.empty)
+        if output_format is serializers.empty:
+            return default
+        return output_format
+
+    def get_arrow_values(self, arrow_type, values):
+        """
+        Convert the serialized values of a column to values of `arrow_type`.
+        """
+        if pyarrow.types.is_string(arrow_type):
+            return [
+                value if value is None or isinstance(value, str)
+                else json.dumps(value, cls=self.encoder_class, separators=SHORT_SEPARATORS)
+                for value in values
+            ]
+        if pyarrow.types.is_timestamp(arrow_type):
+            parse = parse_datetime
+        elif pyarrow.types.is_date32(arrow_type):
+            parse = parse_date
+        elif pyarrow.types.is_decimal(arrow_type):
+            parse = decimal.Decimal
+        else:
+            return values
+        return [parse(value) if isinstance(value, str) else value for value in values]
+
+
 class TemplateHTMLRenderer(BaseRenderer):
     """
     An HTML renderer for use with templates.
@@ -326,14 +702,58 @@ class HTMLFormRenderer(BaseRenderer):
         },
     })
 
-    def render_field(self, field, parent_style):
-        if isinstance(field._field, serializers.HiddenField):
-            return ''
+    # Templates and field styles are resolved once, and shared by all
+    # renderer instances. See `clear_form_renderer_cache()`.
+    _templates = {}
+    _field_templates = {}
+
+    def get_template(self, template_name):
+        """
+        Return the loaded template for the given name.
+        """
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self._templates[template_name] = loader.get_template(template_name)
+        return template
+
+    def get_field_template(self, field, parent_style):
+        """
+        Return a `(style, template)` tuple for rendering the given field.
+
+        These only depend on the field class, the field's `style` argument
+        and the parent template pack, and so are cached for each combination.
+        """
+        template_pack = parent_style.get('template_pack', self.template_pack)
+        key = (type(self), field._proxy_class, template_pack, tuple(field.style.items()))
+        try:
+            style, template = self._field_templates[key]
+        except TypeError:
+            key = None  # Unhashable style values, so can't be cached.
+        except KeyError:
+            pass
+        else:
+            return style.copy(), template
 
         style = self.default_style[field].copy()
         style.update(field.style)
         if 'template_pack' not in style:
-            style['template_pack'] = parent_style.get('template_pack', self.template_pack)
+            style['template_pack'] = template_pack
+
+        if 'template' in style:
+            template_name = style['template']
+        else:
+            template_name = style['template_pack'].strip('/') + '/' + style['base_template']
+        template = self.get_template(template_name)
+
+        if key is not None:
+            self._field_templates[key] = (style, template)
+        return style.copy(), template
+
+    def render_field(self, field, parent_style):
+        if isinstance(field._field, serializers.HiddenField):
+            return ''
+
+        style, template = self.get_field_template(field, parent_style)
         style['renderer'] = self
 
         # Get a clone of the field with text-only value representation ('' if None or False).
@@ -364,12 +784,6 @@ class HTMLFormRenderer(BaseRenderer):
                 # digits of milliseconds to avoid browser console error.
                 field.value = field.value.replace(tzinfo=None).isoformat(timespec="milliseconds")
 
-        if 'template' in style:
-            template_name = style['template']
-        else:
-            template_name = style['template_pack'].strip('/') + '/' + style['base_template']
-
-        template = loader.get_template(template_name)
         context = {'field': field, 'style': style}
         return template.render(context)
 
@@ -387,7 +801,7 @@ class HTMLFormRenderer(BaseRenderer):
 
         template_pack = style['template_pack'].strip('/')
         template_name = template_pack + '/' + self.base_template
-        template = loader.get_template(template_name)
+        template = self.get_template(template_name)
         context = {
             'form': form,
             'style': style
@@ -395,6 +809,40 @@ class HTMLFormRenderer(BaseRenderer):
         return template.render(context)
 
 
+class DeferredForm:
+    """
+    A placeholder for a browsable API form that is not rendered along with
+    the page, but is requested separately once the page has loaded.
+    """
+
+    def __init__(self, url, name, header):
+        self.url = url
+        self.name = name
+        self.header = header
+
+    def __html__(self):
+        return format_html(
+            '<div class="deferred-form" data-url="{}" data-form="{}" data-header="{}"></div>',
+            self.url, self.name, self.header
+        )
+
+    def __str__(self):
+        return self.__html__()
+
+
+def clear_form_renderer_cache(*args, **kwargs):
+    """
+    Clear the cached form templates, when the template settings or any
+    template files change.
+    """
+    HTMLFormRenderer._templates.clear()
+    HTMLFormRenderer._field_templates.clear()
+
+
+setting_changed.connect(clear_form_renderer_cache)
+file_changed.connect(clear_form_renderer_cache)
+
+
 class BrowsableAPIRenderer(BaseRenderer):
     """
     HTML renderer used to self-document the API.
@@ -406,6 +854,9 @@ class BrowsableAPIRenderer(BaseRenderer):
     code_style = 'emacs'
     charset = 'utf-8'
     form_renderer_class = HTMLFormRenderer
+    defer_forms = False
+    deferred_form_header = 'X-Deferred-Form'
+    deferred_forms = ('post', 'put', 'filter')
 
     def get_default_renderer(self, view):
         """
@@ -446,17 +897,65 @@ class BrowsableAPIRenderer(BaseRenderer):
     def show_form_for_method(self, view, method, request, obj):
         """
         Returns True if a form should be shown for this method.
+
+        The result is cached for the duration of a render, since both the
+        HTML and raw data forms check the same permissions.
         """
         if method not in view.allowed_methods:
             return  # Not a valid method
 
+        cache = getattr(self, '_show_form_cache', None)
+        key = (method, id(obj))
+        if cache is not None and key in cache:
+            return cache[key]
+
         try:
             view.check_permissions(request)
             if obj is not None:
                 view.check_object_permissions(request, obj)
         except exceptions.APIException:
-            return False  # Doesn't have permissions
-        return True
+            show_form = False  # Doesn't have permissions
+        else:
+            show_form = True
+
+        if cache is not None:
+            cache[key] = show_form
+        return show_form
+
+    def get_deferred_form(self, request, name):
+        """
+        Return a placeholder for the named form, if forms are being deferred
+        for this render, or `None` if the form should be rendered.
+        """
+        if not getattr(self, '_deferring_forms', False) or name not in self.deferred_forms:
+            return None
+        return DeferredForm(request.get_full_path(), name, self.deferred_form_header)
+
+    def get_requested_form(self, request):
+        """
+        Return the name of the deferred form requested, if any.
+        """
+        header = 'HTTP_' + self.deferred_form_header.upper().replace('-', '_')
+        name = request.META.get(header)
+        return name if name in self.deferred_forms else None
+
+    def render_deferred_form(self, data, view, request):
+        """
+        Render the form requested by a deferred form placeholder, as an HTML
+        fragment, or return `None` if this is not a request for a form.
+        """
+        if not self.defer_forms or request.method != 'GET':
+            return None
+
+        name = self.get_requested_form(request)
+        if name is None:
+            return None
+
+        if name == 'filter':
+            form = self.get_filter_form(data, view, request)
+        else:
+            form = self.get_rendered_html_form(data, view, name.upper(), request)
+        return form if isinstance(form, str) else ''
 
     def _get_serializer(self, serializer_class, view_instance, request, *args, **kwargs):
         kwargs['context'] = {
@@ -525,6 +1024,11 @@ class BrowsableAPIRenderer(BaseRenderer):
             if existing_serializer is not None:
                 with contextlib.suppress(TypeError):
                     return self.render_form_for_serializer(existing_serializer)
+
+            deferred_form = self.get_deferred_form(request, method.lower())
+            if deferred_form is not None:
+                return deferred_form
+
             if has_serializer:
                 if method in ('PUT', 'PATCH'):
                     serializer = view.get_serializer(instance=instance, **kwargs)
@@ -664,6 +1168,13 @@ class BrowsableAPIRenderer(BaseRenderer):
         elif not isinstance(data, list):
             return
 
+        if not any(hasattr(backend, 'to_html') for backend in view.filter_backends):
+            return
+
+        deferred_form = self.get_deferred_form(request, 'filter')
+        if deferred_form is not None:
+            return deferred_form
+
         queryset = view.get_queryset()
         elements = []
         for backend in view.filter_backends:
@@ -750,12 +1261,38 @@ class BrowsableAPIRenderer(BaseRenderer):
             'csrf_header_name': csrf_header_name
         }
 
+    def begin_render(self, renderer_context):
+        """
+        Reset the per-render state, and determine whether the forms will be
+        deferred, which is only the case for successful GET requests for the
+        whole page.
+        """
+        request = renderer_context['request']
+        response = renderer_context['response']
+        self._show_form_cache = {}
+        self._deferring_forms = (
+            self.defer_forms and
+            request.method == 'GET' and
+            self.get_requested_form(request) is None and
+            not status.is_client_error(response.status_code) and
+            not status.is_server_error(response.status_code)
+        )
+        if self.defer_forms:
+            patch_vary_headers(response, [self.deferred_form_header])
+
     def render(self, data, accepted_media_type=None, renderer_context=None):
         """
         Render the HTML for the browsable API representation.
         """
         self.accepted_media_type = accepted_media_type or ''
         self.renderer_context = renderer_context or {}
+        self.begin_render(renderer_context)
+
+        fragment = self.render_deferred_form(
+            data, renderer_context['view'], renderer_context['request']
+        )
+        if fragment is not None:
+            return fragment
 
         template = loader.get_template(self.template)
         context = self.get_context(data, accepted_media_type, renderer_context)
@@ -778,11 +1315,16 @@ class AdminRenderer(BrowsableAPIRenderer):
     def render(self, data, accepted_media_type=None, renderer_context=None):
         self.accepted_media_type = accepted_media_type or ''
         self.renderer_context = renderer_context or {}
+        self.begin_render(renderer_context)
 
         response = renderer_context['response']
         request = renderer_context['request']
         view = self.renderer_context['view']
 
+        fragment = self.render_deferred_form(data, view, request)
+        if fragment is not None:
+            return fragment
+
         if response.status_code == status.HTTP_400_BAD_REQUEST:
             # Errors still need to display the list or detail information.
             # The only way we can get at that is to simulate a GET request.
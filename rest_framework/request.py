@@ -90,6 +90,23 @@ def _hasattr(obj, name):
     return not getattr(obj, name) is Empty
 
 
+def merge_data_and_files(data, files):
+    """
+    Return a mutable copy of the parsed `data` with the `files` added.
+
+    `QueryDict.copy()` deep copies every value, which is wasted work since the
+    values are immutable strings, so for a `QueryDict` only the lists of
+    values are copied.
+    """
+    if isinstance(data, QueryDict):
+        full_data = data.__class__(mutable=True, encoding=data.encoding)
+        dict.update(full_data, ((key, list(values)) for key, values in dict.items(data)))
+    else:
+        full_data = data.copy()
+    full_data.update(files)
+    return full_data
+
+
 def clone_request(request, method):
     """
     Internal helper method to clone a request, replacing with a different
@@ -283,8 +300,7 @@ class Request:
         if not _hasattr(self, '_data'):
             self._data, self._files = self._parse()
             if self._files:
-                self._full_data = self._data.copy()
-                self._full_data.update(self._files)
+                self._full_data = merge_data_and_files(self._data, self._files)
             else:
                 self._full_data = self._data
 
@@ -355,12 +371,16 @@ class Request:
         if not parser:
             raise exceptions.UnsupportedMediaType(media_type)
 
+        # JSON and form data are parsed from the whole body, so that it
+        # remains available as `request.body`, without wrapping it in a stream.
         from rest_framework.parsers import FormParser, JSONParser
-        if isinstance(parser, (JSONParser, FormParser)):
-            stream = io.BytesIO(self.body)
+        body = self.body if isinstance(parser, (JSONParser, FormParser)) else None
 
         try:
-            parsed = parser.parse(stream, media_type, self.parser_context)
+            if body is not None:
+                parsed = parser.parse_bytes(body, media_type, self.parser_context)
+            else:
+                parsed = parser.parse(stream, media_type, self.parser_context)
         except Exception:
             # If we get an exception during parsing, fill in empty data and
             # re-raise.  Ensures we don't simply repeat the error when
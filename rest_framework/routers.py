@@ -25,7 +25,7 @@ from rest_framework.reverse import reverse
 from rest_framework.schemas import SchemaGenerator
 from rest_framework.schemas.views import SchemaView
 from rest_framework.settings import api_settings
-from rest_framework.urlpatterns import format_suffix_patterns
+from rest_framework.urlpatterns import TrieURLResolver, format_suffix_patterns
 
 Route = namedtuple('Route', ['url', 'mapping', 'name', 'detail', 'initkwargs'])
 DynamicRoute = namedtuple('DynamicRoute', ['url', 'name', 'detail', 'initkwargs'])
@@ -46,6 +46,8 @@ def flatten(list_of_lists):
 
 
 class BaseRouter:
+    use_trie_dispatch = False
+
     def __init__(self):
         self.registry = []
 
@@ -86,7 +88,12 @@ class BaseRouter:
     @property
     def urls(self):
         if not hasattr(self, '_urls'):
-            self._urls = self.get_urls()
+            urls = self.get_urls()
+            if self.use_trie_dispatch:
+                # A single entry, which looks up the matching pattern by the
+                # path's leading segments.
+                urls = [TrieURLResolver(urls)]
+            self._urls = urls
         return self._urls
 
 
@@ -135,9 +142,10 @@ class SimpleRouter(BaseRouter):
         ),
     ]
 
-    def __init__(self, trailing_slash=True, use_regex_path=True):
+    def __init__(self, trailing_slash=True, use_regex_path=True, use_trie_dispatch=False):
         self.trailing_slash = '/' if trailing_slash else ''
         self._use_regex = use_regex_path
+        self.use_trie_dispatch = use_trie_dispatch
         if use_regex_path:
             self._base_pattern = '(?P<{lookup_prefix}{lookup_url_kwarg}>{lookup_value})'
             self._default_value_pattern = '[^/.]+'
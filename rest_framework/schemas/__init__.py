@@ -31,9 +31,13 @@ def get_schema_view(
         public=False, patterns=None, generator_class=None,
         authentication_classes=api_settings.DEFAULT_AUTHENTICATION_CLASSES,
         permission_classes=api_settings.DEFAULT_PERMISSION_CLASSES,
-        version=None):
+        version=None, schema_file=None):
     """
     Return a schema view.
+
+    If `schema_file` is given, the view serves the precompiled schema in that
+    file, such as one written by the `generateschema` management command,
+    rather than generating the schema.
     """
     if generator_class is None:
         generator_class = openapi.SchemaGenerator
@@ -48,6 +52,7 @@ def get_schema_view(
     return SchemaView.as_view(
         renderer_classes=renderer_classes,
         schema_generator=generator,
+        schema_file=schema_file,
         public=public,
         authentication_classes=authentication_classes,
         permission_classes=permission_classes,
@@ -1,5 +1,9 @@
+import contextvars
+import copy
+import multiprocessing
 import re
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
 from operator import attrgetter
 from urllib.parse import urljoin
@@ -15,13 +19,67 @@ from rest_framework import exceptions, renderers, serializers
 from rest_framework.compat import inflection, uritemplate
 from rest_framework.fields import _UnvalidatedField, empty
 from rest_framework.settings import api_settings
+from rest_framework.utils.representation import smart_repr
 
 from .generators import BaseSchemaGenerator
 from .inspectors import ViewInspector
 from .utils import get_pk_description, is_list_view
 
+# The schemas mapped for each set of serializer fields while a schema is
+# generated, so that serializers used by several endpoints are only mapped once.
+serializer_schemas = contextvars.ContextVar('serializer_schemas', default=None)
+
+
+def get_field_key(field):
+    """
+    Return a hashable key describing a field, from its class, the arguments
+    it was instantiated with and its flags, including the fields of nested
+    serializers. Fields with equal keys are mapped to the same schema.
+    """
+    key = [
+        type(field), field.read_only, field.write_only, field.required,
+        field.allow_null, tuple(_get_value_key(arg) for arg in field._args),
+        tuple((name, _get_value_key(value)) for name, value in sorted(field._kwargs.items())),
+    ]
+    if isinstance(field, serializers.Serializer):
+        key.append(tuple(
+            (field_name, get_field_key(child)) for field_name, child in field.fields.items()
+        ))
+    return tuple(key)
+
+
+def _get_value_key(value):
+    if isinstance(value, serializers.Field):
+        return get_field_key(value)
+    if isinstance(value, (models.QuerySet, models.Manager)):
+        # Avoid evaluating the queryset, as `repr()` would.
+        return value.model
+    if isinstance(value, (list, tuple)):
+        return tuple(_get_value_key(item) for item in value)
+    return smart_repr(value)
+
+
+# The generator and endpoints being inspected by a schema worker process.
+_worker_endpoints = None
+
+
+def _init_worker(generator, endpoints):
+    global _worker_endpoints
+    _worker_endpoints = (generator, endpoints)
+    serializer_schemas.set({})
+
+
+def _inspect_worker_endpoint(index):
+    generator, endpoints = _worker_endpoints
+    return generator.inspect_endpoint(*endpoints[index])
+
 
 class SchemaGenerator(BaseSchemaGenerator):
+    _endpoint_schemas = None
+
+    # The number of processes to inspect endpoints with. Worker processes are
+    # forked, so this is ignored on platforms that don't support forking.
+    workers = None
 
     def get_info(self):
         # Title and version are required by openapi specification 3.x
@@ -68,15 +126,20 @@ class SchemaGenerator(BaseSchemaGenerator):
         self._initialise_endpoints()
         components_schemas = {}
 
-        # Iterate endpoints generating per method path operations.
-        paths = {}
         _, view_endpoints = self._get_paths_and_endpoints(None if public else request)
-        for path, method, view in view_endpoints:
-            if not self.has_view_permissions(path, method, view):
-                continue
+        endpoints = [
+            (path, method, view) for path, method, view in view_endpoints
+            if self.has_view_permissions(path, method, view)
+        ]
+        token = serializer_schemas.set({})
+        try:
+            endpoint_schemas = self.get_endpoint_schemas(endpoints)
+        finally:
+            serializer_schemas.reset(token)
 
-            operation = view.schema.get_operation(path, method)
-            components = view.schema.get_components(path, method)
+        # Iterate endpoints generating per method path operations.
+        paths = {}
+        for (path, method, view), (operation, components) in zip(endpoints, endpoint_schemas):
             for k in components.keys():
                 if k not in components_schemas:
                     continue
@@ -96,6 +159,12 @@ class SchemaGenerator(BaseSchemaGenerator):
 
         self.check_duplicate_operation_id(paths)
 
+        if self._endpoint_schemas is not None:
+            # Discard endpoints that are no longer present.
+            endpoint_keys = {self.get_endpoint_key(*endpoint) for endpoint in view_endpoints}
+            for key in set(self._endpoint_schemas) - endpoint_keys:
+                del self._endpoint_schemas[key]
+
         # Compile final schema.
         schema = {
             'openapi': '3.0.2',
@@ -110,6 +179,63 @@ class SchemaGenerator(BaseSchemaGenerator):
 
         return schema
 
+    def get_endpoint_key(self, path, method, view):
+        return (path, method, type(view))
+
+    def inspect_endpoint(self, path, method, view):
+        """
+        Return the `(operation, components)` tuple for an endpoint.
+        """
+        return view.schema.get_operation(path, method), view.schema.get_components(path, method)
+
+    def get_endpoint_schemas(self, endpoints):
+        """
+        Return the `(operation, components)` tuple for each of the given
+        `(path, method, view)` endpoints, in the same order.
+
+        When generating a public schema, these are kept between calls, so
+        that generating the schema again only inspects endpoints that are new
+        or whose view class has changed.
+        """
+        if self._endpoint_schemas is None:
+            self._endpoint_schemas = {}
+
+        results = [None] * len(endpoints)
+        pending = []
+        for index, (path, method, view) in enumerate(endpoints):
+            key = self.get_endpoint_key(path, method, view)
+            if view.request is None and key in self._endpoint_schemas:
+                # Copied, so that changes to the returned schema are not kept.
+                results[index] = copy.deepcopy(self._endpoint_schemas[key])
+            else:
+                pending.append(index)
+
+        for index, result in zip(pending, self.inspect_endpoints(endpoints, pending)):
+            path, method, view = endpoints[index]
+            if view.request is None:
+                key = self.get_endpoint_key(path, method, view)
+                self._endpoint_schemas[key] = copy.deepcopy(result)
+            results[index] = result
+        return results
+
+    def inspect_endpoints(self, endpoints, indexes):
+        """
+        Inspect the endpoints at the given indexes, spreading the work across
+        `workers` processes if it is set.
+        """
+        workers = min(self.workers or 1, len(indexes))
+        if workers < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+            return [self.inspect_endpoint(*endpoints[index]) for index in indexes]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_worker,
+            initargs=(self, endpoints)
+        ) as executor:
+            chunksize = max(1, len(indexes) // (workers * 4))
+            return list(executor.map(_inspect_worker_endpoint, indexes, chunksize=chunksize))
+
 # View Inspectors
 
 
@@ -514,6 +640,19 @@ class AutoSchema(ViewInspector):
             content['minimum'] = field.min_value
 
     def map_serializer(self, serializer):
+        schemas = serializer_schemas.get()
+        if schemas is None:
+            return self._map_serializer(serializer)
+
+        # While generating a schema, each serializer is only mapped once. The
+        # key includes each field, since serializers of the same class may
+        # have different fields, eg. depending on their arguments or context.
+        key = (type(self), serializer.partial, get_field_key(serializer))
+        if key not in schemas:
+            schemas[key] = self._map_serializer(serializer)
+        return copy.deepcopy(schemas[key])
+
+    def _map_serializer(self, serializer):
         # Assuming we have a valid serializer instance.
         required = []
         properties = {}
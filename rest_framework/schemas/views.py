@@ -3,9 +3,17 @@ views.py        # Houses `SchemaView`, `APIView` subclass.
 
 See schemas.__init__.py for package overview.
 """
+import hashlib
+import os
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+
 from rest_framework import exceptions, renderers
+from rest_framework.compat import yaml
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
+from rest_framework.utils import json
 from rest_framework.views import APIView
 
 
@@ -14,8 +22,12 @@ class SchemaView(APIView):
     schema = None  # exclude from schema
     renderer_classes = None
     schema_generator = None
+    schema_file = None
     public = False
 
+    # Schema files that have been loaded, as {path: (mtime, schema, digest)}.
+    _schema_files = {}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if self.renderer_classes is None:
@@ -27,10 +39,49 @@ class SchemaView(APIView):
                 self.renderer_classes += [renderers.BrowsableAPIRenderer]
 
     def get(self, request, *args, **kwargs):
-        schema = self.schema_generator.get_schema(request, self.public)
-        if schema is None:
-            raise exceptions.PermissionDenied()
-        return Response(schema)
+        if self.schema_file is not None:
+            schema, digest = self.load_schema_file()
+        else:
+            schema = self.schema_generator.get_schema(request, self.public)
+            if schema is None:
+                raise exceptions.PermissionDenied()
+            digest = self.get_schema_digest(schema)
+
+        # The same schema rendered with different media types must not share
+        # an ETag.
+        etag = quote_etag(hashlib.sha256(
+            (digest + request.accepted_media_type).encode('utf-8')
+        ).hexdigest())
+        response = Response(schema, headers={'ETag': etag})
+        return get_conditional_response(request, etag=etag, response=response)
+
+    def load_schema_file(self):
+        """
+        Return a `(schema, digest)` tuple for the precompiled schema file.
+
+        The file is only read again if it has been modified since it was
+        last loaded.
+        """
+        path = os.fspath(self.schema_file)
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._schema_files.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1:]
+
+        with open(path, 'rb') as schema_file:
+            content = schema_file.read()
+        if path.endswith('.json'):
+            schema = json.loads(content.decode('utf-8'))
+        else:
+            assert yaml, 'Loading a YAML schema file requires `pyyaml` to be installed.'
+            schema = yaml.safe_load(content)
+        digest = hashlib.sha256(content).hexdigest()
+        self._schema_files[path] = (mtime, schema, digest)
+        return schema, digest
+
+    def get_schema_digest(self, schema):
+        content = json.dumps(schema, sort_keys=True, cls=renderers.JSONOpenAPIRenderer.encoder_class)
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
     def handle_exception(self, exc):
         # Schema renderers do not render exceptions, so re-perform content
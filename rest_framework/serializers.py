@@ -14,13 +14,14 @@ response content is handled by parsers and renderers.
 import contextlib
 import copy
 import inspect
+import itertools
 import traceback
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
 from django.core.exceptions import ValidationError as DjangoValidationError
-from django.db import models
+from django.db import connections, models, router, transaction
 from django.db.models.fields import Field as DjangoModelField
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -28,12 +29,12 @@ from django.utils.translation import gettext_lazy as _
 
 from rest_framework.compat import postgres_fields
 from rest_framework.exceptions import ErrorDetail, ValidationError
-from rest_framework.fields import get_error_detail
+from rest_framework.fields import get_attribute, get_error_detail
 from rest_framework.settings import api_settings
 from rest_framework.utils import html, model_meta, representation
 from rest_framework.utils.field_mapping import (
-    ClassLookupDict, get_field_kwargs, get_nested_relation_kwargs,
-    get_relation_kwargs, get_url_kwargs
+    ClassLookupDict, get_choice_table, get_field_kwargs,
+    get_nested_relation_kwargs, get_relation_kwargs, get_url_kwargs
 )
 from rest_framework.utils.serializer_helpers import (
     BindingDict, BoundField, JSONBoundField, NestedBoundField, ReturnDict,
@@ -551,6 +552,56 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
 
         return ret
 
+    def to_representation_many(self, instances):
+        """
+        List of object instances -> List of dicts of primitive datatypes.
+
+        Each field represents its whole column of values at once, with
+        `.to_representation_column()`, so that work which is the same for
+        every value is only done once.
+        """
+        if type(self).to_representation is not Serializer.to_representation:
+            return [self.to_representation(instance) for instance in instances]
+
+        instances = list(instances)
+        fields = list(self._readable_fields)
+        columns = [self.get_column(field, instances) for field in fields]
+
+        ret = []
+        for index in range(len(instances)):
+            row = {}
+            for field, column in zip(fields, columns):
+                value = column[index]
+                if value is not empty:
+                    row[field.field_name] = value
+            ret.append(row)
+        return ret
+
+    def get_column(self, field, instances):
+        """
+        Return the representation of `field` for each of the instances, with
+        `empty` for instances where the field is skipped.
+        """
+        column = [empty] * len(instances)
+        indexes = []
+        attributes = []
+        for index, instance in enumerate(instances):
+            try:
+                attribute = field.get_attribute(instance)
+            except SkipField:
+                continue
+
+            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            if check_for_none is None:
+                column[index] = None
+            else:
+                indexes.append(index)
+                attributes.append(attribute)
+
+        for index, value in zip(indexes, field.to_representation_column(attributes)):
+            column[index] = value
+        return column
+
     def validate(self, attrs):
         return attrs
 
@@ -605,7 +656,8 @@ class ListSerializer(BaseSerializer):
         'not_a_list': _('Expected a list of items but got type "{input_type}".'),
         'empty': _('This list may not be empty.'),
         'max_length': _('Ensure this field has no more than {max_length} elements.'),
-        'min_length': _('Ensure this field has at least {min_length} elements.')
+        'min_length': _('Ensure this field has at least {min_length} elements.'),
+        'does_not_exist': _('Invalid {pk_name} "{pk_value}" - object does not exist.'),
     }
 
     def __init__(self, *args, **kwargs):
@@ -662,8 +714,77 @@ class ListSerializer(BaseSerializer):
         self.child.initial_data = data
         return super().run_child_validation(data)
         """
+        if self.instance is not None and self.get_meta_option('bulk_update'):
+            self.child.instance = self.get_child_instance(data)
+            self.child.initial_data = data
         return self.child.run_validation(data)
 
+    def get_meta_option(self, name, default=None):
+        """
+        Return an option from the child serializer's `Meta` class, such as
+        `bulk_create`, `bulk_update` or `bulk_batch_size`.
+        """
+        meta = getattr(self.child, 'Meta', None)
+        return getattr(meta, name, default)
+
+    def get_child_instance(self, data):
+        """
+        Return the instance that an item of a bulk update applies to, based
+        on the primary key included in the item.
+        """
+        pk_field = self._get_pk_field()
+        pk = data.get(pk_field.field_name, empty) if isinstance(data, Mapping) else empty
+        if pk is empty:
+            raise ValidationError({pk_field.field_name: [pk_field.error_messages['required']]}, code='required')
+
+        instance_map = getattr(self, '_instance_map', None)
+        if instance_map is None:
+            instance_map = self.get_instance_map([pk])
+        try:
+            return instance_map[str(pk)]
+        except KeyError:
+            pk_name = self.child.Meta.model._meta.pk.name
+            message = self.error_messages['does_not_exist'].format(pk_name=pk_name, pk_value=pk)
+            raise ValidationError({pk_field.field_name: [message]}, code='does_not_exist')
+
+    def get_instance_map(self, pks):
+        """
+        Return a dict of the instances being updated that match the given
+        primary keys, keyed by the string form of the primary key. When the
+        instance is a queryset only the matching rows are fetched.
+        """
+        model_pk = self.child.Meta.model._meta.pk
+        values = set()
+        for pk in pks:
+            try:
+                values.add(model_pk.to_python(pk))
+            except (DjangoValidationError, TypeError, ValueError):
+                continue
+
+        instances = self.instance
+        if isinstance(instances, models.manager.BaseManager):
+            instances = instances.all()
+        if isinstance(instances, models.QuerySet):
+            instances = instances.filter(pk__in=values) if values else []
+        else:
+            values = {str(value) for value in values}
+            instances = [obj for obj in instances if str(obj.pk) in values]
+        return {str(obj.pk): obj for obj in instances}
+
+    def _get_pk_field(self):
+        pk_name = self.child.Meta.model._meta.pk.name
+        pk_field = next(
+            (field for field in self.child.fields.values() if field.source == pk_name),
+            None
+        )
+        assert pk_field is not None and not pk_field.read_only, (
+            'Bulk updates require a writable `{pk_name}` field on `{serializer}`, '
+            'so that each item can be matched to an instance.'.format(
+                pk_name=pk_name, serializer=self.child.__class__.__name__
+            )
+        )
+        return pk_field
+
     def to_internal_value(self, data):
         """
         List of dicts of native values <- List of dicts of primitive datatypes.
@@ -672,46 +793,262 @@ class ListSerializer(BaseSerializer):
             data = html.parse_html_list(data, default=[])
 
         if not isinstance(data, list):
-            message = self.error_messages['not_a_list'].format(
-                input_type=type(data).__name__
-            )
-            raise ValidationError({
-                api_settings.NON_FIELD_ERRORS_KEY: [message]
-            }, code='not_a_list')
+            raise self.list_error('not_a_list', input_type=type(data).__name__)
 
         if not self.allow_empty and len(data) == 0:
-            message = self.error_messages['empty']
-            raise ValidationError({
-                api_settings.NON_FIELD_ERRORS_KEY: [message]
-            }, code='empty')
+            raise self.list_error('empty')
 
         if self.max_length is not None and len(data) > self.max_length:
-            message = self.error_messages['max_length'].format(max_length=self.max_length)
-            raise ValidationError({
-                api_settings.NON_FIELD_ERRORS_KEY: [message]
-            }, code='max_length')
+            raise self.list_error('max_length', max_length=self.max_length)
 
         if self.min_length is not None and len(data) < self.min_length:
-            message = self.error_messages['min_length'].format(min_length=self.min_length)
-            raise ValidationError({
-                api_settings.NON_FIELD_ERRORS_KEY: [message]
-            }, code='min_length')
+            raise self.list_error('min_length', min_length=self.min_length)
 
-        ret = []
+        ret, errors = self.validate_items(data)
+        if errors:
+            raise ValidationError(errors)
+
+        return list(ret.values())
+
+    def list_error(self, key, **kwargs):
+        """
+        Return a `ValidationError` for an error with the list as a whole.
+        """
+        message = self.error_messages[key].format(**kwargs)
+        return ValidationError({
+            api_settings.NON_FIELD_ERRORS_KEY: [message]
+        }, code=key)
+
+    def validate_items(self, items, start=0):
+        """
+        Validate each of a list of items, returning a tuple of dicts of
+        `{index: validated data}` and `{index: error detail}`, with the items
+        numbered from `start`.
+        """
+        ret = {}
         errors = {}
+        # The values of the batch validated fields of the invalid items.
+        partial = {}
+
+        # When creating, validators that support it check every item with a
+        # single query, once the items themselves have been validated.
+        batch_validators = self.get_batch_validators() if self.instance is None else []
+
+        if self.instance is not None and self.get_meta_option('bulk_update'):
+            # Fetch every instance being updated with a single query.
+            field_name = self._get_pk_field().field_name
+            self._instance_map = self.get_instance_map(
+                item[field_name] for item in items
+                if isinstance(item, Mapping) and field_name in item
+            )
 
-        for index, item in enumerate(data):
-            try:
-                validated = self.run_child_validation(item)
-            except ValidationError as exc:
-                errors[index] = exc.detail
+        with self._exclude_validators(batch_validators), self._prefetch_related_objects(items):
+            for index, item in enumerate(items, start):
+                try:
+                    validated = self.run_child_validation(item)
+                except ValidationError as exc:
+                    errors[index] = exc.detail
+                    if batch_validators:
+                        partial[index] = self.get_batch_values(item, exc.detail, batch_validators)
+                else:
+                    ret[index] = validated
+
+        batch_errors = self.run_batch_validators(ret, batch_validators, partial)
+        for index, detail in batch_errors.items():
+            ret.pop(index, None)
+            if index not in errors:
+                errors[index] = detail
+                continue
+            # Merge the uniqueness errors with the item's own errors.
+            for key, messages in detail.items():
+                existing = errors[index].setdefault(key, [])
+                if isinstance(existing, list):
+                    existing.extend(messages)
+
+        return ret, dict(sorted(errors.items()))
+
+    def get_batch_values(self, item, detail, batch_validators):
+        """
+        Return the validated values of the fields checked by the batch
+        validators, for an item that failed validation, so that it is still
+        checked for uniqueness. Fields that failed validation themselves are
+        omitted.
+        """
+        attrs = {}
+        if not isinstance(item, Mapping) or not isinstance(detail, Mapping):
+            return attrs
+
+        field_names = set()
+        for field, validator in batch_validators:
+            if field is None:
+                field_names.update(getattr(validator, 'fields', ()))
             else:
-                ret.append(validated)
+                field_names.add(field.field_name)
 
-        if errors:
-            raise ValidationError(errors)
+        for field_name in field_names:
+            field = self.child.fields.get(field_name)
+            if field is None or field.read_only or field_name in detail:
+                continue
+            validate_method = getattr(self.child, 'validate_' + field_name, None)
+            try:
+                value = field.run_validation(field.get_value(item))
+                if validate_method is not None:
+                    value = validate_method(value)
+            except (ValidationError, DjangoValidationError, SkipField):
+                continue
+            self.child.set_value(attrs, field.source_attrs, value)
+        return attrs
 
-        return ret
+    def iter_batches(self, data, batch_size):
+        """
+        Yield `(start, items)` tuples for successive batches of the items in
+        `data`, which may be any iterable, such as a `JSONArrayStream`.
+
+        Raises a `ValidationError` if the data is not a list of items, or has
+        an invalid number of items.
+        """
+        if isinstance(data, (str, bytes, Mapping)) or not isinstance(data, Iterable):
+            raise self.list_error('not_a_list', input_type=type(data).__name__)
+
+        count = 0
+        batch = []
+        for item in data:
+            count += 1
+            if self.max_length is not None and count > self.max_length:
+                raise self.list_error('max_length', max_length=self.max_length)
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield count - len(batch), batch
+                batch = []
+        if batch:
+            yield count - len(batch), batch
+
+        if not self.allow_empty and count == 0:
+            raise self.list_error('empty')
+
+        if self.min_length is not None and count < self.min_length:
+            raise self.list_error('min_length', min_length=self.min_length)
+
+    def get_batch_validators(self):
+        """
+        Return the validators of the child serializer that are able to
+        validate a whole batch of items at once, as a list of
+        `(field, validator)` tuples. The field is `None` for validators that
+        apply to the child serializer itself.
+        """
+        batch_validators = [
+            (field, validator)
+            for field in getattr(self.child, '_writable_fields', ())
+            if field.source != '*'
+            for validator in field.validators
+            if hasattr(validator, 'validate_batch')
+        ]
+        batch_validators += [
+            (None, validator)
+            for validator in self.child.validators
+            if hasattr(validator, 'validate_batch')
+        ]
+        return batch_validators
+
+    @contextlib.contextmanager
+    def _prefetch_related_objects(self, data):
+        """
+        Fetch the objects referenced by each relational field of the child
+        serializer across every item, with a single query per field.
+        """
+        with contextlib.ExitStack() as stack:
+            for field in getattr(self.child, '_writable_fields', ()):
+                if isinstance(field, ManyRelatedField):
+                    relation = field.child_relation
+                elif isinstance(field, RelatedField):
+                    relation = field
+                else:
+                    continue
+
+                values = []
+                for item in data:
+                    if not isinstance(item, Mapping):
+                        continue
+                    value = field.get_value(item)
+                    if value is empty or value is None:
+                        continue
+                    if relation is field:
+                        values.append(value)
+                    elif isinstance(value, (list, tuple)):
+                        values.extend(value)
+                stack.enter_context(relation.prefetch_objects(values))
+            yield
+
+    @contextlib.contextmanager
+    def _exclude_validators(self, batch_validators):
+        """
+        Temporarily remove the batch validators from the child serializer and
+        its fields, so that they are not also run for each item.
+        """
+        originals = {}
+        excluded = {id(validator) for field, validator in batch_validators}
+        for field, validator in batch_validators:
+            owner = self.child if field is None else field
+            originals.setdefault(id(owner), (owner, owner.validators))
+        for owner, validators in originals.values():
+            owner.validators = [
+                validator for validator in validators
+                if id(validator) not in excluded
+            ]
+        try:
+            yield
+        finally:
+            for owner, validators in originals.values():
+                owner.validators = validators
+
+    def run_batch_validators(self, items, batch_validators, partial=None):
+        """
+        Run the batch validators against the dict of `{index: validated data}`,
+        and return a dict of `{index: error detail}` for the failing items.
+
+        `partial` is a dict of `{index: values}` for the items that failed
+        validation, which are checked by each validator whose fields they
+        have values for.
+        """
+        partial = partial or {}
+        errors = defaultdict(dict)
+        for field, validator in batch_validators:
+            if field is None:
+                read_only_defaults = self.child._read_only_defaults()
+                values = {
+                    index: {**read_only_defaults, **attrs}
+                    for index, attrs in items.items()
+                }
+                sources = [
+                    self.child.fields[field_name].source_attrs
+                    for field_name in getattr(validator, 'fields', None) or ()
+                ]
+                for index, attrs in partial.items():
+                    if sources and all(self._has_value(attrs, source_attrs) for source_attrs in sources):
+                        values[index] = {**read_only_defaults, **attrs}
+                batch_errors = validator.validate_batch(dict(sorted(values.items())), self.child)
+            else:
+                values = {}
+                for index, attrs in sorted({**items, **partial}.items()):
+                    with contextlib.suppress(KeyError):
+                        values[index] = get_attribute(attrs, field.source_attrs)
+                batch_errors = validator.validate_batch(values, field)
+
+            for index, exc in batch_errors.items():
+                if field is None:
+                    detail = as_serializer_error(exc)
+                else:
+                    detail = {field.field_name: exc.detail}
+                for key, messages in detail.items():
+                    errors[index].setdefault(key, []).extend(messages)
+        return errors
+
+    def _has_value(self, attrs, source_attrs):
+        try:
+            get_attribute(attrs, source_attrs)
+        except KeyError:
+            return False
+        return True
 
     def to_representation(self, data):
         """
@@ -721,27 +1058,201 @@ class ListSerializer(BaseSerializer):
         # so, first get a queryset from the Manager if needed
         iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
 
+        if self.is_columnar():
+            return self.child.to_representation_many(iterable)
+
         return [
             self.child.to_representation(item) for item in iterable
         ]
 
+    def iter_representation(self, data, chunk_size=2000):
+        """
+        Iterable of object instances -> Iterator of dicts of primitive datatypes.
+
+        Unlike `.to_representation()`, querysets are iterated over without
+        caching their results, so that large querysets can be streamed.
+        """
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        if isinstance(iterable, models.QuerySet):
+            iterable = iterable.iterator(chunk_size=chunk_size)
+
+        if self.is_columnar():
+            iterator = iter(iterable)
+            while chunk := list(itertools.islice(iterator, chunk_size)):
+                yield from self.child.to_representation_many(chunk)
+            return
+
+        for item in iterable:
+            yield self.child.to_representation(item)
+
+    def is_columnar(self):
+        """
+        Return `True` if the items should be represented a column at a time,
+        as set by the `columnar_representation` option of the child
+        serializer's `Meta` class.
+        """
+        return (
+            isinstance(self.child, Serializer) and
+            bool(self.get_meta_option('columnar_representation'))
+        )
+
     def validate(self, attrs):
         return attrs
 
     def update(self, instance, validated_data):
+        if self.get_meta_option('bulk_update'):
+            return self.bulk_update(instance, validated_data)
         raise NotImplementedError(
             "Serializers with many=True do not support multiple update by "
             "default, only multiple create. For updates it is unclear how to "
             "deal with insertions and deletions. If you need to support "
             "multiple update, use a `ListSerializer` class and override "
-            "`.update()` so you can specify the behavior exactly."
+            "`.update()` so you can specify the behavior exactly, or set "
+            "`bulk_update = True` on the serializer `Meta` to update the "
+            "existing instances identified by their primary keys."
         )
 
     def create(self, validated_data):
+        if self.get_meta_option('bulk_create'):
+            return self.bulk_create(validated_data)
         return [
             self.child.create(attrs) for attrs in validated_data
         ]
 
+    def bulk_create(self, validated_data):
+        """
+        Create all of the instances with `bulk_create()`, and then add any
+        many-to-many relationships with a single insert per relationship.
+
+        Used instead of `.create()` when `bulk_create = True` is set on the
+        child serializer's `Meta`.
+        """
+        ModelClass = self.child.Meta.model
+        assert all(
+            parent._meta.concrete_model is ModelClass._meta.concrete_model
+            for parent in ModelClass._meta.get_parent_list()
+        ), (
+            'Bulk creation is not supported for multi-table inherited models, '
+            'such as `%s`.' % ModelClass.__name__
+        )
+
+        instances = []
+        many_to_many = []
+        for attrs in validated_data:
+            raise_errors_on_nested_writes('create', self.child, attrs)
+            attrs, relations = self._pop_many_to_many(ModelClass, attrs)
+            instances.append(ModelClass(**attrs))
+            many_to_many.append(relations)
+
+        connection = connections[router.db_for_write(ModelClass)]
+        if any(many_to_many) and not connection.features.can_return_rows_from_bulk_insert:
+            # Primary keys are required to add many-to-many relationships.
+            with transaction.atomic(using=connection.alias):
+                return [self.child.create(attrs) for attrs in validated_data]
+
+        batch_size = self.get_meta_option('bulk_batch_size')
+        with transaction.atomic(using=connection.alias):
+            instances = ModelClass._default_manager.bulk_create(instances, batch_size=batch_size)
+            self._set_many_to_many(instances, many_to_many, batch_size)
+        return instances
+
+    def bulk_update(self, instance, validated_data):
+        """
+        Update the instances identified by the primary key in each item with
+        a single `bulk_update()`, which is passed every field that appears in
+        the validated data, along with any `auto_now` fields.
+
+        Used instead of `.update()` when `bulk_update = True` is set on the
+        child serializer's `Meta`.
+        """
+        ModelClass = self.child.Meta.model
+        opts = ModelClass._meta
+        instance_map = getattr(self, '_instance_map', None)
+        if instance_map is None:
+            instance_map = self.get_instance_map(attrs[opts.pk.name] for attrs in validated_data)
+
+        instances = []
+        update_fields = set()
+        many_to_many = []
+        for attrs in validated_data:
+            raise_errors_on_nested_writes('update', self.child, attrs)
+            attrs, relations = self._pop_many_to_many(ModelClass, attrs)
+            obj = instance_map[str(attrs.pop(opts.pk.name))]
+            for attr, value in attrs.items():
+                setattr(obj, attr, value)
+            update_fields.update(attrs)
+            instances.append(obj)
+            many_to_many.append(relations)
+
+        if update_fields:
+            # `bulk_update()` does not call `pre_save()`, which `save()` uses
+            # to set `auto_now` fields and to commit files, among others.
+            update_fields.update(
+                field.name for field in opts.concrete_fields
+                if getattr(field, 'auto_now', False)
+            )
+            fields = [opts.get_field(field_name) for field_name in update_fields]
+            for obj in instances:
+                for field in fields:
+                    setattr(obj, field.attname, field.pre_save(obj, False))
+
+        batch_size = self.get_meta_option('bulk_batch_size')
+        with transaction.atomic(using=router.db_for_write(ModelClass)):
+            if update_fields:
+                ModelClass._default_manager.bulk_update(instances, update_fields, batch_size=batch_size)
+            self._set_many_to_many(instances, many_to_many, batch_size, clear=True)
+        return instances
+
+    def _pop_many_to_many(self, ModelClass, attrs):
+        info = model_meta.get_field_info(ModelClass)
+        attrs = dict(attrs)
+        many_to_many = {
+            field_name: attrs.pop(field_name)
+            for field_name, relation_info in info.relations.items()
+            if relation_info.to_many and field_name in attrs
+        }
+        return attrs, many_to_many
+
+    def _set_many_to_many(self, instances, many_to_many, batch_size, clear=False):
+        """
+        Set the many-to-many relationships of each instance, inserting the
+        rows of auto-created through tables in bulk.
+        """
+        info = model_meta.get_field_info(type(instances[0]))
+        field_names = {field_name for relations in many_to_many for field_name in relations}
+        for field_name in field_names:
+            items = [
+                (instance, relations[field_name])
+                for instance, relations in zip(instances, many_to_many)
+                if field_name in relations
+            ]
+            # Reverse relations are keyed by their accessor name, and have no
+            # model field.
+            model_field = info.relations[field_name].model_field
+            if not (model_field is not None and model_field.many_to_many and
+                    model_field.remote_field.through._meta.auto_created):
+                # Reverse relations and custom through models are set one by one.
+                for instance, value in items:
+                    getattr(instance, field_name).set(value)
+                continue
+
+            through = model_field.remote_field.through
+            source = through._meta.get_field(model_field.m2m_field_name())
+            target = through._meta.get_field(model_field.m2m_reverse_field_name())
+            source_values = [getattr(instance, source.target_field.attname) for instance, value in items]
+            if clear:
+                through._default_manager.filter(**{'%s__in' % source.attname: source_values}).delete()
+
+            rows = {}
+            for source_value, (instance, value) in zip(source_values, items):
+                for related in value:
+                    if isinstance(related, models.Model):
+                        related = getattr(related, target.target_field.attname)
+                    rows[(source_value, related)] = through(**{
+                        source.attname: source_value, target.attname: related
+                    })
+            through._default_manager.bulk_create(list(rows.values()), batch_size=batch_size)
+
     def save(self, **kwargs):
         """
         Save and return a list of object instances.
@@ -773,6 +1284,51 @@ class ListSerializer(BaseSerializer):
 
         return self.instance
 
+    def save_in_batches(self, *, batch_size=None, raise_exception=False, **kwargs):
+        """
+        Validate and create the items of the input data a batch at a time, so
+        that only one batch is held in memory, rather than validating every
+        item before saving any.
+
+        The valid items of each batch are saved with `.create()`, while the
+        errors of invalid items are collected by index into `.errors`.
+        Returns the number of items that were saved.
+        """
+        assert hasattr(self, 'initial_data'), (
+            'Cannot call `.save_in_batches()` as no `data=` keyword argument was '
+            'passed when instantiating the serializer instance.'
+        )
+        assert self.instance is None, (
+            'Saving in batches only supports creating instances, not updates.'
+        )
+        assert not hasattr(self, '_errors'), (
+            'You cannot call `.save_in_batches()` after calling `.is_valid()`.'
+        )
+
+        data = self.initial_data
+        if html.is_html_input(data):
+            data = html.parse_html_list(data, default=[])
+        # Default to the bulk creation batch size, or a thousand items.
+        batch_size = batch_size or self.get_meta_option('bulk_batch_size') or 1000
+
+        saved = 0
+        errors = {}
+        try:
+            for start, items in self.iter_batches(data, batch_size):
+                validated, item_errors = self.validate_items(items, start)
+                errors.update(item_errors)
+                if validated:
+                    self.create([{**attrs, **kwargs} for attrs in validated.values()])
+                    saved += len(validated)
+        except ValidationError as exc:
+            errors.update(exc.detail)
+
+        self._validated_data = []
+        self._errors = errors or []
+        if errors and raise_exception:
+            raise ValidationError(self.errors)
+        return saved
+
     def is_valid(self, *, raise_exception=False):
         # This implementation is the same as the default,
         # except that we use lists, rather than dicts, as the empty case.
@@ -1305,6 +1861,8 @@ class ModelSerializer(Serializer):
             for key in list(field_kwargs):
                 if key not in valid_kwargs:
                     field_kwargs.pop(key)
+            if issubclass(field_class, ChoiceField):
+                field_kwargs['choices'] = get_choice_table(model_field)
 
         if not issubclass(field_class, ModelField):
             # `model_field` is only valid for the fallback case of
@@ -0,0 +1,14 @@
+$(document).ready(function() {
+  $('.deferred-form').each(function() {
+    var placeholder = $(this);
+    var headers = {'Accept': 'text/html'};
+    headers[placeholder.data('header')] = placeholder.data('form');
+
+    $.ajax({
+      url: placeholder.data('url'),
+      headers: headers
+    }).done(function(html) {
+      placeholder.replaceWith(html);
+    });
+  });
+});
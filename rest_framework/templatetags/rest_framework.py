@@ -141,6 +141,11 @@ def as_string(value):
     return '%s' % value
 
 
+@register.filter
+def as_list(value):
+    return list(value)
+
+
 @register.filter
 def as_list_of_strings(value):
     return [
@@ -1,6 +1,6 @@
 from django.urls import URLResolver, include, path, re_path, register_converter
 from django.urls.converters import get_converters
-from django.urls.resolvers import RoutePattern
+from django.urls.resolvers import RegexPattern, RoutePattern
 
 from rest_framework.settings import api_settings
 
@@ -116,3 +116,79 @@ def format_suffix_patterns(urlpatterns, suffix_required=False, allowed=None):
     suffix_route = '<%s:%s>' % (converter_name, suffix_kwarg)
 
     return apply_suffix_patterns(urlpatterns, suffix_pattern, suffix_required, suffix_route)
+
+
+REGEX_SPECIAL_CHARS = set('.^$*+?{}[]|()\\')
+REGEX_QUANTIFIERS = set('*+?{')
+
+
+def get_literal_prefix(pattern):
+    """
+    Return the path segments that any path matched by the given URL pattern
+    must begin with.
+    """
+    if isinstance(pattern, RoutePattern):
+        prefix = str(pattern).split('<', 1)[0]
+    elif isinstance(pattern, RegexPattern):
+        regex = str(pattern)
+        regex = regex[1:] if regex.startswith('^') else ''
+        prefix = ''
+        for char in regex:
+            if char in REGEX_SPECIAL_CHARS:
+                if char in REGEX_QUANTIFIERS:
+                    # The preceding character is optional or repeated.
+                    prefix = prefix[:-1]
+                break
+            prefix += char
+    else:
+        return []
+    # Only segments that are followed by a slash are complete.
+    return prefix.split('/')[:-1]
+
+
+class TrieURLResolver(URLResolver):
+    """
+    Resolves paths against a list of URL patterns by first looking up the
+    patterns that could match the path in a tree of their literal path
+    segments, rather than trying every pattern in turn.
+
+    The URL patterns are otherwise treated as if they were included with
+    `include()`, so reversing them is unaffected.
+    """
+
+    def __init__(self, urlpatterns):
+        super().__init__(RoutePattern(''), urlpatterns)
+        self._trie = None
+
+    def _build_trie(self):
+        # Each node is a `(children, patterns)` tuple, where the patterns are
+        # those whose literal prefix ends at that node.
+        root = ({}, [])
+        for index, pattern in enumerate(self.url_patterns):
+            node = root
+            for segment in get_literal_prefix(pattern.pattern):
+                node = node[0].setdefault(segment, ({}, []))
+            node[1].append((index, pattern))
+
+        # Every pattern along the path to a node might match paths that end at
+        # that node, so each node resolves against all of them, in order.
+        def build(node, inherited):
+            children, patterns = node
+            candidates = sorted(inherited + patterns, key=lambda item: item[0])
+            resolver = URLResolver(RoutePattern(''), [pattern for index, pattern in candidates])
+            return (
+                {segment: build(child, candidates) for segment, child in children.items()},
+                resolver
+            )
+
+        return build(root, [])
+
+    def resolve(self, path):
+        if self._trie is None:
+            self._trie = self._build_trie()
+        children, resolver = self._trie
+        for segment in str(path).split('/'):
+            if segment not in children:
+                break
+            children, resolver = children[segment]
+        return resolver.resolve(path)
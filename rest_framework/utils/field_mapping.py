@@ -3,12 +3,14 @@ Helper functions for mapping model fields to a dictionary of default
 keyword arguments that should be used for their equivalent serializer fields.
 """
 import inspect
+import weakref
 
 from django.core import validators
 from django.db import models
 from django.utils.text import capfirst
 
 from rest_framework.compat import postgres_fields
+from rest_framework.fields import ChoiceTable
 from rest_framework.validators import UniqueValidator
 
 NUMERIC_FIELD_TYPES = (
@@ -43,6 +45,27 @@ class ClassLookupDict:
         self.mapping[key] = value
 
 
+# Model fields -> the `ChoiceTable` for their choices.
+_choice_tables = weakref.WeakKeyDictionary()
+
+
+def get_choice_table(model_field):
+    """
+    Return the `ChoiceTable` for the choices of a model field, which is built
+    once and then reused, rather than for each serializer instance.
+
+    Callable choices may change, so a new table is always built for them.
+    """
+    choices = model_field.choices
+    if not isinstance(choices, (list, tuple)):
+        return ChoiceTable(choices)
+
+    table = _choice_tables.get(model_field)
+    if table is None or table.source is not choices:
+        table = _choice_tables[model_field] = ChoiceTable(choices)
+    return table
+
+
 def needs_label(model_field, field_name):
     """
     Returns `True` if the label based on the model's verbose name
@@ -35,3 +35,12 @@ def load(*args, **kwargs):
 def loads(*args, **kwargs):
     kwargs.setdefault('parse_constant', strict_constant)
     return json.loads(*args, **kwargs)
+
+
+JSONDecodeError = json.JSONDecodeError
+
+
+class JSONDecoder(json.JSONDecoder):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('parse_constant', strict_constant)
+        super().__init__(*args, **kwargs)
@@ -1,3 +1,5 @@
+import os
+import re
 from urllib import parse
 
 from django.utils.encoding import force_str
@@ -25,3 +27,62 @@ def remove_query_param(url, key):
     query_dict.pop(key, None)
     query = parse.urlencode(sorted(query_dict.items()), doseq=True)
     return parse.urlunsplit((scheme, netloc, path, query, fragment))
+
+
+# Lookup values that are left unchanged when quoted in a URL, and so can be
+# substituted into a URL template, rather than requiring a full reverse.
+URL_TEMPLATE_VALUE_RE = re.compile(r'[A-Za-z0-9_-]+\Z')
+
+
+def get_url_template_shape(lookup_value):
+    """
+    Return a key that groups lookup values which can share a URL template,
+    or `None` if the URL for the value must always be fully reversed.
+    """
+    text = str(lookup_value)
+    if not URL_TEMPLATE_VALUE_RE.match(text):
+        return None
+    return (type(lookup_value), len(text), text.isdigit())
+
+
+def get_alternate_lookup_value(text):
+    """
+    Return a lookup value of the same shape, but which differs from the given
+    value in every character, so that reversing both pinpoints the value in
+    the resulting URL.
+    """
+    alternate = []
+    for char in text:
+        if char.isdigit():
+            alternate.append(str((int(char) + 1) % 10))
+        elif char.isalpha():
+            base = ord('a') if char.islower() else ord('A')
+            alternate.append(chr(base + (ord(char) - base + 1) % 26))
+        else:
+            alternate.append('_' if char == '-' else '-')
+    return ''.join(alternate)
+
+
+def compile_url_template(url, lookup_value, reverse_alternate):
+    """
+    Given a URL reversed for a lookup value, return a `(prefix, suffix)`
+    tuple for the URL that surrounds the value, or `False` if no template
+    could be determined.
+
+    `reverse_alternate` is called with an alternate lookup value of the same
+    shape, and should return the URL for it, or raise `NoReverseMatch`.
+    """
+    from django.urls import NoReverseMatch
+
+    value = str(lookup_value)
+    try:
+        alternate_url = reverse_alternate(get_alternate_lookup_value(value))
+    except NoReverseMatch:
+        return False
+
+    prefix_length = len(os.path.commonprefix([url, alternate_url]))
+    suffix_length = len(os.path.commonprefix([url[::-1], alternate_url[::-1]]))
+    prefix, suffix = url[:prefix_length], url[len(url) - suffix_length:]
+    if prefix + value + suffix != url:
+        return False
+    return (prefix, suffix)
@@ -6,9 +6,9 @@ This gives us better separation of concerns, allows us to use single-step
 object creation, and makes it possible to switch between using the implicit
 `ModelSerializer` class and an equivalent explicit `Serializer` class.
 """
-from django.core.exceptions import FieldError
+from django.core.exceptions import FieldDoesNotExist, FieldError
 from django.db import DataError
-from django.db.models import Exists
+from django.db.models import Exists, Model
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework.exceptions import ValidationError
@@ -43,6 +43,31 @@ def qs_filter(queryset, **kwargs):
         return queryset.none()
 
 
+def get_lookup_value(queryset, field_name, value):
+    """
+    Returns the value as it is returned by `queryset.values_list(field_name)`,
+    so that database rows can be matched back to the values they were
+    looked up by.
+    """
+    try:
+        model_field = queryset.model._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        return value
+    if model_field.is_relation and isinstance(value, Model):
+        return getattr(value, model_field.target_field.attname)
+    return value
+
+
+def is_batchable(value):
+    if value is None:
+        return False
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
 class UniqueValidator:
     """
     Validator that corresponds to `unique=True` on a model field.
@@ -86,6 +111,49 @@ class UniqueValidator:
         if qs_exists(queryset):
             raise ValidationError(self.message, code='unique')
 
+    def validate_batch(self, values, serializer_field):
+        """
+        Validate the values of a batch of instances that are being created,
+        using a single query. Values that repeat an earlier value in the same
+        batch are also treated as conflicts.
+
+        Takes a dict of `{index: value}`, and returns a dict of
+        `{index: ValidationError}` for the values that are not unique.
+        """
+        field_name = serializer_field.source_attrs[-1]
+        errors = {}
+        pending = {}
+        if self.lookup == 'exact':
+            for index, value in values.items():
+                if is_batchable(value):
+                    pending[index] = get_lookup_value(self.queryset, field_name, value)
+        fallback = [index for index in values if index not in pending]
+
+        if pending:
+            queryset = qs_filter(self.queryset, **{'%s__in' % field_name: set(pending.values())})
+            try:
+                existing = set(queryset.values_list(field_name, flat=True))
+            except (TypeError, ValueError, DataError):
+                existing = set()
+
+            seen = set()
+            for index, value in pending.items():
+                if value in existing or value in seen:
+                    errors[index] = ValidationError(self.message, code='unique')
+                seen.add(value)
+
+            # Rows that were matched by the database but not by value, eg.
+            # due to a case-insensitive collation, need checking one by one.
+            if existing - seen:
+                fallback += [index for index in pending if index not in errors]
+
+        for index in fallback:
+            try:
+                self(values[index], serializer_field)
+            except ValidationError as exc:
+                errors[index] = exc
+        return errors
+
     def __repr__(self):
         return '<%s(queryset=%s)>' % (
             self.__class__.__name__,
@@ -219,6 +287,69 @@ class UniqueTogetherValidator:
                 message = self.message.format(field_names=field_names)
                 raise ValidationError(message, code=self.code)
 
+    def validate_batch(self, items, serializer):
+        """
+        Validate the attributes of a batch of instances that are being
+        created, using a single query. Items that repeat the values of an
+        earlier item in the same batch are also treated as conflicts.
+
+        Takes a dict of `{index: attrs}`, and returns a dict of
+        `{index: ValidationError}` for the items that are not unique.
+        """
+        errors = {}
+        pending = {}
+        fallback = []
+        sources = [serializer.fields[field_name].source for field_name in self.fields]
+        for index, attrs in items.items():
+            try:
+                self.enforce_required_fields(attrs, serializer)
+            except ValidationError as exc:
+                errors[index] = exc
+                continue
+            values = [attrs[source] for source in sources]
+            if self.nulls_distinct is not False and None in values:
+                # Skip validation for None values, as in `__call__()`
+                continue
+            if self.condition is not None or not all(is_batchable(value) for value in values):
+                fallback.append(index)
+                continue
+            pending[index] = tuple(
+                get_lookup_value(self.queryset, source, value)
+                for source, value in zip(sources, values)
+            )
+
+        if pending:
+            # Narrow down the candidates by each field, then match the
+            # combinations of values exactly.
+            filter_kwargs = {
+                '%s__in' % source: {values[position] for values in pending.values()}
+                for position, source in enumerate(sources)
+            }
+            queryset = qs_filter(self.queryset, **filter_kwargs)
+            try:
+                existing = set(queryset.values_list(*sources))
+            except (TypeError, ValueError, DataError):
+                existing = set()
+
+            seen = set()
+            for index, values in pending.items():
+                if values in existing or values in seen:
+                    message = self.message.format(field_names=', '.join(self.fields))
+                    errors[index] = ValidationError(message, code=self.code)
+                seen.add(values)
+
+            # Rows that were matched by the database but not by value, eg.
+            # due to a case-insensitive collation, need checking one by one.
+            if existing - seen:
+                fallback += [index for index in pending if index not in errors]
+
+        for index in fallback:
+            try:
+                self(items[index], serializer)
+            except ValidationError as exc:
+                errors[index] = exc
+        return errors
+
     def __repr__(self):
         return '<{}({})>'.format(
             self.__class__.__name__,
@@ -19,13 +19,20 @@ automatically.
 from functools import update_wrapper
 from inspect import getmembers
 
-from django.urls import NoReverseMatch
+from django.urls import NoReverseMatch, get_script_prefix, get_urlconf
 from django.utils.decorators import classonlymethod
 from django.views.decorators.csrf import csrf_exempt
 
 from rest_framework import generics, mixins, views
 from rest_framework.decorators import MethodMapper
 from rest_framework.reverse import reverse
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import (
+    compile_url_template, get_url_template_shape
+)
+
+# The number of extra action URL maps that are cached for each viewset class.
+EXTRA_ACTION_URL_CACHE_SIZE = 100
 
 
 def _is_extra_action(attr):
@@ -176,10 +183,16 @@ class ViewSetMixin:
     def get_extra_actions(cls):
         """
         Get the methods that are marked as an extra ViewSet `@action`.
+
+        The actions are discovered once per class, and cached on it.
         """
-        return [_check_attr_name(method, name)
-                for name, method
-                in getmembers(cls, _is_extra_action)]
+        extra_actions = cls.__dict__.get('_extra_actions')
+        if extra_actions is None:
+            extra_actions = [_check_attr_name(method, name)
+                             for name, method
+                             in getmembers(cls, _is_extra_action)]
+            cls._extra_actions = extra_actions
+        return list(extra_actions)
 
     def get_extra_action_url_map(self):
         """
@@ -193,12 +206,29 @@ class ViewSetMixin:
         if self.detail is None:
             return action_urls
 
+        key = self.get_extra_action_url_map_key()
+        if key is not None:
+            templates = type(self).__dict__.get('_extra_action_url_templates')
+            if templates is None:
+                templates = type(self)._extra_action_url_templates = {}
+            template = templates.get(key)
+            if template is not None and template is not False:
+                # The cached URLs are relative to the scheme and host, and
+                # there is at most one URL keyword argument.
+                origin = self.request.build_absolute_uri('/')[:-1]
+                value = ''.join(str(value) for value in self.kwargs.values())
+                return {
+                    name: origin + prefix + value + suffix
+                    for name, prefix, suffix in template
+                }
+
         # filter for the relevant extra actions
         actions = [
             action for action in self.get_extra_actions()
             if action.detail == self.detail
         ]
 
+        resolved = []
         for action in actions:
             try:
                 url_name = '%s-%s' % (self.basename, action.url_name)
@@ -208,12 +238,80 @@ class ViewSetMixin:
 
                 url = reverse(url_name, self.args, self.kwargs, request=self.request)
                 view = self.__class__(**action.kwargs)
-                action_urls[view.get_view_name()] = url
+                name = view.get_view_name()
+                action_urls[name] = url
+                resolved.append((name, url_name, url))
             except NoReverseMatch:
                 pass  # URL requires additional arguments, ignore
 
+        if key is not None and template is None:
+            while len(templates) >= EXTRA_ACTION_URL_CACHE_SIZE:
+                # Evict the oldest entry.
+                templates.pop(next(iter(templates)), None)
+            templates[key] = self.compile_extra_action_url_templates(resolved)
         return action_urls
 
+    def get_extra_action_url_map_key(self):
+        """
+        Return a key identifying the extra action URLs for this view, among
+        those of other requests to the same viewset, or `None` if the URLs
+        must always be reversed.
+
+        URLs can be shared for views with at most one URL keyword argument,
+        whose value is substituted into the cached URLs. The scheme and host
+        are not part of the key, since the cached URLs are relative to them.
+        """
+        request = self.request
+        if self.args or len(self.kwargs) > 1 or getattr(request, 'resolver_match', None) is None:
+            return None
+
+        kwargs_shape = ()
+        for name, value in self.kwargs.items():
+            shape = get_url_template_shape(value)
+            if shape is None:
+                return None
+            kwargs_shape = (name, shape)
+
+        format_override = api_settings.URL_FORMAT_OVERRIDE
+        return (
+            self.detail,
+            self.basename,
+            request.resolver_match.namespace,
+            get_urlconf(),
+            get_script_prefix(),
+            type(getattr(request, 'versioning_scheme', None)),
+            getattr(request, 'version', None),
+            request.GET.get(format_override) if format_override else None,
+            api_settings.VIEW_NAME_FUNCTION,
+            kwargs_shape,
+        )
+
+    def compile_extra_action_url_templates(self, resolved):
+        """
+        Given a list of `(name, url_name, url)` tuples for the reversed extra
+        actions, return a list of `(name, prefix, suffix)` tuples for the URLs
+        surrounding the URL keyword argument, with the prefix relative to the
+        scheme and host, or `False` if no templates could be determined.
+        """
+        origin = self.request.build_absolute_uri('/')[:-1]
+        if self.kwargs:
+            (kwarg, value), = self.kwargs.items()
+
+        templates = []
+        for name, url_name, url in resolved:
+            if not self.kwargs:
+                template = (url, '')
+            else:
+                template = compile_url_template(
+                    url, value,
+                    lambda alternate: reverse(url_name, kwargs={kwarg: alternate}, request=self.request)
+                )
+            if template is False or not template[0].startswith(origin):
+                return False
+            prefix, suffix = template
+            templates.append((name, prefix[len(origin):], suffix))
+        return templates
+
 
 class ViewSet(ViewSetMixin, views.APIView):
     """
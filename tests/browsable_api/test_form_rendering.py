@@ -1,6 +1,6 @@
 from django.test import TestCase
 
-from rest_framework import generics, renderers, serializers, status
+from rest_framework import filters, generics, renderers, serializers, status
 from rest_framework.response import Response
 from rest_framework.test import APIRequestFactory
 from tests.models import BasicModel
@@ -82,3 +82,78 @@ class TestManyPostView(TestCase):
             response = self.view(request).render()
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 3
+
+
+class DeferredFormsRenderer(renderers.BrowsableAPIRenderer):
+    defer_forms = True
+
+
+class DeferredFormsView(generics.ListCreateAPIView):
+    queryset = BasicModel.objects.all()
+    serializer_class = BasicSerializer
+    renderer_classes = (DeferredFormsRenderer, renderers.JSONRenderer)
+    filter_backends = (filters.SearchFilter,)
+    search_fields = ('text',)
+
+
+class DeferredFormsDetailView(generics.RetrieveUpdateAPIView):
+    queryset = BasicModel.objects.all()
+    serializer_class = BasicSerializer
+    renderer_classes = (DeferredFormsRenderer, renderers.JSONRenderer)
+
+
+class TestDeferredForms(TestCase):
+    def setUp(self):
+        self.obj = BasicModel.objects.create(text='foo')
+
+    def test_forms_are_deferred(self):
+        request = factory.get('/', HTTP_ACCEPT='text/html')
+        response = DeferredFormsView.as_view()(request).render()
+        content = response.content.decode()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'data-form="post"' in content
+        assert 'data-form="filter"' in content
+        assert 'name="text"' not in content
+        assert 'name="search"' not in content
+        assert 'X-Deferred-Form' in response['Vary']
+
+    def test_deferred_form(self):
+        request = factory.get('/', HTTP_ACCEPT='text/html', HTTP_X_DEFERRED_FORM='put')
+        response = DeferredFormsDetailView.as_view()(request, pk=self.obj.pk).render()
+        content = response.content.decode()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'name="text"' in content
+        assert 'value="foo"' in content
+        assert '<html' not in content
+
+    def test_deferred_filter_form(self):
+        request = factory.get('/', HTTP_ACCEPT='text/html', HTTP_X_DEFERRED_FORM='filter')
+        response = DeferredFormsView.as_view()(request).render()
+        content = response.content.decode()
+
+        assert 'name="search"' in content
+        assert '<html' not in content
+
+    def test_unavailable_deferred_form(self):
+        request = factory.get('/', HTTP_ACCEPT='text/html', HTTP_X_DEFERRED_FORM='put')
+        response = DeferredFormsView.as_view()(request).render()
+
+        assert response.content == b''
+
+    def test_only_listed_forms_are_deferred(self):
+        class FilterOnlyRenderer(DeferredFormsRenderer):
+            deferred_forms = ('filter',)
+
+        class View(DeferredFormsView):
+            renderer_classes = (FilterOnlyRenderer, renderers.JSONRenderer)
+
+        request = factory.get('/', HTTP_ACCEPT='text/html')
+        response = View.as_view()(request).render()
+        content = response.content.decode()
+
+        assert 'data-form="post"' not in content
+        assert 'name="text"' in content
+        assert 'data-form="filter"' in content
+        assert 'name="search"' not in content
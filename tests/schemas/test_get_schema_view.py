@@ -1,7 +1,17 @@
+import os
+import tempfile
+from unittest import mock
+
+import pytest
 from django.test import TestCase
 
 from rest_framework import renderers
+from rest_framework.compat import yaml
 from rest_framework.schemas import get_schema_view, openapi
+from rest_framework.test import APIRequestFactory
+from rest_framework.utils import json
+
+factory = APIRequestFactory()
 
 
 class GetSchemaViewTests(TestCase):
@@ -10,3 +20,56 @@ class GetSchemaViewTests(TestCase):
         schema_view = get_schema_view(title="With OpenAPI")
         assert isinstance(schema_view.initkwargs['schema_generator'], openapi.SchemaGenerator)
         assert renderers.OpenAPIRenderer in schema_view.cls().renderer_classes
+
+
+class SchemaViewCachingTests(TestCase):
+    def setUp(self):
+        self.schema = {'openapi': '3.0.2', 'info': {'title': 'Precompiled', 'version': ''}, 'paths': {}}
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write_schema_file(self, name, content):
+        schema_file = os.path.join(self.directory, name)
+        with open(schema_file, 'w') as f:
+            f.write(content)
+        return schema_file
+
+    def test_etag(self):
+        schema_view = get_schema_view(title='With ETag', patterns=[])
+        response = schema_view(factory.get('/', HTTP_ACCEPT='application/vnd.oai.openapi+json'))
+        assert response.status_code == 200
+        etag = response['ETag']
+
+        response = schema_view(factory.get('/', HTTP_ACCEPT='application/vnd.oai.openapi+json', HTTP_IF_NONE_MATCH=etag))
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+
+        response = schema_view(factory.get('/', HTTP_ACCEPT='application/vnd.oai.openapi', HTTP_IF_NONE_MATCH=etag))
+        assert response.status_code == 200
+        assert response['ETag'] != etag
+
+    def test_json_schema_file(self):
+        schema_file = self.write_schema_file('schema.json', json.dumps(self.schema))
+        schema_view = get_schema_view(schema_file=schema_file)
+        with mock.patch.object(openapi.SchemaGenerator, 'get_schema') as get_schema:
+            response = schema_view(factory.get('/', HTTP_ACCEPT='application/vnd.oai.openapi+json'))
+        assert not get_schema.called
+        assert response.status_code == 200
+        assert json.loads(response.rendered_content.decode()) == self.schema
+
+        response = schema_view(factory.get('/', HTTP_IF_NONE_MATCH=response['ETag'], HTTP_ACCEPT='application/vnd.oai.openapi+json'))
+        assert response.status_code == 304
+
+    @pytest.mark.skipif(yaml is None, reason='PyYAML is required.')
+    def test_yaml_schema_file_is_reloaded_when_modified(self):
+        schema_file = self.write_schema_file('schema.yaml', yaml.dump(self.schema))
+        schema_view = get_schema_view(schema_file=schema_file)
+        response = schema_view(factory.get('/'))
+        assert response.data == self.schema
+
+        self.schema['info']['title'] = 'Updated'
+        self.write_schema_file('schema.yaml', yaml.dump(self.schema))
+        os.utime(schema_file, ns=(0, 0))
+        response = schema_view(factory.get('/'))
+        assert response.data['info']['title'] == 'Updated'
@@ -1,5 +1,6 @@
 import uuid
 import warnings
+from unittest import mock
 
 import pytest
 from django.db import models
@@ -8,7 +9,9 @@ from django.urls import path
 from django.utils.safestring import SafeString
 from django.utils.translation import gettext_lazy as _
 
-from rest_framework import filters, generics, pagination, routers, serializers
+from rest_framework import (
+    filters, generics, pagination, routers, serializers, viewsets
+)
 from rest_framework.authtoken.views import obtain_auth_token
 from rest_framework.compat import uritemplate
 from rest_framework.parsers import JSONParser, MultiPartParser
@@ -17,7 +20,9 @@ from rest_framework.renderers import (
     OpenAPIRenderer
 )
 from rest_framework.request import Request
-from rest_framework.schemas.openapi import AutoSchema, SchemaGenerator
+from rest_framework.schemas.openapi import (
+    AutoSchema, SchemaGenerator, serializer_schemas
+)
 
 from ..models import BasicModel
 from . import views
@@ -1163,6 +1168,82 @@ class TestGenerator(TestCase):
         assert 'get' in example_operations
         assert 'post' in example_operations
 
+    def test_endpoint_schemas_are_reused(self):
+        patterns = [
+            path('example/', views.ExampleListView.as_view()),
+            path('example/{pk}/', views.ExampleDetailView.as_view()),
+        ]
+        generator = SchemaGenerator(patterns=patterns)
+        schema = generator.get_schema()
+        schema['paths']['/example/']['get']['operationId'] = 'changed'
+
+        with mock.patch.object(AutoSchema, 'get_operation') as get_operation:
+            assert generator.get_schema()['paths'] != schema['paths']
+        assert not get_operation.called
+
+        generator.endpoints = [endpoint for endpoint in generator.endpoints if '{pk}' not in endpoint[0]]
+        generator.get_schema()
+        assert {key[0] for key in generator._endpoint_schemas} == {'/example/'}
+
+    def get_model_viewset_patterns(self):
+        class BasicModelSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = BasicModel
+                fields = '__all__'
+
+        class BasicModelViewSet(viewsets.ModelViewSet):
+            queryset = BasicModel.objects.all()
+            serializer_class = BasicModelSerializer
+
+        router = routers.SimpleRouter()
+        router.register('example', BasicModelViewSet, basename='example')
+        return router.urls
+
+    def test_serializers_are_mapped_once(self):
+        generator = SchemaGenerator(patterns=self.get_model_viewset_patterns())
+        with mock.patch.object(
+            AutoSchema, '_map_serializer', autospec=True,
+            side_effect=AutoSchema._map_serializer
+        ) as map_serializer:
+            schema = generator.get_schema()
+        assert map_serializer.call_count == 1
+        assert list(schema['components']['schemas']) == ['BasicModel']
+
+    def test_serializers_with_different_fields_are_mapped_apart(self):
+        class DynamicFieldsSerializer(serializers.Serializer):
+            name = serializers.CharField()
+            code = serializers.CharField()
+
+            def __init__(self, *args, fields=None, read_only_code=False, **kwargs):
+                super().__init__(*args, **kwargs)
+                for field_name in set(self.fields) - set(fields or self.fields):
+                    self.fields.pop(field_name)
+                if read_only_code:
+                    self.fields['code'].read_only = True
+
+        inspector = AutoSchema()
+        token = serializer_schemas.set({})
+        try:
+            schemas = [
+                inspector.map_serializer(DynamicFieldsSerializer(**kwargs))
+                for kwargs in [{}, {'fields': ['name']}, {'read_only_code': True}, {}]
+            ]
+        finally:
+            serializer_schemas.reset(token)
+
+        assert list(schemas[0]['properties']) == ['name', 'code']
+        assert list(schemas[1]['properties']) == ['name']
+        assert schemas[2]['properties']['code']['readOnly'] is True
+        assert schemas[3] == schemas[0]
+
+    def test_parallel_generation(self):
+        patterns = self.get_model_viewset_patterns()
+        schema = SchemaGenerator(patterns=patterns).get_schema()
+
+        generator = SchemaGenerator(patterns=patterns)
+        generator.workers = 2
+        assert generator.get_schema() == schema
+
     def test_prefixed_paths_construction(self):
         """Construction of the `paths` key maintains a common prefix."""
         patterns = [
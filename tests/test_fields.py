@@ -1,3 +1,4 @@
+import copy
 import datetime
 import math
 import os
@@ -19,8 +20,8 @@ from django.utils.timezone import activate, deactivate, override
 import rest_framework
 from rest_framework import exceptions, serializers
 from rest_framework.fields import (
-    BuiltinSignatureError, DjangoImageField, SkipField, empty,
-    is_simple_callable
+    BuiltinSignatureError, ChoiceTable, DjangoImageField, SkipField, empty,
+    is_simple_callable, to_choices_dict
 )
 from rest_framework.utils import json
 from tests.models import UUIDForeignKeyTarget
@@ -1528,6 +1529,58 @@ class TestRoundingDecimalField(TestCase):
         assert 'Invalid rounding option' in str(excinfo.value)
 
 
+class TestNumericRepresentationColumn(TestCase):
+    """
+    Representing a column of numbers gives the same result as representing
+    each value in turn.
+    """
+    def assert_column(self, field, values):
+        expected = [field.to_representation(value) for value in values]
+        assert field.to_representation_column(values) == expected
+        return expected
+
+    def test_integer_column(self):
+        assert self.assert_column(serializers.IntegerField(), [1, '2', 3.0, True]) == [1, 2, 3, 1]
+
+    def test_float_column(self):
+        assert self.assert_column(serializers.FloatField(), [1, '2.5', Decimal('3.25')]) == [1.0, 2.5, 3.25]
+
+    def test_decimal_column(self):
+        values = [Decimal('1.234'), 2, '3.1', 4.5, None]
+        field = serializers.DecimalField(max_digits=5, decimal_places=2)
+        assert self.assert_column(field, values) == ['1.23', '2.00', '3.10', '4.50', '']
+
+        field = serializers.DecimalField(max_digits=5, decimal_places=2, coerce_to_string=False)
+        assert self.assert_column(field, values) == [
+            Decimal('1.23'), Decimal('2.00'), Decimal('3.10'), Decimal('4.50'), None
+        ]
+
+    def test_decimal_column_options(self):
+        values = [Decimal('1.234'), Decimal('1.000')]
+        assert self.assert_column(
+            serializers.DecimalField(max_digits=4, decimal_places=2, rounding=ROUND_UP), values
+        ) == ['1.24', '1.00']
+        assert self.assert_column(
+            serializers.DecimalField(max_digits=4, decimal_places=3, normalize_output=True), values
+        ) == ['1.234', '1']
+        assert self.assert_column(
+            serializers.DecimalField(max_digits=6, decimal_places=None), values
+        ) == ['1.234', '1.000']
+
+    @override_settings(LANGUAGE_CODE='pl')
+    def test_localized_decimal_column(self):
+        field = serializers.DecimalField(max_digits=2, decimal_places=1, localize=True)
+        assert self.assert_column(field, [Decimal('1.1')]) == ['1,1']
+
+    def test_custom_quantize(self):
+        class WholeDecimalField(serializers.DecimalField):
+            def quantize(self, value):
+                return value.to_integral_value()
+
+        field = WholeDecimalField(max_digits=4, decimal_places=2)
+        assert self.assert_column(field, [Decimal('1.6')]) == ['2']
+
+
 # Date & time serializers...
 class TestDateField(FieldValues):
     """
@@ -1749,6 +1802,60 @@ class TestCustomTimezoneForDateTimeField(TestCase):
         assert rendered_date == rendered_date_in_timezone
 
 
+@override_settings(TIME_ZONE='UTC', USE_TZ=True)
+class TestDateAndTimeRepresentationColumn(TestCase):
+    """
+    Representing a column of values gives the same result as representing
+    each value in turn.
+    """
+    values = [
+        datetime.datetime(2016, 12, 19, 10),
+        datetime.datetime(2016, 12, 19, 4, 30, tzinfo=utc),
+        '2016-12-19T10:00:00',
+        '',
+    ]
+
+    def assert_column(self, field, values):
+        expected = [field.to_representation(value) for value in values]
+        assert field.to_representation_column(values) == expected
+        return expected
+
+    def test_datetime_column(self):
+        field = serializers.DateTimeField()
+        assert self.assert_column(field, self.values) == [
+            '2016-12-19T10:00:00Z', '2016-12-19T04:30:00Z', '2016-12-19T10:00:00', None
+        ]
+
+    def test_datetime_column_uses_current_timezone(self):
+        field = serializers.DateTimeField()
+        with override(ZoneInfo('Asia/Kolkata')):
+            assert self.assert_column(field, self.values[:2]) == [
+                '2016-12-19T10:00:00+05:30', '2016-12-19T10:00:00+05:30'
+            ]
+
+    def test_datetime_column_custom_format(self):
+        self.assert_column(serializers.DateTimeField(format='%d/%m/%Y %H:%M'), self.values)
+        self.assert_column(serializers.DateTimeField(format=None), self.values)
+
+    def test_datetime_column_custom_to_representation(self):
+        class TimestampField(serializers.DateTimeField):
+            def to_representation(self, value):
+                return value.timestamp()
+
+        assert self.assert_column(TimestampField(), self.values[1:2]) == [1482121800.0]
+
+    def test_date_column(self):
+        values = [datetime.date(2001, 1, 1), '2001-01-01', None]
+        assert self.assert_column(serializers.DateField(), values) == ['2001-01-01', '2001-01-01', None]
+        with pytest.raises(AssertionError):
+            serializers.DateField().to_representation_column([datetime.datetime(2001, 1, 1)])
+
+    def test_time_column(self):
+        values = [datetime.time(13, 0), '13:00:00', '']
+        assert self.assert_column(serializers.TimeField(), values) == ['13:00:00', '13:00:00', None]
+        self.assert_column(serializers.TimeField(format='%I:%M%p'), values[:1])
+
+
 @patch('rest_framework.utils.timezone.datetime_ambiguous', return_value=True)
 class TestNaiveDayLightSavingTimeTimeZoneDateTimeField(FieldValues):
     """
@@ -2210,6 +2317,47 @@ class TestChoiceFieldWithMixedChoices(FieldValues):
     )
 
 
+class TestChoiceTable:
+    """
+    Choice tables are built once and shared with copies of the field.
+    """
+    choices = [('Group', (('a', 'A'), ('b', 'B'))), ('c', 'C')]
+
+    def test_copies_share_choice_table(self):
+        field = serializers.ChoiceField(choices=self.choices)
+        with patch('rest_framework.fields.to_choices_dict', wraps=to_choices_dict) as build:
+            clone = copy.deepcopy(field)
+        assert not build.called
+        assert clone.choice_table is field.choice_table
+        assert clone.choices == {'a': 'A', 'b': 'B', 'c': 'C'}
+        assert clone.grouped_choices == {'Group': {'a': 'A', 'b': 'B'}, 'c': 'C'}
+        assert clone.to_internal_value('b') == 'b'
+
+    def test_positional_choices(self):
+        field = serializers.ChoiceField(self.choices)
+        clone = copy.deepcopy(field)
+        assert clone.choice_table is field.choice_table
+        assert repr(clone) == repr(field) == "ChoiceField([('Group', (('a', 'A'), ('b', 'B'))), ('c', 'C')])"
+
+    def test_multiple_choice_field(self):
+        field = serializers.MultipleChoiceField(choices=self.choices)
+        clone = copy.deepcopy(field)
+        assert clone.choice_table is field.choice_table
+        assert clone.to_internal_value(['a', 'c']) == ['a', 'c']
+
+    def test_explicit_choice_table(self):
+        table = ChoiceTable(self.choices)
+        first = serializers.ChoiceField(choices=table)
+        second = serializers.MultipleChoiceField(choices=table)
+        assert first.choice_table is second.choice_table is table
+
+    def test_set_choices(self):
+        field = serializers.ChoiceField(choices=self.choices)
+        field.choices = ['x']
+        assert field.choices == {'x': 'x'}
+        assert field.choice_strings_to_values == {'x': 'x'}
+
+
 class TestMultipleChoiceField(FieldValues):
     """
     Valid and invalid values for `MultipleChoiceField`.
@@ -1,13 +1,17 @@
 import datetime
 from importlib import reload as reload_module
+from unittest import mock
 
 import pytest
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.core.exceptions import ImproperlyConfigured
-from django.db import models
+from django.db import connection, models
 from django.db.models import CharField, Transform
-from django.db.models.functions import Concat, Upper
+from django.db.models.functions import Concat, Lower, Upper
 from django.test import SimpleTestCase, TestCase
 from django.test.utils import override_settings
+from django.urls import path
 
 from rest_framework import filters, generics, serializers
 from rest_framework.exceptions import ValidationError
@@ -132,6 +136,20 @@ class SearchFilterTests(TestCase):
             {'id': 2, 'title': 'zz', 'text': 'bcd'}
         ]
 
+    def test_normalized_startswith_search(self):
+        class SearchListView(generics.ListAPIView):
+            queryset = SearchFilterModel.objects.all()
+            serializer_class = SearchFilterSerializer
+            filter_backends = (filters.SearchFilter,)
+            search_fields = ('~text',)
+
+        view = SearchListView.as_view()
+        request = factory.get('/', {'search': '"THE LONG"'})
+        response = view(request)
+        assert response.data == [
+            {'id': 11, 'title': 'A title', 'text': 'The long text'}
+        ]
+
     def test_regexp_search(self):
         class SearchListView(generics.ListAPIView):
             queryset = SearchFilterModel.objects.all()
@@ -317,6 +335,42 @@ class SearchFilterTests(TestCase):
             {'id': 11, 'title': 'A title', 'text': 'The long text'},
         ]
 
+    def test_search_plan_is_cached_per_view_class(self):
+        class SearchListView(generics.ListAPIView):
+            queryset = SearchFilterModel.objects.all()
+            serializer_class = SearchFilterSerializer
+            filter_backends = (filters.SearchFilter,)
+            search_fields = ('title', 'text')
+
+        view = SearchListView.as_view()
+        with mock.patch.object(
+            filters.SearchFilter, 'construct_search', autospec=True,
+            side_effect=filters.SearchFilter.construct_search
+        ) as construct_search:
+            for term in ('b', 'c'):
+                response = view(factory.get('/', {'search': term}))
+                assert response.status_code == 200
+        assert construct_search.call_count == 2
+
+    def test_search_plan_cache_is_bounded(self):
+        class RequestSearchFilter(filters.SearchFilter):
+            search_plan_cache_size = 2
+            _search_plans = {}
+
+            def get_search_fields(self, view, request):
+                return (request.query_params['field'],)
+
+        class SearchListView(generics.ListAPIView):
+            queryset = SearchFilterModel.objects.all()
+            serializer_class = SearchFilterSerializer
+            filter_backends = (RequestSearchFilter,)
+
+        view = SearchListView.as_view()
+        for field in ('title', 'text', '=title'):
+            response = view(factory.get('/', {'search': 'b', 'field': field}))
+            assert response.status_code == 200
+        assert [key[2] for key in RequestSearchFilter._search_plans] == [('text',), ('=title',)]
+
 
 @pytest.mark.requires_postgres
 class SearchFilterFullTextTests(TestCase):
@@ -421,6 +475,74 @@ class SearchFilterFullTextTests(TestCase):
         assert response.data[0]['title'] == 'A bright sunny day'
 
 
+class FullTextSearchFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        SearchFilterModel.objects.create(title='The quick brown fox', text='jumps over the lazy dog')
+        SearchFilterModel.objects.create(title='The slow brown turtle', text='crawls under the fence')
+        SearchFilterModel.objects.create(title='A bright sunny day', text='in the park with friends')
+
+    def get_view(self, **attrs):
+        attrs.setdefault('queryset', SearchFilterModel.objects.all())
+        attrs.setdefault('serializer_class', SearchFilterSerializer)
+        attrs.setdefault('filter_backends', (filters.FullTextSearchFilter,))
+        attrs.setdefault('search_fields', ('title', 'text'))
+        return type('SearchListView', (generics.ListAPIView,), attrs).as_view()
+
+    def test_no_search_terms(self):
+        response = self.get_view()(factory.get('/'))
+        assert len(response.data) == 3
+
+    def test_multiple_terms_must_all_match(self):
+        response = self.get_view()(factory.get('/', {'search': 'brown lazy'}))
+        assert [item['title'] for item in response.data] == ['The quick brown fox']
+
+    @pytest.mark.skipif(connection.vendor == 'postgresql', reason='Fallback is only used off PostgreSQL')
+    def test_falls_back_to_search_filter_lookups(self):
+        # Partial matches are only possible with the `icontains` fallback.
+        response = self.get_view()(factory.get('/', {'search': 'brow'}))
+        assert {item['title'] for item in response.data} == {
+            'The quick brown fox', 'The slow brown turtle'
+        }
+
+    @pytest.mark.requires_postgres
+    def test_full_text_search_stemming(self):
+        response = self.get_view()(factory.get('/', {'search': 'jumping'}))
+        assert [item['title'] for item in response.data] == ['The quick brown fox']
+
+    @pytest.mark.requires_postgres
+    def test_ordering_by_search_rank(self):
+        SearchFilterModel.objects.create(title='Brown', text='brown brown brown')
+        view = self.get_view(
+            filter_backends=(filters.FullTextSearchFilter, filters.OrderingFilter),
+            ordering_fields=('search_rank',),
+        )
+        response = view(factory.get('/', {'search': 'brown', 'ordering': '-search_rank'}))
+        assert response.data[0]['title'] == 'Brown'
+        assert len(response.data) == 3
+
+    def test_ordering_by_search_rank_without_search_terms(self):
+        view = self.get_view(
+            filter_backends=(filters.FullTextSearchFilter, filters.OrderingFilter),
+            ordering_fields=('search_rank',),
+        )
+        response = view(factory.get('/', {'ordering': '-search_rank'}))
+        assert response.status_code == 200
+        assert len(response.data) == 3
+
+    @pytest.mark.skipif(connection.vendor == 'postgresql', reason='Fallback is only used off PostgreSQL')
+    def test_ordering_by_search_rank_in_fallback(self):
+        view = self.get_view(
+            filter_backends=(filters.FullTextSearchFilter, filters.OrderingFilter),
+            ordering_fields=('search_rank',),
+        )
+        response = view(factory.get('/', {'search': 'brown', 'ordering': '-search_rank'}))
+        assert response.status_code == 200
+        assert {item['title'] for item in response.data} == {
+            'The quick brown fox', 'The slow brown turtle'
+        }
+
+
 class AttributeModel(models.Model):
     label = models.CharField(max_length=32)
 
@@ -473,6 +595,78 @@ class SearchFilterFkTests(TestCase):
         filter_ = filters.SearchFilter()
         assert 'title__search' == filter_.construct_search('@title', SearchFilterModelFk._meta)
 
+    def test_construct_search_with_trigram_and_prefix_index_prefixes(self):
+        filter_ = filters.SearchFilter()
+        assert 'title__trigram_similar' == filter_.construct_search('%title', SearchFilterModelFk._meta)
+        assert 'title__lower__startswith' == filter_.construct_search('~title', SearchFilterModelFk._meta)
+
+
+class SearchIndexModel(models.Model):
+    slug = models.CharField(max_length=20, db_index=True)
+    code = models.CharField(max_length=20)
+    title = models.CharField(max_length=20)
+    text = models.TextField()
+    body = models.TextField()
+    attribute = models.ForeignKey(AttributeModel, on_delete=models.CASCADE)
+
+    class Meta:
+        managed = False
+        indexes = [
+            models.Index(fields=['code', 'title'], name='search_index_code_idx'),
+            models.Index(Upper('title'), name='search_index_upper_title_idx'),
+            models.Index(Lower('body').desc(), name='search_index_lower_body_idx'),
+            GinIndex(fields=['text'], name='search_index_text_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(SearchVector('body'), name='search_index_body_idx'),
+        ]
+
+
+class SearchIndexListView(generics.ListAPIView):
+    queryset = SearchIndexModel.objects.all()
+    filter_backends = (filters.SearchFilter,)
+    search_fields = ('=title', 'title')
+
+
+urlpatterns = [
+    path('search-index/', SearchIndexListView.as_view()),
+]
+
+
+class SearchFilterIndexTests(SimpleTestCase):
+
+    def test_get_unindexed_search_fields(self):
+        filter_ = filters.SearchFilter()
+        search_fields = [
+            '=slug', '~code', '=title', 'text', '%text', '@body', '^title', 'title', 'attribute__label',
+            '~body', 'code__exact',
+        ]
+        unindexed = filter_.get_unindexed_search_fields(SearchIndexModel.objects.all(), search_fields)
+        assert unindexed == ['=slug', '~code', 'title', 'attribute__label']
+
+    def test_case_insensitive_lookups_require_an_expression_index(self):
+        filter_ = filters.SearchFilter()
+        queryset = SearchIndexModel.objects.all()
+        # `db_index` creates an index on the column, not on `UPPER(column)`.
+        assert filter_.get_unindexed_search_fields(queryset, ['slug__exact', '=slug', '^slug']) == ['=slug', '^slug']
+
+    def test_unaccented_lookups_are_not_indexed(self):
+        filter_ = filters.UnaccentedSearchFilter()
+        queryset = SearchIndexModel.objects.all()
+        assert filter_.get_unindexed_search_fields(queryset, ['~body', '=title', '%text']) == ['~body', '=title', '%text']
+
+    def test_btree_index_does_not_serve_contains_lookups(self):
+        filter_ = filters.SearchFilter()
+        queryset = SearchIndexModel.objects.all()
+        assert filter_.get_unindexed_search_fields(queryset, ['slug', '$code']) == ['slug', '$code']
+
+    @override_settings(ROOT_URLCONF='tests.test_filters')
+    def test_system_check(self):
+        from rest_framework.checks import search_fields_index_system_check
+
+        errors = search_fields_index_system_check(app_configs=None)
+        assert [error.id for error in errors] == ['rest_framework.W002']
+        assert "'title'" in errors[0].msg
+        assert errors[0].obj is SearchIndexListView
+
 
 class SearchFilterModelM2M(models.Model):
     title = models.CharField(max_length=20)
@@ -521,6 +715,20 @@ class SearchFilterM2MTests(TestCase):
         response = view(request)
         assert len(response.data) == 1
 
+    @pytest.mark.requires_postgres
+    def test_full_text_search_m2m_ranked_without_duplicates(self):
+        class SearchListView(generics.ListAPIView):
+            queryset = SearchFilterModelM2M.objects.all()
+            serializer_class = SearchFilterM2MSerializer
+            filter_backends = (filters.FullTextSearchFilter,)
+            search_fields = ('title', 'attributes__label')
+
+        view = SearchListView()
+        view.request = view.initialize_request(factory.get('/', {'search': 'www'}))
+        results = view.filter_queryset(view.get_queryset())
+        assert [result.title for result in results] == ['zz']
+        assert results[0].search_rank > 0
+
     def test_must_call_distinct(self):
         filter_ = filters.SearchFilter()
         prefixes = [''] + list(filter_.lookup_prefixes)
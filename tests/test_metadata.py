@@ -1,11 +1,16 @@
+from unittest import mock
+
 import pytest
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.test import TestCase
+from django.utils import translation
 
 from rest_framework import (
-    exceptions, metadata, serializers, status, versioning, views
+    exceptions, generics, metadata, serializers, status, versioning, views,
+    viewsets
 )
+from rest_framework.permissions import BasePermission
 from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.test import APIRequestFactory
 
@@ -332,6 +337,103 @@ class TestSimpleMetadataFieldInfo(TestCase):
         assert field_info['decimal_places'] == 4
 
 
+class TestCachedMetadata(TestCase):
+    def setUp(self):
+        metadata.CachedMetadata._cache.clear()
+
+        class ExampleSerializer(serializers.Serializer):
+            char_field = serializers.CharField(max_length=20)
+
+        class DenyPut(BasePermission):
+            def has_permission(self, request, view):
+                return request.method != 'PUT' or view.allow_put
+
+        class ExampleView(generics.GenericAPIView):
+            metadata_class = metadata.CachedMetadata
+            cache_metadata = True
+            permission_classes = [DenyPut]
+            serializer_class = ExampleSerializer
+            allow_put = True
+
+            def get_object(self):
+                return None
+
+            def post(self, request):
+                pass
+
+            def put(self, request):
+                pass
+
+        self.view_class = ExampleView
+
+    def test_field_info_is_cached(self):
+        view = self.view_class.as_view()
+        with mock.patch.object(
+            metadata.SimpleMetadata, 'get_serializer_info', autospec=True,
+            side_effect=metadata.SimpleMetadata.get_serializer_info
+        ) as get_serializer_info:
+            first = view(request=request)
+            second = view(request=request)
+        assert get_serializer_info.call_count == 2
+        assert first.data == second.data
+        assert first.data['actions']['POST'] == {
+            'char_field': {
+                'type': 'string',
+                'required': True,
+                'read_only': False,
+                'label': 'Char field',
+                'max_length': 20
+            }
+        }
+
+    def test_views_must_opt_in_to_caching(self):
+        view = self.view_class.as_view(cache_metadata=False)
+        with mock.patch.object(
+            metadata.SimpleMetadata, 'get_serializer_info', autospec=True,
+            side_effect=metadata.SimpleMetadata.get_serializer_info
+        ) as get_serializer_info:
+            view(request=request)
+            view(request=request)
+        assert get_serializer_info.call_count == 4
+        assert metadata.CachedMetadata._cache == {}
+
+    def test_cache_size_is_bounded(self):
+        class LimitedMetadata(metadata.CachedMetadata):
+            cache_size = 1
+
+        view = self.view_class.as_view(metadata_class=LimitedMetadata)
+        view(request=request)
+        assert len(metadata.CachedMetadata._cache) == 1
+
+    def test_permissions_are_checked_on_each_request(self):
+        response = self.view_class.as_view()(request=request)
+        assert set(response.data['actions']) == {'PUT', 'POST'}
+        response = self.view_class.as_view(allow_put=False)(request=request)
+        assert set(response.data['actions']) == {'POST'}
+
+    def test_precompute(self):
+        view = self.view_class.as_view()
+        metadata.CachedMetadata().precompute(view)
+        with mock.patch.object(metadata.SimpleMetadata, 'get_serializer_info') as get_serializer_info:
+            response = view(request=request)
+        assert not get_serializer_info.called
+        assert set(response.data['actions']) == {'PUT', 'POST'}
+
+    def test_precompute_viewset(self):
+        class ExampleViewSet(viewsets.GenericViewSet):
+            serializer_class = serializers.Serializer
+            cache_metadata = True
+
+            def create(self, request):
+                pass
+
+        view = ExampleViewSet.as_view({'post': 'create'})
+        metadata.CachedMetadata().precompute(view)
+        assert list(metadata.CachedMetadata._cache) == [
+            (ExampleViewSet, 'POST', translation.get_language(), serializers.Serializer)
+        ]
+
+
 class TestModelSerializerMetadata(TestCase):
     def test_read_only_primary_key_related_field(self):
         """
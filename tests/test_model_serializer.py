@@ -27,6 +27,7 @@ from django.test import TestCase
 from rest_framework import serializers
 from rest_framework.compat import postgres_fields
 from rest_framework.fields import ChoiceField
+from rest_framework.utils.field_mapping import get_choice_table
 
 from .models import NestedForeignKeySource
 
@@ -381,6 +382,22 @@ class TestRegularFieldMappings(TestCase):
         assert non_editable_choice_field.read_only is True
         assert non_editable_choice_field.choices
 
+    def test_choice_table_is_shared(self):
+        class ExampleSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = ChoicesModel
+                fields = ('non_editable_choice_field',)
+
+        first = ExampleSerializer().fields['non_editable_choice_field']
+        second = ExampleSerializer().fields['non_editable_choice_field']
+        assert first.choice_table is second.choice_table
+        assert first.choices == {'red': 'Red', 'blue': 'Blue', 'green': 'Green'}
+
+    def test_callable_choices_are_not_cached(self):
+        model_field = models.CharField(max_length=10, choices=lambda: [('a', 'A')])
+        assert get_choice_table(model_field).choices == {'a': 'A'}
+        assert get_choice_table(model_field) is not get_choice_table(model_field)
+
 
 class TestDurationFieldMapping(TestCase):
     def test_duration_field(self):
@@ -1,17 +1,26 @@
+import datetime
+import hashlib
 import io
 import math
+import os
+import shutil
+import tempfile
+from unittest import mock
 
 import pytest
 from django import forms
+from django.core.files.uploadedfile import UploadedFile
 from django.core.files.uploadhandler import (
-    MemoryFileUploadHandler, TemporaryFileUploadHandler
+    FileUploadHandler, MemoryFileUploadHandler, TemporaryFileUploadHandler
 )
 from django.http.request import RawPostDataException
 from django.test import TestCase
 
+from rest_framework.compat import cbor2, msgpack
 from rest_framework.exceptions import ParseError
 from rest_framework.parsers import (
-    FileUploadParser, FormParser, JSONParser, MultiPartParser
+    CBORParser, FileUploadParser, FormParser, JSONArrayStream, JSONParser,
+    JSONStreamParser, MessagePackParser, MultiPartParser, NDJSONParser
 )
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
@@ -35,6 +44,57 @@ class TestFormParser(TestCase):
 
         assert Form(data).is_valid() is True
 
+    def test_parse_bytes(self):
+        parser = FormParser()
+
+        data = parser.parse_bytes(memoryview(self.string.encode()))
+
+        assert Form(data).is_valid() is True
+
+
+class LocalDiskUploadHandler(FileUploadHandler):
+    """
+    Writes each chunk straight to its final location, in the way that a
+    handler for an object store would.
+    """
+    chunk_size = 4
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+        self.chunks = []
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.path = os.path.join(self.directory, self.file_name)
+        self.destination = open(self.path, 'wb')
+
+    def receive_data_chunk(self, raw_data, start):
+        self.chunks.append(raw_data)
+        self.destination.write(raw_data)
+
+    def file_complete(self, file_size):
+        self.destination.close()
+        return UploadedFile(name=self.file_name, size=file_size, content_type=self.content_type)
+
+    def upload_interrupted(self):
+        self.destination.close()
+        os.remove(self.path)
+
+
+class RawInputUploadHandler(FileUploadHandler):
+    """
+    Takes over reading the whole request body, in the way that a handler
+    that streams to a remote service would.
+    """
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        self.interrupted = False
+        content = b''.join(iter(lambda: input_data.read(4), b''))
+        return {}, UploadedFile(name='file.txt', size=len(content))
+
+    def upload_interrupted(self):
+        self.interrupted = True
+
 
 class TestFileUploadParser(TestCase):
     def setUp(self):
@@ -48,6 +108,8 @@ class TestFileUploadParser(TestCase):
             'HTTP_CONTENT_LENGTH': 14,
         }
         self.parser_context = {'request': request, 'kwargs': {}}
+        self.upload_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.upload_dir)
 
     def test_parse(self):
         """
@@ -120,6 +182,58 @@ class TestFileUploadParser(TestCase):
         filename = parser.get_filename(self.stream, None, self.parser_context)
         assert filename == 'ÀĥƦ.txt'
 
+    def test_max_upload_size_checked_before_reading(self):
+        parser = FileUploadParser()
+        parser.max_upload_size = 10
+        stream = mock.Mock(spec=io.BytesIO)
+        with pytest.raises(ParseError) as excinfo:
+            parser.parse(stream, None, self.parser_context)
+        assert str(excinfo.value) == 'Upload exceeds the maximum size of 10 bytes.'
+        assert not stream.read.called
+
+    def test_max_upload_size_checked_while_streaming(self):
+        parser = FileUploadParser()
+        parser.max_upload_size = 10
+        handler = LocalDiskUploadHandler(self.upload_dir)
+        self.parser_context['request'].upload_handlers = (handler,)
+        self.parser_context['request'].META['HTTP_CONTENT_LENGTH'] = 4
+        with pytest.raises(ParseError) as excinfo:
+            parser.parse(self.stream, None, self.parser_context)
+        assert str(excinfo.value) == 'Upload exceeds the maximum size of 10 bytes.'
+        assert handler.chunks == [b'Test', b' tex']
+        assert os.listdir(self.upload_dir) == []
+
+    def test_direct_to_storage_handler_with_checksum(self):
+        parser = FileUploadParser()
+        parser.checksum_algorithm = 'sha256'
+        handler = LocalDiskUploadHandler(self.upload_dir)
+        self.parser_context['request'].upload_handlers = (handler,)
+        file_obj = parser.parse(self.stream, None, self.parser_context).files['file']
+        assert handler.chunks == [b'Test', b' tex', b't fi', b'le']
+        assert file_obj.checksum == hashlib.sha256(b'Test text file').hexdigest()
+        with open(os.path.join(self.upload_dir, 'file.txt'), 'rb') as stored:
+            assert stored.read() == b'Test text file'
+        assert file_obj.size == 14
+
+    def test_raw_input_handler_with_checksum(self):
+        parser = FileUploadParser()
+        parser.checksum_algorithm = 'sha256'
+        self.parser_context['request'].upload_handlers = (RawInputUploadHandler(),)
+        file_obj = parser.parse(self.stream, None, self.parser_context).files['file']
+        assert file_obj.checksum == hashlib.sha256(b'Test text file').hexdigest()
+        assert file_obj.size == 14
+
+    def test_max_upload_size_checked_by_raw_input_handler(self):
+        parser = FileUploadParser()
+        parser.max_upload_size = 10
+        handler = RawInputUploadHandler()
+        self.parser_context['request'].upload_handlers = (handler,)
+        self.parser_context['request'].META['HTTP_CONTENT_LENGTH'] = 4
+        with pytest.raises(ParseError) as excinfo:
+            parser.parse(self.stream, None, self.parser_context)
+        assert str(excinfo.value) == 'Upload exceeds the maximum size of 10 bytes.'
+        assert handler.interrupted
+
     def __replace_content_disposition(self, disposition):
         self.parser_context['request'].META['HTTP_CONTENT_DISPOSITION'] = disposition
 
@@ -141,6 +255,168 @@ class TestJSONParser(TestCase):
         assert parser.parse(self.bytes('-Infinity')) == float('-inf')
         assert math.isnan(parser.parse(self.bytes('NaN')))
 
+    def test_parse_bytes(self):
+        parser = JSONParser()
+
+        assert parser.parse_bytes(b'{"a": ["\xc3\xa9"]}') == {'a': ['\xe9']}
+        assert parser.parse_bytes(memoryview(b'[1, 2]')) == [1, 2]
+        assert parser.parse_bytes('"\xe9"'.encode('latin-1'), None, {'encoding': 'latin-1'}) == '\xe9'
+
+        for value in [b'Infinity', b'{"a": ', b'"\xff"']:
+            with pytest.raises(ParseError):
+                parser.parse_bytes(value)
+
+    def test_parse_bytes_uses_overridden_parse(self):
+        class CustomJSONParser(JSONParser):
+            def parse(self, stream, media_type=None, parser_context=None):
+                return {'parsed': stream.read()}
+
+        assert CustomJSONParser().parse_bytes(b'[]') == {'parsed': b'[]'}
+
+    def test_request_parses_body_bytes(self):
+        factory = APIRequestFactory()
+        request = Request(factory.post('/', {'a': [1]}, format='json'), parsers=[JSONParser()])
+
+        with mock.patch.object(JSONParser, 'parse', autospec=True) as parse:
+            assert request.data == {'a': [1]}
+        assert not parse.called
+        assert request.body == b'{"a":[1]}'
+
+
+class TestJSONStreamParser(TestCase):
+    content = ' [1, 23456, {"a": "\xe9", "b": [1.5e3, null]}, "x", true] '
+
+    def parse(self, content, chunk_size=64 * 1024, **context):
+        parser = JSONStreamParser()
+        parser.chunk_size = chunk_size
+        return parser.parse(io.BytesIO(content.encode()), None, context)
+
+    def test_parse(self):
+        expected = [1, 23456, {'a': '\xe9', 'b': [1500.0, None]}, 'x', True]
+        for chunk_size in (1, 2, 3, 7, 1024):
+            assert list(self.parse(self.content, chunk_size)) == expected
+
+    def test_parse_is_incremental(self):
+        stream = self.parse('[' + ', '.join(['"%s"' % ('x' * 100)] * 100) + ']', chunk_size=128)
+        assert next(stream) == 'x' * 100
+        assert len(stream.buffer) < 500
+
+    def test_empty_array(self):
+        assert list(self.parse(' [ ] ')) == []
+
+    def test_not_an_array(self):
+        for content in ['', '{}', '1']:
+            with pytest.raises(ParseError):
+                self.parse(content)
+
+    def test_invalid_items(self):
+        for content in ['[1,', '[1 2]', '[1] x', '[1,]', '[1.5e]', '[NaN]']:
+            with pytest.raises(ParseError):
+                list(self.parse(content, chunk_size=2))
+
+    def test_invalid_item_stops_the_parse(self):
+        stream = io.BytesIO(('[1, {"a": tru}, ' + ', '.join(['2'] * 1000) + ']').encode())
+        parser = JSONStreamParser()
+        parser.chunk_size = 16
+        items = parser.parse(stream, None, {})
+        assert next(items) == 1
+        with pytest.raises(ParseError):
+            next(items)
+        assert stream.tell() < 100
+
+    def test_float_strictness(self):
+        parser = JSONStreamParser()
+        parser.strict = False
+        assert math.isinf(next(parser.parse(io.BytesIO(b'[Infinity]'))))
+
+    def test_request_data_is_streamed(self):
+        factory = APIRequestFactory()
+        django_request = factory.post('/', [{'a': 1}, {'b': 2}], format='json')
+        request = Request(django_request, parsers=[JSONStreamParser()])
+
+        assert isinstance(request.data, JSONArrayStream)
+        assert list(request.data) == [{'a': 1}, {'b': 2}]
+
+
+class TestNDJSONParser(TestCase):
+    def parse(self, content):
+        return NDJSONParser().parse(io.BytesIO(content))
+
+    def test_parse(self):
+        content = b'{"a": 1}\n\n  [2, "\xc3\xa9"]\r\n3'
+        assert list(self.parse(content)) == [{'a': 1}, [2, '\xe9'], 3]
+
+    def test_parse_is_lazy(self):
+        items = self.parse(b'1\n{invalid\n')
+        assert next(items) == 1
+        with pytest.raises(ParseError) as excinfo:
+            next(items)
+        assert str(excinfo.value).startswith('JSON parse error on line 2')
+
+    def test_float_strictness(self):
+        with pytest.raises(ParseError):
+            list(self.parse(b'NaN'))
+
+    def test_request_data(self):
+        factory = APIRequestFactory()
+        django_request = factory.post('/', b'{"a": 1}\n{"b": 2}\n', content_type='application/x-ndjson')
+        request = Request(django_request, parsers=[JSONParser(), NDJSONParser()])
+
+        assert list(request.data) == [{'a': 1}, {'b': 2}]
+
+
+@pytest.mark.skipif(msgpack is None, reason='msgpack is required.')
+class TestMessagePackParser(TestCase):
+    def test_parse(self):
+        content = msgpack.packb({'a': [1, 2.5, None, 'caf\xe9'], 'b': b'\x00'})
+        data = MessagePackParser().parse(io.BytesIO(content))
+        assert data == {'a': [1, 2.5, None, 'caf\xe9'], 'b': b'\x00'}
+
+    def test_parse_error(self):
+        for content in [b'', b'\xc1', b'\x01\x02']:
+            with pytest.raises(ParseError):
+                MessagePackParser().parse(io.BytesIO(content))
+
+    def test_request_data(self):
+        factory = APIRequestFactory()
+        django_request = factory.post('/', msgpack.packb({'a': 1}), content_type='application/msgpack')
+        request = Request(django_request, parsers=[JSONParser(), MessagePackParser()])
+        assert request.data == {'a': 1}
+
+
+@pytest.mark.skipif(cbor2 is None, reason='cbor2 is required.')
+class TestCBORParser(TestCase):
+    def test_parse(self):
+        content = cbor2.dumps({'a': [1, 2.5, None, 'caf\xe9'], 'b': b'\x00'})
+        data = CBORParser().parse(io.BytesIO(content))
+        assert data == {'a': [1, 2.5, None, 'caf\xe9'], 'b': b'\x00'}
+
+    def test_parse_error(self):
+        for content in [b'', b'\xff\xff', b'\x82\x01']:
+            with pytest.raises(ParseError):
+                CBORParser().parse(io.BytesIO(content))
+
+    def test_parse_standard_tags(self):
+        value = {'when': datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc), 'big': 2 ** 80}
+        assert CBORParser().parse(io.BytesIO(cbor2.dumps(value))) == value
+
+    def test_cyclic_data_is_rejected(self):
+        # A shareable array (tag 28) containing a reference to itself (tag 29).
+        content = bytes([0xd8, 0x1c, 0x81, 0xd8, 0x1d, 0x00])
+        with pytest.raises(ParseError):
+            CBORParser().parse(io.BytesIO(content))
+
+    def test_non_json_values_are_rejected(self):
+        for value in [
+            cbor2.CBORTag(35, '^a+$'),  # regular expression
+            cbor2.CBORTag(1000, 1),  # unknown tag
+            {1, 2},
+            [cbor2.undefined],
+            {(1, 2): 'tuple key'},
+        ]:
+            with pytest.raises(ParseError):
+                CBORParser().parse(io.BytesIO(cbor2.dumps(value)))
+
 
 class TestPOSTAccessed(TestCase):
     def setUp(self):
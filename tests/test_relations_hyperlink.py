@@ -175,6 +175,18 @@ class HyperlinkedManyToManyTests(TestCase):
         ]
         assert serializer.data == expected
 
+    def test_many_to_many_validation_fetches_targets_together(self):
+        data = {'name': 'source-4', 'targets': ['http://testserver/manytomanytarget/3/', '/manytomanytarget/1/']}
+        serializer = ManyToManySourceSerializer(data=data, context={'request': request})
+        with self.assertNumQueries(1):
+            assert serializer.is_valid()
+        assert [target.pk for target in serializer.validated_data['targets']] == [3, 1]
+
+        data['targets'].append('/manytomanytarget/9/')
+        serializer = ManyToManySourceSerializer(data=data, context={'request': request})
+        assert not serializer.is_valid()
+        assert serializer.errors == {'targets': ['Invalid hyperlink - Object does not exist.']}
+
     def test_reverse_many_to_many_create(self):
         data = {'url': 'http://testserver/manytomanytarget/4/', 'name': 'target-4', 'sources': ['http://testserver/manytomanysource/1/', 'http://testserver/manytomanysource/3/']}
         serializer = ManyToManyTargetSerializer(data=data, context={'request': request})
@@ -459,3 +471,38 @@ class HyperlinkedNullableOneToOneTests(TestCase):
             {'url': 'http://testserver/onetoonetarget/2/', 'name': 'target-2', 'nullable_source': None},
         ]
         assert serializer.data == expected
+
+
+@override_settings(ROOT_URLCONF='tests.test_relations_hyperlink')
+class HyperlinkedURLTemplateTests(TestCase):
+    def setUp(self):
+        self.field = serializers.HyperlinkedRelatedField(
+            view_name='manytomanytarget-detail', read_only=True
+        )
+        self.calls = []
+        reverse = self.field.reverse
+
+        def counting_reverse(*args, **kwargs):
+            self.calls.append(kwargs['kwargs'])
+            return reverse(*args, **kwargs)
+
+        self.field.reverse = counting_reverse
+
+    def get_url(self, pk, request):
+        return self.field.get_url(ManyToManyTarget(pk=pk), self.field.view_name, request, None)
+
+    def test_similar_lookup_values_reuse_url_template(self):
+        request = factory.get('/')
+        urls = [self.get_url(pk, request) for pk in range(10, 100)]
+        assert urls == ['http://testserver/manytomanytarget/%d/' % pk for pk in range(10, 100)]
+        assert self.calls == [{'pk': 10}, {'pk': '21'}]
+
+    def test_url_templates_are_per_request(self):
+        assert self.get_url(1, factory.get('/')) == 'http://testserver/manytomanytarget/1/'
+        assert self.get_url(2, factory.get('/')) == 'http://testserver/manytomanytarget/2/'
+        assert len(self.calls) == 4
+
+    def test_no_url_template_without_request(self):
+        assert self.get_url(1, None) == '/manytomanytarget/1/'
+        assert self.get_url(2, None) == '/manytomanytarget/2/'
+        assert self.calls == [{'pk': 1}, {'pk': 2}]
@@ -189,6 +189,25 @@ class PKManyToManyTests(TestCase):
         ]
         assert serializer.data == expected
 
+    def test_many_to_many_validation_fetches_targets_together(self):
+        data = {'name': 'source-4', 'targets': [3, 1, 2, 1]}
+        serializer = ManyToManySourceSerializer(data=data)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid()
+        targets = serializer.validated_data['targets']
+        assert [target.name for target in targets] == ['target-3', 'target-1', 'target-2', 'target-1']
+
+    def test_many_to_many_validation_reports_missing_pk(self):
+        data = {'name': 'source-4', 'targets': [1, 'foo', 9]}
+        serializer = ManyToManySourceSerializer(data=data)
+        assert not serializer.is_valid()
+        assert serializer.errors == {'targets': ['Incorrect type. Expected pk value, received str.']}
+
+        data = {'name': 'source-4', 'targets': [1, 9, 'foo']}
+        serializer = ManyToManySourceSerializer(data=data)
+        assert not serializer.is_valid()
+        assert serializer.errors == {'targets': ['Invalid pk "9" - object does not exist.']}
+
     def test_many_to_many_unsaved(self):
         source = ManyToManySource(name='source-unsaved')
 
@@ -336,6 +355,30 @@ class PKForeignKeyTests(TestCase):
         ]
         assert serializer.data == expected
 
+    def test_foreign_key_create_many_fetches_targets_together(self):
+        data = [
+            {'name': 'source-4', 'target': 2},
+            {'name': 'source-5', 'target': 1},
+            {'name': 'source-6', 'target': 2},
+        ]
+        serializer = ForeignKeySourceSerializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid()
+        assert [item['target'].name for item in serializer.validated_data] == ['target-2', 'target-1', 'target-2']
+
+    def test_foreign_key_create_many_reports_missing_pk(self):
+        data = [
+            {'name': 'source-4', 'target': 2},
+            {'name': 'source-5', 'target': 9},
+            {'name': 'source-6', 'target': True},
+        ]
+        serializer = ForeignKeySourceSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == {
+            1: {'target': ['Invalid pk "9" - object does not exist.']},
+            2: {'target': ['Incorrect type. Expected pk value, received bool.']},
+        }
+
     def test_reverse_foreign_key_create(self):
         data = {'id': 3, 'name': 'target-3', 'sources': [1, 3]}
         serializer = ForeignKeyTargetSerializer(data=data)
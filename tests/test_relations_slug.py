@@ -138,6 +138,20 @@ class SlugForeignKeyTests(TestCase):
         ]
         assert serializer.data == expected
 
+    def test_reverse_foreign_key_update_fetches_sources_together(self):
+        data = {'name': 'target-2', 'sources': ['source-1', 'source-3', 'source-9']}
+        instance = ForeignKeyTarget.objects.get(pk=2)
+        serializer = ForeignKeyTargetSerializer(instance, data=data)
+        with self.assertNumQueries(2):
+            assert not serializer.is_valid()
+        assert serializer.errors == {'sources': ['Object with name=source-9 does not exist.']}
+
+        data['sources'] = ['source-3', 'source-1']
+        serializer = ForeignKeyTargetSerializer(instance, data=data)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid()
+        assert [source.pk for source in serializer.validated_data['sources']] == [3, 1]
+
     def test_foreign_key_create(self):
         data = {'id': 4, 'name': 'source-4', 'target': 'target-2'}
         serializer = ForeignKeySourceSerializer(data=data)
@@ -1,23 +1,33 @@
 import re
 from collections.abc import MutableMapping
-from datetime import datetime
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest import mock
+from uuid import UUID
 from zoneinfo import ZoneInfo
 
 import pytest
 from django.core.cache import cache
 from django.db import models
+from django.http import StreamingHttpResponse
 from django.http.request import HttpRequest
 from django.test import TestCase, override_settings
 from django.urls import include, path, re_path
 from django.utils.safestring import SafeText
 from django.utils.translation import gettext_lazy as _
 
-from rest_framework import permissions, serializers, status
+from rest_framework import (
+    generics, permissions, renderers, serializers, status
+)
+from rest_framework.compat import cbor2, msgpack, pyarrow
 from rest_framework.decorators import action
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import BasePermission
 from rest_framework.renderers import (
-    AdminRenderer, BaseRenderer, BrowsableAPIRenderer, HTMLFormRenderer,
-    JSONRenderer, StaticHTMLRenderer
+    AdminRenderer, ArrowRenderer, BaseRenderer, BrowsableAPIRenderer,
+    CBORRenderer, CSVRenderer, HTMLFormRenderer, JSONRenderer,
+    MessagePackRenderer, NDJSONRenderer, StaticHTMLRenderer,
+    clear_form_renderer_cache
 )
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -392,6 +402,322 @@ class JSONRendererTests(TestCase):
         self.assertEqual(strip_trailing_whitespace(content.decode()), _indented_repr)
 
 
+class NDJSONRendererTests(TestCase):
+    """
+    Tests specific to the newline delimited JSON renderer.
+    """
+
+    def test_render_list(self):
+        data = [{'a': 1, 'b': 'caf\xe9'}, {'a': 2}]
+        content = NDJSONRenderer().render(data)
+        assert content == b'{"a":1,"b":"caf\xc3\xa9"}\n{"a":2}\n'
+
+    def test_render_single_item(self):
+        assert NDJSONRenderer().render({'detail': 'Not found.'}) == b'{"detail":"Not found."}\n'
+        assert NDJSONRenderer().render(None) == b''
+
+    def test_render_lines(self):
+        lines = NDJSONRenderer().render_lines(iter([1, [2], {'three': 3}]))
+        assert next(lines) == b'1\n'
+        assert list(lines) == [b'[2]\n', b'{"three":3}\n']
+
+    def test_negotiated_by_format(self):
+        class ListView(APIView):
+            renderer_classes = (JSONRenderer, NDJSONRenderer)
+
+            def get(self, request, *args, **kwargs):
+                return Response([{'a': 1}, {'a': 2}])
+
+        request = APIRequestFactory().get('/', HTTP_ACCEPT='application/x-ndjson')
+        response = ListView.as_view()(request).render()
+        assert response['Content-Type'] == 'application/x-ndjson'
+        assert response.content == b'{"a":1}\n{"a":2}\n'
+
+    def test_render_paginated_response(self):
+        class ItemSerializer(serializers.Serializer):
+            name = serializers.CharField()
+
+        class Pagination(PageNumberPagination):
+            page_size = 2
+
+        class ItemListView(generics.ListAPIView):
+            queryset = [{'name': 'item-%d' % index} for index in range(3)]
+            serializer_class = ItemSerializer
+            pagination_class = Pagination
+            renderer_classes = (NDJSONRenderer,)
+
+        response = ItemListView.as_view()(APIRequestFactory().get('/')).render()
+        assert response.content == b'{"name":"item-0"}\n{"name":"item-1"}\n'
+
+    def test_streamed_export(self):
+        class ItemSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = DummyTestModel
+                fields = ['name']
+
+        for name in ['one', 'two']:
+            DummyTestModel.objects.create(name=name)
+
+        class ExportView(APIView):
+            renderer_classes = (NDJSONRenderer,)
+
+            def get(self, request, *args, **kwargs):
+                serializer = ItemSerializer(many=True)
+                rows = serializer.iter_representation(DummyTestModel.objects.order_by('pk'))
+                return StreamingHttpResponse(
+                    NDJSONRenderer().render_lines(rows), content_type=NDJSONRenderer.media_type
+                )
+
+        response = ExportView.as_view()(APIRequestFactory().get('/'))
+        assert b''.join(response.streaming_content) == b'{"name":"one"}\n{"name":"two"}\n'
+
+
+class BinaryRendererData:
+    def get_data(self):
+        return {
+            'decimal': Decimal('1.50'),
+            'datetime': datetime(2024, 1, 2, 3, 4, 5, tzinfo=ZoneInfo('UTC')),
+            'uuid': UUID('12345678-1234-5678-1234-567812345678'),
+            'duration': timedelta(seconds=90),
+            'lazy': _('lazy string'),
+            'generator': (value for value in [1, 2]),
+            'bytes': b'\x00\xff',
+            'list': [1, 2.5, None, True, 'caf\xe9'],
+        }
+
+
+@pytest.mark.skipif(msgpack is None, reason='msgpack is required.')
+class MessagePackRendererTests(BinaryRendererData, TestCase):
+    def test_render(self):
+        content = MessagePackRenderer().render(self.get_data())
+        data = msgpack.unpackb(content)
+
+        assert data == {
+            'decimal': 1.5,
+            'datetime': '2024-01-02T03:04:05Z',
+            'uuid': '12345678-1234-5678-1234-567812345678',
+            'duration': '90.0',
+            'lazy': 'lazy string',
+            'generator': [1, 2],
+            'bytes': b'\x00\xff',
+            'list': [1, 2.5, None, True, 'caf\xe9'],
+        }
+
+    def test_render_none(self):
+        assert MessagePackRenderer().render(None) == b''
+
+    def test_negotiation(self):
+        class View(APIView):
+            renderer_classes = (JSONRenderer, MessagePackRenderer)
+
+            def get(self, request, *args, **kwargs):
+                return Response({'a': [1, 2]})
+
+        for request in [
+            APIRequestFactory().get('/', HTTP_ACCEPT='application/msgpack'),
+            APIRequestFactory().get('/', {'format': 'msgpack'}),
+        ]:
+            response = View.as_view()(request).render()
+            assert response['Content-Type'] == 'application/msgpack'
+            assert msgpack.unpackb(response.content) == {'a': [1, 2]}
+
+
+@pytest.mark.skipif(cbor2 is None, reason='cbor2 is required.')
+class CBORRendererTests(BinaryRendererData, TestCase):
+    def test_render(self):
+        content = CBORRenderer().render(self.get_data())
+        data = cbor2.loads(content)
+
+        assert data == {
+            'decimal': Decimal('1.50'),
+            'datetime': datetime(2024, 1, 2, 3, 4, 5, tzinfo=ZoneInfo('UTC')),
+            'uuid': UUID('12345678-1234-5678-1234-567812345678'),
+            'duration': '90.0',
+            'lazy': 'lazy string',
+            'generator': [1, 2],
+            'bytes': b'\x00\xff',
+            'list': [1, 2.5, None, True, 'caf\xe9'],
+        }
+
+    @override_settings(TIME_ZONE='UTC')
+    def test_render_naive_datetime(self):
+        content = CBORRenderer().render([datetime(2024, 1, 2)])
+        assert cbor2.loads(content) == [datetime(2024, 1, 2, tzinfo=ZoneInfo('UTC'))]
+
+    def test_negotiation(self):
+        class View(APIView):
+            renderer_classes = (JSONRenderer, CBORRenderer)
+
+            def get(self, request, *args, **kwargs):
+                return Response({'a': [1, 2]})
+
+        for request in [
+            APIRequestFactory().get('/', HTTP_ACCEPT='application/cbor'),
+            APIRequestFactory().get('/', {'format': 'cbor'}),
+        ]:
+            response = View.as_view()(request).render()
+            assert response['Content-Type'] == 'application/cbor'
+            assert cbor2.loads(response.content) == {'a': [1, 2]}
+
+
+class ColumnarSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    ratio = serializers.FloatField(allow_null=True)
+    price = serializers.DecimalField(max_digits=5, decimal_places=2)
+    created = serializers.DateTimeField()
+    day = serializers.DateField()
+    active = serializers.BooleanField()
+    name = serializers.CharField()
+    tags = serializers.ListField(child=serializers.CharField())
+    secret = serializers.CharField(write_only=True)
+
+
+class ColumnarRendererData:
+    def get_data(self):
+        rows = [
+            {
+                'id': index,
+                'ratio': None if index == 2 else index / 2,
+                'price': Decimal('1.50') * index,
+                'created': datetime(2024, 1, 2, 3, 4, 5, tzinfo=ZoneInfo('UTC')),
+                'day': datetime(2024, 1, 2).date(),
+                'active': index % 2 == 0,
+                'name': 'caf\xe9, %d' % index,
+                'tags': ['a', 'b'],
+                'secret': 'hidden',
+            }
+            for index in range(1, 4)
+        ]
+        return ColumnarSerializer(rows, many=True).data
+
+
+class CSVRendererTests(ColumnarRendererData, TestCase):
+    @override_settings(TIME_ZONE='UTC')
+    def test_render_serializer_data(self):
+        content = CSVRenderer().render(self.get_data())
+        assert content.decode().splitlines() == [
+            'id,ratio,price,created,day,active,name,tags',
+            '1,0.5,1.50,2024-01-02T03:04:05Z,2024-01-02,False,"caf\xe9, 1","[""a"",""b""]"',
+            '2,,3.00,2024-01-02T03:04:05Z,2024-01-02,True,"caf\xe9, 2","[""a"",""b""]"',
+            '3,1.5,4.50,2024-01-02T03:04:05Z,2024-01-02,False,"caf\xe9, 3","[""a"",""b""]"',
+        ]
+
+    def test_render_plain_data(self):
+        assert CSVRenderer().render([{'a': 1, 'b': 2}, {'a': 3}]) == b'a,b\r\n1,2\r\n3,\r\n'
+        assert CSVRenderer().render({'detail': 'Not found.'}) == b'detail\r\nNot found.\r\n'
+        assert CSVRenderer().render(None) == b''
+
+    def test_render_batches(self):
+        renderer = CSVRenderer()
+        renderer.batch_size = 2
+        chunks = list(renderer.render_batches(iter([{'a': 1}, {'a': 2}, {'a': 3}])))
+        assert chunks == [b'a\r\n1\r\n2\r\n', b'3\r\n', b'']
+
+    def test_render_empty_list_writes_header(self):
+        data = ColumnarSerializer([], many=True).data
+        assert CSVRenderer().render(data) == b'id,ratio,price,created,day,active,name,tags\r\n'
+
+    def test_render_paginated_response(self):
+        class ItemSerializer(serializers.Serializer):
+            name = serializers.CharField()
+
+        class Pagination(PageNumberPagination):
+            page_size = 2
+
+        class ItemListView(generics.ListAPIView):
+            queryset = [{'name': 'item-%d' % index} for index in range(3)]
+            serializer_class = ItemSerializer
+            pagination_class = Pagination
+            renderer_classes = (CSVRenderer,)
+
+        response = ItemListView.as_view()(APIRequestFactory().get('/', {'page': 2})).render()
+        assert response.content == b'name\r\nitem-2\r\n'
+
+    def test_formulas_are_escaped(self):
+        rows = [{'a': '=HYPERLINK("http://example.com")', 'b': '-1.50', 'c': '@SUM(A1)', 'd': -2}]
+        assert CSVRenderer().render(rows) == (
+            b'a,b,c,d\r\n"\'=HYPERLINK(""http://example.com"")",-1.50,\'@SUM(A1),-2\r\n'
+        )
+
+
+@pytest.mark.skipif(pyarrow is None, reason='pyarrow is required.')
+class ArrowRendererTests(ColumnarRendererData, TestCase):
+    def read(self, content):
+        return pyarrow.ipc.open_stream(content).read_all()
+
+    def test_column_types(self):
+        table = self.read(ArrowRenderer().render(self.get_data()))
+        assert table.schema == pyarrow.schema([
+            ('id', pyarrow.int64()),
+            ('ratio', pyarrow.float64()),
+            ('price', pyarrow.decimal128(5, 2)),
+            ('created', pyarrow.timestamp('us', tz='UTC')),
+            ('day', pyarrow.date32()),
+            ('active', pyarrow.bool_()),
+            ('name', pyarrow.string()),
+            ('tags', pyarrow.string()),
+        ])
+        assert table.to_pylist()[1] == {
+            'id': 2,
+            'ratio': None,
+            'price': Decimal('3.00'),
+            'created': datetime(2024, 1, 2, 3, 4, 5, tzinfo=ZoneInfo('UTC')),
+            'day': datetime(2024, 1, 2).date(),
+            'active': True,
+            'name': 'caf\xe9, 2',
+            'tags': '["a","b"]',
+        }
+
+    def test_large_integers(self):
+        class CountSerializer(serializers.Serializer):
+            small = serializers.IntegerField(min_value=0, max_value=10)
+            large = serializers.IntegerField()
+            huge = serializers.IntegerField()
+
+        data = CountSerializer([{'small': 1, 'large': 2 ** 70, 'huge': 10 ** 40}], many=True).data
+        table = self.read(ArrowRenderer().render(data))
+        assert table.schema == pyarrow.schema([
+            ('small', pyarrow.int64()),
+            ('large', pyarrow.decimal128(38, 0)),
+            ('huge', pyarrow.string()),
+        ])
+        assert table.to_pylist() == [{'small': 1, 'large': Decimal(2 ** 70), 'huge': str(10 ** 40)}]
+
+    def test_custom_datetime_format_is_string(self):
+        class EventSerializer(serializers.Serializer):
+            created = serializers.DateTimeField(format='%d/%m/%Y')
+
+        data = EventSerializer([{'created': datetime(2024, 1, 2)}], many=True).data
+        table = self.read(ArrowRenderer().render(data))
+        assert table.schema.field('created').type == pyarrow.string()
+        assert table.column('created').to_pylist() == ['02/01/2024']
+
+    def test_record_batches(self):
+        renderer = ArrowRenderer()
+        renderer.batch_size = 2
+        chunks = list(renderer.render_batches(self.get_data(), ColumnarSerializer(many=True)))
+        table = self.read(b''.join(chunks))
+        assert [batch.num_rows for batch in table.to_batches()] == [2, 1]
+        assert table.column('id').to_pylist() == [1, 2, 3]
+
+    def test_render_plain_data(self):
+        table = self.read(ArrowRenderer().render([{'a': 1, 'b': 'x'}, {'a': 2}]))
+        assert table.schema == pyarrow.schema([('a', pyarrow.string()), ('b', pyarrow.string())])
+        assert table.to_pylist() == [{'a': '1', 'b': 'x'}, {'a': '2', 'b': None}]
+
+    def test_negotiation(self):
+        class View(APIView):
+            renderer_classes = (JSONRenderer, ArrowRenderer)
+
+            def get(self, request, *args, **kwargs):
+                return Response([{'a': 1}])
+
+        request = APIRequestFactory().get('/', {'format': 'arrow'})
+        response = View.as_view()(request).render()
+        assert response['Content-Type'] == 'application/vnd.apache.arrow.stream'
+        assert self.read(response.content).to_pylist() == [{'a': '1'}]
+
+
 class UnicodeJSONRendererTests(TestCase):
     """
     Tests specific for the Unicode JSON Renderer
@@ -608,6 +934,44 @@ class TestHTMLFormRenderer(TestCase):
 
         self.assertIsInstance(result, SafeText)
 
+    def test_templates_are_loaded_once(self):
+        class StyledSerializer(serializers.Serializer):
+            first = serializers.CharField()
+            second = serializers.CharField()
+            password = serializers.CharField(style={'input_type': 'password'})
+
+        serializer = StyledSerializer(data={})
+        serializer.is_valid()
+        clear_form_renderer_cache()
+
+        with mock.patch.object(renderers.loader, 'get_template', autospec=True,
+                               side_effect=renderers.loader.get_template) as get_template:
+            first = HTMLFormRenderer().render(serializer.data)
+            second = HTMLFormRenderer().render(serializer.data)
+
+        assert first == second
+        assert 'type="password"' in first
+        # The form template, and the input template shared by all fields.
+        assert get_template.call_count == 2
+
+    def test_unhashable_field_style(self):
+        class StyledSerializer(serializers.Serializer):
+            test_field = serializers.CharField(style={'input_type': 'email', 'classes': ['a']})
+
+        serializer = StyledSerializer(data={})
+        serializer.is_valid()
+
+        rendered = self.renderer.render_field(serializer['test_field'], {})
+        assert 'type="email"' in rendered
+
+    def test_cache_is_cleared_when_settings_change(self):
+        self.serializer.is_valid()
+        self.renderer.render(self.serializer.data)
+        assert HTMLFormRenderer._templates
+
+        with override_settings(TEMPLATES=[]):
+            assert not HTMLFormRenderer._templates
+
 
 class TestChoiceFieldHTMLFormRenderer(TestCase):
     """
@@ -696,6 +1060,50 @@ class TestMultipleChoiceFieldHTMLFormRenderer(TestCase):
         self.assertInHTML('<option value="2">Option2</option>', result)
 
 
+class TestManyRelatedFieldHTMLFormRenderer(TestCase):
+    """
+    Test rendering a ManyRelatedField with HTMLFormRenderer.
+    """
+
+    def setUp(self):
+        self.renderer = HTMLFormRenderer()
+        DummyTestModel.objects.bulk_create(
+            DummyTestModel(name='item-%d' % idx) for idx in range(5)
+        )
+
+    def test_render_only_fetches_cutoff_options(self):
+        class TestSerializer(serializers.Serializer):
+            test_field = serializers.PrimaryKeyRelatedField(
+                queryset=DummyTestModel.objects.order_by('pk'),
+                many=True,
+                html_cutoff=2,
+                html_cutoff_text='More than {count} items'
+            )
+
+        serializer = TestSerializer(data={'test_field': []})
+        serializer.is_valid()
+
+        with self.assertNumQueries(1):
+            result = self.renderer.render(serializer.data)
+
+        assert result.count('<option') == 3
+        self.assertInHTML('<option value="n/a" disabled>More than 2 items</option>', result)
+        assert 'disabled class="form-control"' not in result
+
+    def test_render_without_options(self):
+        class TestSerializer(serializers.Serializer):
+            test_field = serializers.PrimaryKeyRelatedField(
+                queryset=DummyTestModel.objects.none(), many=True
+            )
+
+        serializer = TestSerializer(data={'test_field': []})
+        serializer.is_valid()
+        result = self.renderer.render(serializer.data)
+
+        assert 'disabled class="form-control"' in result
+        self.assertInHTML('<option>No items to select.</option>', result)
+
+
 class StaticHTMLRendererTests(TestCase):
     """
     Tests specific for Static HTML Renderer
@@ -4,6 +4,7 @@ Tests for content parsing, and form-overloaded content parsing.
 import copy
 import os.path
 import tempfile
+from unittest import mock
 
 import pytest
 from django.contrib.auth import authenticate, login, logout
@@ -20,9 +21,11 @@ from rest_framework.authentication import SessionAuthentication
 from rest_framework.parsers import (
     BaseParser, FormParser, JSONParser, MultiPartParser
 )
+from rest_framework.permissions import BasePermission, IsAuthenticated
 from rest_framework.request import Request, WrappedAttributeError
 from rest_framework.response import Response
 from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework.throttling import BaseThrottle
 from rest_framework.views import APIView
 
 factory = APIRequestFactory()
@@ -107,6 +110,22 @@ class TestContentParsing(TestCase):
         assert list(request.POST) == []
         assert list(request.FILES) == ['upload']
 
+    def test_request_data_with_files_is_a_copy(self):
+        """
+        Ensure request.data merges files into a mutable copy of the form data,
+        leaving request.POST unchanged.
+        """
+        upload = SimpleUploadedFile("file.txt", b"file_content")
+        request = Request(factory.post('/', {'name': ['a', 'b'], 'upload': upload}))
+        request.parsers = (FormParser(), MultiPartParser())
+        assert request.data.getlist('name') == ['a', 'b']
+        assert request.data['upload'].read() == b"file_content"
+
+        request.data.appendlist('name', 'c')
+        assert request.data.getlist('name') == ['a', 'b', 'c']
+        assert request.POST.getlist('name') == ['a', 'b']
+        assert 'upload' not in request.POST
+
     def test_standard_behaviour_determines_form_content_PUT(self):
         """
         Ensure request.data returns content for PUT request with form content.
@@ -147,6 +166,52 @@ class TestContentParsing(TestCase):
             request.data
 
 
+class UnparsedBodyView(APIView):
+    authentication_classes = (SessionAuthentication,)
+    parser_classes = (JSONParser,)
+
+    def post(self, request):
+        return Response(request.data)
+
+
+class TestRejectedRequestsAreNotParsed(TestCase):
+    """
+    Requests that fail authentication, permission or throttling checks should
+    be rejected without parsing the body.
+    """
+    def post(self, view):
+        request = factory.post('/', b'{not json', content_type='application/json')
+        with mock.patch.object(JSONParser, 'parse_bytes', autospec=True) as parse_bytes:
+            response = view(request)
+        assert not parse_bytes.called
+        return response
+
+    def test_not_authenticated(self):
+        view = UnparsedBodyView.as_view(permission_classes=(IsAuthenticated,))
+        assert self.post(view).status_code == status.HTTP_403_FORBIDDEN
+
+    def test_permission_denied(self):
+        class DenyAll(BasePermission):
+            def has_permission(self, request, view):
+                return False
+
+        view = UnparsedBodyView.as_view(permission_classes=(DenyAll,))
+        assert self.post(view).status_code == status.HTTP_403_FORBIDDEN
+
+    def test_throttled(self):
+        class NoRequestsThrottle(BaseThrottle):
+            def allow_request(self, request, view):
+                return False
+
+        view = UnparsedBodyView.as_view(throttle_classes=(NoRequestsThrottle,))
+        assert self.post(view).status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_accepted_request_is_parsed(self):
+        request = factory.post('/', b'{not json', content_type='application/json')
+        response = UnparsedBodyView.as_view(permission_classes=())(request)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 class TestDataUploadMaxMemorySize(TestCase):
     expected_message = 'Request body exceeded settings.DATA_UPLOAD_MAX_MEMORY_SIZE.'
 
@@ -5,6 +5,7 @@ from django.core.exceptions import ImproperlyConfigured
 from django.db import models
 from django.test import TestCase, override_settings
 from django.urls import include, path, resolve, reverse
+from django.urls.resolvers import RegexPattern, RoutePattern
 
 from rest_framework import permissions, serializers, viewsets
 from rest_framework.decorators import action
@@ -13,6 +14,7 @@ from rest_framework.routers import DefaultRouter, SimpleRouter
 from rest_framework.test import (
     APIClient, APIRequestFactory, URLPatternsTestCase
 )
+from rest_framework.urlpatterns import get_literal_prefix
 from rest_framework.utils import json
 
 factory = APIRequestFactory()
@@ -611,6 +613,54 @@ class TestViewInitkwargs(URLPatternsTestCase, TestCase):
         assert initkwargs['basename'] == 'routertestmodel'
 
 
+class TestTrieDispatch(URLPatternsTestCase, TestCase):
+    regex_router = DefaultRouter(use_trie_dispatch=True)
+    regex_router.register('basics', BasicViewSet, basename='basic')
+    regex_router.register('notes', NoteViewSet)
+
+    path_router = DefaultRouter(use_regex_path=False, use_trie_dispatch=True)
+    path_router.root_view_name = 'path-api-root'
+    path_router.register('basics', BasicViewSet, basename='path-basic')
+
+    urlpatterns = [
+        path('api/', include(regex_router.urls)),
+        path('path-api/', include(path_router.urls)),
+    ]
+
+    def test_single_url_pattern(self):
+        assert len(self.regex_router.urls) == 1
+
+    def test_resolve(self):
+        for url, url_name, kwargs in [
+            ('/api/', 'api-root', {}),
+            ('/api/basics/', 'basic-list', {}),
+            ('/api/basics.json', 'basic-list', {'format': 'json'}),
+            ('/api/basics/1/action1/', 'basic-action1', {'pk': '1'}),
+            ('/api/notes/1.json', 'routertestmodel-detail', {'uuid': '1', 'format': 'json'}),
+            ('/path-api/basics/1/action3/', 'path-basic-action3', {'pk': '1'}),
+            ('/path-api/basics/1/action3.json/', 'path-basic-action3', {'pk': '1', 'format': 'json'}),
+        ]:
+            match = resolve(url)
+            assert (match.url_name, match.kwargs) == (url_name, kwargs)
+            assert reverse(url_name, kwargs=kwargs) == url
+
+    def test_dispatch(self):
+        response = self.client.delete('/api/basics/1/action3/')
+        assert response.data == {'delete': '1'}
+        response = self.client.get('/api/basics/1/unknown/')
+        assert response.status_code == 404
+
+    def test_literal_prefix(self):
+        for pattern, prefix in [
+            (r'^basics/(?P<pk>[^/.]+)/action1/$', ['basics']),
+            (r'^api/v1/basics\.(?P<format>[a-z0-9]+)/?$', ['api', 'v1']),
+            (r'^basics?/$', []),
+            (r'basics/$', []),
+        ]:
+            assert get_literal_prefix(RegexPattern(pattern)) == prefix
+        assert get_literal_prefix(RoutePattern('basics/<str:pk>/')) == ['basics']
+
+
 class BasenameTestCase:
     def test_conflicting_autogenerated_basenames(self):
         """
@@ -1,9 +1,22 @@
 """
 Tests to cover bulk create and update using serializers.
 """
+import datetime
+import io
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.db import models
 from django.test import TestCase
 
-from rest_framework import serializers
+from rest_framework import exceptions, generics, parsers, serializers, status
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.utils import json
+from tests.models import ManyToManySource, ManyToManyTarget
+
+factory = APIRequestFactory()
 
 
 class BulkCreateSerializerTests(TestCase):
@@ -115,3 +128,269 @@ class BulkCreateSerializerTests(TestCase):
         expected_errors = {'non_field_errors': ['Expected a list of items but got type "dict".']}
 
         assert serializer.errors == expected_errors
+
+
+class ManyToManySourceBulkSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ManyToManySource
+        fields = ('id', 'name', 'targets')
+        bulk_create = True
+
+
+class ManyToManySourceBulkUpdateSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField()
+
+    class Meta:
+        model = ManyToManySource
+        fields = ('id', 'name', 'targets')
+        bulk_update = True
+
+
+class TimestampedModel(models.Model):
+    name = models.CharField(max_length=100)
+    modified = models.DateTimeField(auto_now=True)
+
+
+class TimestampedBulkUpdateSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField()
+
+    class Meta:
+        model = TimestampedModel
+        fields = ('id', 'name')
+        bulk_update = True
+
+
+class ModelBulkWriteTests(TestCase):
+    """
+    Creating and updating multiple model instances in bulk.
+    """
+
+    def setUp(self):
+        self.targets = [ManyToManyTarget.objects.create(name='target-%d' % idx) for idx in range(3)]
+
+    def test_bulk_create(self):
+        data = [
+            {'name': 'source-%d' % idx, 'targets': [target.pk for target in self.targets[:idx + 1]]}
+            for idx in range(3)
+        ]
+        serializer = ManyToManySourceBulkSerializer(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+        # One insert for the sources and another for the many-to-many rows,
+        # within a savepoint.
+        with self.assertNumQueries(4):
+            serializer.save()
+
+        assert [
+            (source.name, sorted(target.name for target in source.targets.all()))
+            for source in ManyToManySource.objects.order_by('name')
+        ] == [
+            ('source-0', ['target-0']),
+            ('source-1', ['target-0', 'target-1']),
+            ('source-2', ['target-0', 'target-1', 'target-2']),
+        ]
+        assert [item['name'] for item in serializer.data] == ['source-0', 'source-1', 'source-2']
+
+    def test_bulk_create_with_reverse_relation(self):
+        class GroupBulkSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = Group
+                fields = ('name', 'user_set')
+                bulk_create = True
+
+        users = [User.objects.create(username='user-%d' % idx) for idx in range(2)]
+        data = [
+            {'name': 'group-%d' % idx, 'user_set': [user.pk for user in users[:idx + 1]]}
+            for idx in range(2)
+        ]
+        serializer = GroupBulkSerializer(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+        serializer.save()
+
+        assert [
+            (group.name, sorted(user.username for user in group.user_set.all()))
+            for group in Group.objects.order_by('name')
+        ] == [
+            ('group-0', ['user-0']),
+            ('group-1', ['user-0', 'user-1']),
+        ]
+
+    def test_bulk_create_without_opt_in(self):
+        class Serializer(ManyToManySourceBulkSerializer):
+            class Meta(ManyToManySourceBulkSerializer.Meta):
+                bulk_create = False
+
+        serializer = Serializer(data=[{'name': 'source', 'targets': [self.targets[0].pk]}] * 3, many=True)
+        assert serializer.is_valid(), serializer.errors
+        with mock.patch.object(serializers.ListSerializer, 'bulk_create') as bulk_create:
+            serializer.save()
+        bulk_create.assert_not_called()
+        assert ManyToManySource.objects.count() == 3
+
+    def test_bulk_update(self):
+        sources = [ManyToManySource.objects.create(name='source-%d' % idx) for idx in range(3)]
+        sources[0].targets.set(self.targets)
+
+        data = [
+            {'id': sources[0].pk, 'name': 'renamed', 'targets': [self.targets[2].pk]},
+            {'id': sources[2].pk, 'name': 'source-2', 'targets': [self.targets[0].pk]},
+        ]
+        serializer = ManyToManySourceBulkUpdateSerializer(ManyToManySource.objects.all(), data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+        instances = serializer.save()
+
+        assert [instance.pk for instance in instances] == [sources[0].pk, sources[2].pk]
+        assert [
+            (source.name, [target.name for target in source.targets.order_by('name')])
+            for source in ManyToManySource.objects.order_by('pk')
+        ] == [
+            ('renamed', ['target-2']),
+            ('source-1', []),
+            ('source-2', ['target-0']),
+        ]
+
+    def test_bulk_update_only_fetches_submitted_instances(self):
+        sources = [ManyToManySource.objects.create(name='source-%d' % idx) for idx in range(3)]
+        data = [{'id': sources[1].pk, 'name': 'renamed', 'targets': [self.targets[0].pk]}]
+        serializer = ManyToManySourceBulkUpdateSerializer(ManyToManySource.objects.all(), data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+        assert list(serializer._instance_map) == [str(sources[1].pk)]
+
+    def test_bulk_update_is_atomic(self):
+        source = ManyToManySource.objects.create(name='source')
+        source.targets.set(self.targets)
+        data = [{'id': source.pk, 'name': 'renamed', 'targets': [self.targets[0].pk]}]
+        serializer = ManyToManySourceBulkUpdateSerializer(ManyToManySource.objects.all(), data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+
+        with mock.patch.object(
+            ManyToManySource.targets.through._default_manager, 'bulk_create', side_effect=RuntimeError
+        ):
+            with pytest.raises(RuntimeError):
+                serializer.save()
+
+        source.refresh_from_db()
+        assert source.name == 'source'
+        assert source.targets.count() == 3
+
+    def test_bulk_update_sets_auto_now_fields(self):
+        instance = TimestampedModel.objects.create(name='timestamped')
+        modified = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+        TimestampedModel.objects.update(modified=modified)
+
+        data = [{'id': instance.pk, 'name': 'renamed'}]
+        serializer = TimestampedBulkUpdateSerializer(TimestampedModel.objects.all(), data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+        serializer.save()
+
+        instance.refresh_from_db()
+        assert instance.name == 'renamed'
+        assert instance.modified > modified
+
+    def test_bulk_update_unknown_instance(self):
+        source = ManyToManySource.objects.create(name='source')
+        data = [
+            {'id': source.pk, 'name': 'renamed', 'targets': [self.targets[0].pk]},
+            {'id': 999, 'name': 'missing', 'targets': [self.targets[0].pk]},
+            {'name': 'no-id', 'targets': [self.targets[0].pk]},
+        ]
+        serializer = ManyToManySourceBulkUpdateSerializer(ManyToManySource.objects.all(), data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == {
+            1: {'id': ['Invalid id "999" - object does not exist.']},
+            2: {'id': ['This field is required.']},
+        }
+
+    def test_create_view_accepts_list_for_bulk_create(self):
+        class BulkCreateView(generics.CreateAPIView):
+            serializer_class = ManyToManySourceBulkSerializer
+
+        data = [{'name': 'one', 'targets': [self.targets[1].pk]}, {'name': 'two', 'targets': [self.targets[0].pk]}]
+        request = factory.post('/', data, format='json')
+        response = BulkCreateView.as_view()(request)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [item['name'] for item in response.data] == ['one', 'two']
+        assert ManyToManySource.objects.count() == 2
+
+    def test_create_view_rejects_list_without_bulk_create(self):
+        class CreateView(generics.CreateAPIView):
+            serializer_class = ManyToManySourceBulkUpdateSerializer
+
+        request = factory.post('/', [{'name': 'one', 'targets': [self.targets[0].pk]}], format='json')
+        response = CreateView.as_view()(request)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class SaveInBatchesTests(TestCase):
+    """
+    Validating and creating the items of large payloads a batch at a time.
+    """
+
+    def setUp(self):
+        self.target = ManyToManyTarget.objects.create(name='target')
+
+    def get_items(self, count, invalid=()):
+        for idx in range(count):
+            if idx in invalid:
+                yield {'targets': [self.target.pk]}
+            else:
+                yield {'name': 'source-%d' % idx, 'targets': [self.target.pk]}
+
+    def test_save_in_batches(self):
+        serializer = ManyToManySourceBulkSerializer(data=self.get_items(5, invalid=[3]), many=True)
+        with mock.patch.object(serializers.ListSerializer, 'create', autospec=True,
+                               side_effect=serializers.ListSerializer.create) as create:
+            assert serializer.save_in_batches(batch_size=2) == 4
+
+        assert [len(call.args[1]) for call in create.call_args_list] == [2, 1, 1]
+        assert serializer.errors == {3: {'name': ['This field is required.']}}
+        assert list(ManyToManySource.objects.order_by('pk').values_list('name', flat=True)) == [
+            'source-0', 'source-1', 'source-2', 'source-4'
+        ]
+        assert ManyToManySource.objects.filter(targets=self.target).count() == 4
+
+    def test_save_in_batches_raise_exception(self):
+        serializer = ManyToManySourceBulkSerializer(data=self.get_items(3, invalid=[0]), many=True)
+        with pytest.raises(serializers.ValidationError) as excinfo:
+            serializer.save_in_batches(raise_exception=True)
+        assert excinfo.value.detail == {0: {'name': ['This field is required.']}}
+
+    def test_save_in_batches_max_length(self):
+        serializer = ManyToManySourceBulkSerializer(data=self.get_items(5), many=True, max_length=3)
+        assert serializer.save_in_batches(batch_size=2) == 2
+        assert serializer.errors == {
+            'non_field_errors': ['Ensure this field has no more than 3 elements.']
+        }
+
+    def test_save_in_batches_not_a_list(self):
+        serializer = ManyToManySourceBulkSerializer(data={'name': 'source'}, many=True)
+        assert serializer.save_in_batches() == 0
+        assert serializer.errors == {
+            'non_field_errors': ['Expected a list of items but got type "dict".']
+        }
+
+    def test_save_streamed_request_in_batches_stops_at_invalid_json(self):
+        items = [json.dumps(item) for item in self.get_items(6)]
+        items[3] = '{"name": "source-3", "targets": [%d' % self.target.pk
+        stream = io.BytesIO(('[' + ', '.join(items) + ']').encode())
+        data = parsers.JSONStreamParser().parse(stream, None, {})
+        serializer = ManyToManySourceBulkSerializer(data=data, many=True)
+
+        with pytest.raises(exceptions.ParseError):
+            serializer.save_in_batches(batch_size=2)
+        assert list(ManyToManySource.objects.values_list('name', flat=True)) == ['source-0', 'source-1']
+
+    def test_save_streamed_request_in_batches(self):
+        class StreamingCreateView(generics.GenericAPIView):
+            serializer_class = ManyToManySourceBulkSerializer
+            parser_classes = [parsers.JSONStreamParser]
+
+            def post(self, request):
+                serializer = self.get_serializer(data=request.data, many=True)
+                saved = serializer.save_in_batches(batch_size=2, raise_exception=True)
+                return Response({'saved': saved}, status=status.HTTP_201_CREATED)
+
+        request = factory.post('/', list(self.get_items(3)), format='json')
+        response = StreamingCreateView.as_view()(request)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data == {'saved': 3}
+        assert ManyToManySource.objects.count() == 3
@@ -1,3 +1,6 @@
+import datetime
+from unittest import mock
+
 import pytest
 from django.http import QueryDict
 from django.utils.datastructures import MultiValueDict
@@ -960,3 +963,65 @@ class TestListSerializerDictErrorBehavior:
 
         assert errors["list_field"][1] == [ErrorDetail(string='This dictionary may not be empty.', code='empty')]
         assert errors["list_field"][3] == [ErrorDetail(string='This dictionary may not be empty.', code='empty')]
+
+
+class TestColumnarRepresentation:
+    """
+    Tests for representing the items of a list a column at a time.
+    """
+    def setup_method(self):
+        class EventSerializer(serializers.Serializer):
+            name = serializers.CharField()
+            start = serializers.DateTimeField(default_timezone=datetime.timezone.utc)
+            day = serializers.DateField()
+            note = serializers.CharField(source='details.note', allow_null=True)
+            secret = serializers.CharField(write_only=True)
+
+        class ColumnarEventSerializer(EventSerializer):
+            class Meta:
+                columnar_representation = True
+
+        self.Serializer = EventSerializer
+        self.ColumnarSerializer = ColumnarEventSerializer
+        self.instances = [
+            BasicObject(
+                name='launch', start=datetime.datetime(2024, 1, 2, 3, 4, 5),
+                day=datetime.date(2024, 1, 2), details=BasicObject(note='first'), secret='x'
+            ),
+            BasicObject(name='review', start=None, day=None, details=None, secret='y'),
+        ]
+
+    def test_same_representation_as_rows(self):
+        expected = [
+            {'name': 'launch', 'start': '2024-01-02T03:04:05Z', 'day': '2024-01-02', 'note': 'first'},
+            {'name': 'review', 'start': None, 'day': None, 'note': None},
+        ]
+        assert self.Serializer(self.instances, many=True).data == expected
+        assert self.ColumnarSerializer(self.instances, many=True).data == expected
+        assert list(self.ColumnarSerializer(many=True).iter_representation(self.instances, chunk_size=1)) == expected
+
+    def test_each_column_is_represented_once(self):
+        serializer = self.ColumnarSerializer(self.instances, many=True)
+        start = serializer.child.fields['start']
+        with mock.patch.object(start, 'to_representation_column', wraps=start.to_representation_column) as column:
+            serializer.data
+        column.assert_called_once_with([datetime.datetime(2024, 1, 2, 3, 4, 5)])
+
+    def test_skipped_fields_are_omitted(self):
+        class PartialSerializer(serializers.Serializer):
+            name = serializers.CharField()
+            size = serializers.IntegerField(required=False)
+
+            class Meta:
+                columnar_representation = True
+
+        data = PartialSerializer([{'name': 'a', 'size': 1}, {'name': 'b'}], many=True).data
+        assert data == [{'name': 'a', 'size': 1}, {'name': 'b'}]
+
+    def test_custom_to_representation_is_used(self):
+        class UpperSerializer(self.ColumnarSerializer):
+            def to_representation(self, instance):
+                return {'name': instance.name.upper()}
+
+        data = UpperSerializer(self.instances, many=True).data
+        assert data == [{'name': 'LAUNCH'}, {'name': 'REVIEW'}]
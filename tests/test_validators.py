@@ -137,6 +137,71 @@ class TestUniquenessValidation(TestCase):
         serializer = UniquenessIntegerSerializer(data={'integer': 'abc'})
         assert serializer.is_valid()
 
+    def test_many_create_is_validated_in_a_single_query(self):
+        data = [{'username': 'new-%d' % idx} for idx in range(20)]
+        data[5] = {'username': 'existing'}
+        serializer = UniquenessSerializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            assert not serializer.is_valid()
+        assert serializer.errors == {
+            5: {'username': ['uniqueness model with this username already exists.']}
+        }
+
+    def test_many_create_detects_duplicates_within_the_batch(self):
+        data = [{'username': 'new'}, {'username': 'other'}, {'username': 'new'}]
+        serializer = UniquenessSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == {
+            2: {'username': ['uniqueness model with this username already exists.']}
+        }
+
+    def test_many_create_with_relation(self):
+        RelatedModel.objects.create(user=self.instance, email='existing@example.com')
+        other = UniquenessModel.objects.create(username='other')
+        data = [{'user': other.pk}, {'user': self.instance.pk}]
+        serializer = RelatedModelUserSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == {1: {'user': ['related model with this user already exists.']}}
+
+    def test_many_create_with_non_exact_lookup(self):
+        data = [
+            {'username': 'Existing', 'email': 'one@example.com'},
+            {'username': 'new-username', 'email': 'two@example.com'},
+        ]
+        serializer = RelatedModelSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == {0: {'username': ['This field must be unique.']}}
+
+    def test_many_create_reports_uniqueness_of_invalid_items(self):
+        data = [
+            {'username': 'existing', 'email': 'x' * 81},
+            {'username': 'new-username', 'email': 'one@example.com'},
+        ]
+        serializer = RelatedModelSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == {
+            0: {
+                'email': ['Ensure this field has no more than 80 characters.'],
+                'username': ['This field must be unique.'],
+            }
+        }
+
+    def test_many_update_is_not_batched(self):
+        class ListUpdateSerializer(serializers.ListSerializer):
+            def run_child_validation(self, data):
+                self.child.instance = self.instance.get(username=data['username'])
+                return super().run_child_validation(data)
+
+        class Serializer(UniquenessSerializer):
+            class Meta(UniquenessSerializer.Meta):
+                list_serializer_class = ListUpdateSerializer
+
+        serializer = Serializer(UniquenessModel.objects.all(), data=[{'username': 'existing'}], many=True)
+        assert serializer.get_batch_validators() != []
+        with patch.object(UniqueValidator, 'validate_batch') as validate_batch:
+            assert serializer.is_valid()
+        validate_batch.assert_not_called()
+
 
 # Tests for `UniqueTogetherValidator`
 # -----------------------------------
@@ -248,6 +313,52 @@ class TestUniquenessTogetherValidation(TestCase):
             'position': 1
         }
 
+    def test_many_create_is_validated_in_a_single_query(self):
+        data = [
+            {'race_name': 'example', 'position': 3},
+            {'race_name': 'other', 'position': 2},
+            {'race_name': 'example', 'position': 2},
+            {'race_name': 'other', 'position': 2},
+            {'race_name': 'example'},
+        ]
+        serializer = UniquenessTogetherSerializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            assert not serializer.is_valid()
+        assert serializer.errors == {
+            2: {'non_field_errors': ['The fields race_name, position must make a unique set.']},
+            3: {'non_field_errors': ['The fields race_name, position must make a unique set.']},
+            4: {'position': ['This field is required.']},
+        }
+
+    def test_many_create_reports_uniqueness_of_items_failing_validate(self):
+        class Serializer(UniquenessTogetherSerializer):
+            def validate(self, attrs):
+                if attrs['race_name'] == 'example':
+                    raise serializers.ValidationError('Invalid race name.')
+                return attrs
+
+        data = [
+            {'race_name': 'example', 'position': 2},
+            {'race_name': 'other', 'position': 2},
+        ]
+        serializer = Serializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            assert not serializer.is_valid()
+        assert serializer.errors == {
+            0: {'non_field_errors': [
+                'Invalid race name.',
+                'The fields race_name, position must make a unique set.',
+            ]},
+        }
+
+    def test_many_create_ignores_null_fields(self):
+        data = [
+            {'race_name': 'example', 'position': None},
+            {'race_name': 'example', 'position': None},
+        ]
+        serializer = NullUniquenessTogetherSerializer(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+
     def test_many_update_requires_child_instance(self):
         class ListUpdateSerializer(serializers.ListSerializer):
             def update(self, instance, validated_data):
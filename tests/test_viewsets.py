@@ -1,11 +1,12 @@
 from functools import wraps
+from unittest import mock
 
 import pytest
 from django.db import models
 from django.test import TestCase, override_settings
 from django.urls import include, path
 
-from rest_framework import status
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.routers import SimpleRouter
@@ -256,6 +257,22 @@ class GetExtraActionsTests(TestCase):
             'function is decorated with `functools.wraps`, or that '
             '`wrapper.__name__` is otherwise set to `wrapped_list_action`.')
 
+    def test_extra_actions_are_cached_per_class(self):
+        class CachedActionViewSet(ActionViewSet):
+            @action(detail=False)
+            def extra_list_action(self, request, *args, **kwargs):
+                raise NotImplementedError
+
+        with mock.patch.object(viewsets, 'getmembers', autospec=True,
+                               side_effect=viewsets.getmembers) as getmembers:
+            first = CachedActionViewSet.get_extra_actions()
+            second = CachedActionViewSet().get_extra_actions()
+
+        assert getmembers.call_count == 1
+        assert first == second
+        assert 'extra_list_action' in [action.__name__ for action in first]
+        assert 'extra_list_action' not in [action.__name__ for action in ActionViewSet.get_extra_actions()]
+
 
 @override_settings(ROOT_URLCONF='tests.test_viewsets')
 class GetExtraActionUrlMapTests(TestCase):
@@ -285,6 +302,46 @@ class GetExtraActionUrlMapTests(TestCase):
 
         self.assertEqual(view.get_extra_action_url_map(), expected)
 
+    def test_detail_view_urls_are_templated(self):
+        self.client.get('/api/actions/1/').view.get_extra_action_url_map()
+        view = self.client.get('/api/actions/2/').view
+
+        expected = {
+            'Custom detail action': 'http://testserver/api/actions/2/custom_detail_action/',
+            'Detail action': 'http://testserver/api/actions/2/detail_action/',
+            'Wrapped detail action': 'http://testserver/api/actions/2/wrapped_detail_action/',
+        }
+
+        with mock.patch.object(viewsets, 'reverse', autospec=True,
+                               side_effect=viewsets.reverse) as reverse:
+            self.assertEqual(view.get_extra_action_url_map(), expected)
+        assert reverse.call_count == 0
+
+    @override_settings(ALLOWED_HOSTS=['testserver', 'example.com'])
+    def test_detail_view_urls_use_the_request_host(self):
+        self.client.get('/api/actions/1/').view.get_extra_action_url_map()
+        view = self.client.get('/api/actions/2/', HTTP_HOST='example.com').view
+
+        expected = {
+            'Custom detail action': 'http://example.com/api/actions/2/custom_detail_action/',
+            'Detail action': 'http://example.com/api/actions/2/detail_action/',
+            'Wrapped detail action': 'http://example.com/api/actions/2/wrapped_detail_action/',
+        }
+
+        with mock.patch.object(viewsets, 'reverse', autospec=True,
+                               side_effect=viewsets.reverse) as reverse:
+            self.assertEqual(view.get_extra_action_url_map(), expected)
+        assert reverse.call_count == 0
+
+    def test_url_templates_cache_is_bounded(self):
+        with mock.patch.object(viewsets, 'EXTRA_ACTION_URL_CACHE_SIZE', 1):
+            self.client.get('/api/actions/1/').view.get_extra_action_url_map()
+            view = self.client.get('/api/actions/10/').view
+            view.get_extra_action_url_map()
+        templates = type(view)._extra_action_url_templates
+        assert len(templates) == 1
+        assert list(templates) == [view.get_extra_action_url_map_key()]
+
     def test_uninitialized_view(self):
         self.assertEqual(ActionViewSet().get_extra_action_url_map(), {})
 